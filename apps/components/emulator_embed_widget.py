@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/components/emulator_embed_widget.py - Version: 2
+#this belongs in apps/components/emulator_embed_widget.py - Version: 3
 # X-Seti - December01 2025 - Multi-Emulator Launcher - Embedded Emulator Display
 
 """
@@ -14,6 +14,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QWindow
 import subprocess
+import time
 from pathlib import Path
 
 ##Methods list -
@@ -35,13 +36,14 @@ from pathlib import Path
 # _create_placeholder
 # _create_popout_icon
 # _find_emulator_window
+# _finish_launch_timing
 
-class EmulatorEmbedWidget(QWidget): #vers 2
+class EmulatorEmbedWidget(QWidget): #vers 3
     """Widget that embeds external emulator windows"""
 
     window_embedded = pyqtSignal(bool)  # Emits when window embed status changes
 
-    def __init__(self, parent=None, main_window=None, include_controls=True): #vers 3
+    def __init__(self, parent=None, main_window=None, include_controls=True): #vers 4
         super().__init__(parent)
         self.main_window = main_window
         self.embedded_window = None
@@ -53,6 +55,8 @@ class EmulatorEmbedWidget(QWidget): #vers 2
         self.include_controls = include_controls  # Whether to show display mode controls
         self.embed_attempts = 0  # Track embed attempts
         self.max_embed_attempts = 3  # Maximum attempts before fallback
+        self.launch_timer = None  # LaunchTimer completed when embedding ends
+        self.embed_started = 0.0
 
         self._setup_ui()
 
@@ -228,33 +232,42 @@ class EmulatorEmbedWidget(QWidget): #vers 2
 
         return button_bar
 
-    def embed_window(self, process, skip_embed=False): #vers 2
+    def embed_window(self, process, skip_embed=False, launch_timer=None): #vers 3
         """Embed an external emulator window
 
         Args:
             process: subprocess.Popen instance of the emulator
             skip_embed: If True, skip embedding and let run standalone
+            launch_timer: LaunchTimer of this launch - the embed phase is
+                          added and the launch finished once embedding ends
         """
         self.emulator_process = process
         self.embed_attempts = 0
+        self.launch_timer = launch_timer
+        self.embed_started = time.perf_counter()
 
         if skip_embed:
             print("⚠ Embedding skipped - emulator running standalone")
             self.placeholder.setText("Emulator running in standalone window\n\n(Check your taskbar)")
+            self._finish_launch_timing(None)
             return
 
         # Wait a moment for window to appear
         QTimer.singleShot(1000, self._attempt_embed)  # Increased from 500ms to 1000ms
 
-    def _attempt_embed(self): #vers 2
+    def _attempt_embed(self): #vers 3
         """Attempt to find and embed the emulator window"""
         if not self.emulator_process:
+            self._finish_launch_timing(None)
             return
 
         self.embed_attempts += 1
 
         # Get the window ID
+        search_started = time.perf_counter()
         window_id = self._find_emulator_window()
+        if self.launch_timer:
+            self.launch_timer.add("window_search", time.perf_counter() - search_started)
 
         if window_id:
             try:
@@ -275,10 +288,13 @@ class EmulatorEmbedWidget(QWidget): #vers 2
                     self.embedded_window = container
                     self.window_embedded.emit(True)
                     print(f"✓ Embedded window ID: {window_id}")
+                    self._finish_launch_timing("embed")
                 else:
                     print(f"Failed to create QWindow from ID: {window_id}")
+                    self._finish_launch_timing("embed_failed")
             except Exception as e:
                 print(f"Error embedding window: {e}")
+                self._finish_launch_timing("embed_failed")
         else:
             # Check if we should keep trying or give up
             if self.embed_attempts < self.max_embed_attempts:
@@ -290,6 +306,21 @@ class EmulatorEmbedWidget(QWidget): #vers 2
                 print(f"⚠ Embedding failed after {self.max_embed_attempts} attempts - letting emulator run standalone")
                 self.placeholder.setText("Emulator running in standalone window\n\n(Check your taskbar)")
                 self.placeholder.show()
+                self._finish_launch_timing("embed_timeout")
+
+    def _finish_launch_timing(self, phase): #vers 1
+        """Add the time since embed_window as phase and finish the launch record
+
+        Args:
+            phase: Phase name ("embed", "embed_failed", "embed_timeout"), or None to finish
+                   without an embed phase
+        """
+        timer, self.launch_timer = self.launch_timer, None
+        if not timer:
+            return
+        if phase:
+            timer.add(phase, time.perf_counter() - self.embed_started)
+        timer.finish(True)
 
     def _find_emulator_window(self): #vers 2
         """Find the emulator window ID using xdotool
@@ -0,0 +1,182 @@
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Game List Model
+# This belongs in components/game_list_model.py - Version: 2
+"""
+Game List Model - Lazy list model for the game panel.
+Rows are exposed in batches through canFetchMore/fetchMore and icons are
+only looked up when the view asks for a visible row's decoration. With an
+ArtworkService attached, rows show a placeholder until their icon has been
+decoded in the background.
+"""
+
+##Methods list -
+# __init__
+# _on_icon_ready
+# canFetchMore
+# cancel_outside
+# clear_icons
+# data
+# fetchMore
+# find_row
+# game_at
+# rowCount
+# set_artwork_service
+# set_games
+# total_count
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class GameListModel(QAbstractListModel): #vers 2
+    """Model over a plain list of game names"""
+
+    # Rows handed to the view per fetchMore call
+    FETCH_BATCH = 500
+
+    def __init__(self, parent=None): #vers 2
+        super().__init__(parent)
+        self._games = []
+        self._loaded = 0
+        self._icons = {}
+        # game name -> row, for icons still being decoded
+        self._pending_icons = {}
+        self.artwork_loader = None
+        self.artwork_service = None
+        self.platform = None
+        self.icon_size = 64
+
+    def set_artwork_service(self, artwork_service): #vers 1
+        """Load icons through an ArtworkService instead of synchronously"""
+        self.artwork_service = artwork_service
+        if artwork_service:
+            artwork_service.icon_ready.connect(self._on_icon_ready)
+
+    def set_games(self, games, artwork_loader=None, platform=None): #vers 2
+        """Replace the game list
+
+        Args:
+            games: List of game names
+            artwork_loader: ArtworkLoader instance for thumbnails
+            platform: Platform name for artwork lookup
+        """
+        self.beginResetModel()
+        self.cancel_outside(0, -1)
+        self._games = list(games)
+        self._loaded = min(len(self._games), self.FETCH_BATCH)
+        self._icons = {}
+        self.artwork_loader = artwork_loader
+        self.platform = platform
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()): #vers 1
+        """Number of rows fetched so far"""
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def total_count(self): #vers 1
+        """Number of games, fetched or not"""
+        return len(self._games)
+
+    def canFetchMore(self, parent=QModelIndex()): #vers 1
+        """Check if more games are waiting to be fetched"""
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._games)
+
+    def fetchMore(self, parent=QModelIndex()): #vers 1
+        """Expose the next batch of games to the view"""
+        if parent.isValid():
+            return
+
+        remaining = len(self._games) - self._loaded
+        if remaining <= 0:
+            return
+
+        batch = min(remaining, self.FETCH_BATCH)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + batch - 1)
+        self._loaded += batch
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole): #vers 2
+        """Return game name, or its icon when the view paints the row"""
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+
+        row = index.row()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._games[row]
+
+        if role == Qt.ItemDataRole.DecorationRole:
+            if not self.artwork_loader or not self.platform:
+                return None
+            icon = self._icons.get(row)
+            if icon is not None:
+                return icon
+
+            game_name = self._games[row]
+            if self.artwork_service:
+                icon = self.artwork_service.request_icon(game_name, self.platform, self.icon_size)
+                if self.artwork_service.is_pending(game_name, self.platform, self.icon_size):
+                    # Placeholder for now, _on_icon_ready fills the row in
+                    self._pending_icons[game_name] = row
+                    return icon
+            else:
+                icon = self.artwork_loader.get_game_icon(game_name, self.platform, size=self.icon_size)
+            self._icons[row] = icon
+            return icon
+
+        return None
+
+    def game_at(self, row): #vers 1
+        """Get game name at row (None if out of range)"""
+        if 0 <= row < len(self._games):
+            return self._games[row]
+        return None
+
+    def find_row(self, game_name): #vers 1
+        """Find the row of a game, fetching rows up to it if needed
+
+        Returns:
+            Row number, or -1 if the game is not in the list
+        """
+        try:
+            row = self._games.index(game_name)
+        except ValueError:
+            return -1
+
+        while row >= self._loaded:
+            self.fetchMore()
+        return row
+
+    def cancel_outside(self, first, last): #vers 1
+        """Cancel icon requests for rows outside first..last (off-screen)"""
+        if not self.artwork_service:
+            self._pending_icons = {}
+            return
+
+        for game_name, row in list(self._pending_icons.items()):
+            if row < first or row > last:
+                self.artwork_service.cancel(game_name, self.platform, self.icon_size)
+                del self._pending_icons[game_name]
+
+    def _on_icon_ready(self, game_name, platform, icon): #vers 1
+        """Swap a row's placeholder for its decoded icon"""
+        if platform != self.platform:
+            return
+
+        row = self._pending_icons.pop(game_name, None)
+        if row is None or row >= self._loaded or self._games[row] != game_name:
+            return
+
+        self._icons[row] = icon
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def clear_icons(self): #vers 2
+        """Drop cached icons so visible rows look them up again"""
+        self.cancel_outside(0, -1)
+        self._icons = {}
+        if self._loaded:
+            self.dataChanged.emit(self.index(0), self.index(self._loaded - 1),
+                                  [Qt.ItemDataRole.DecorationRole])
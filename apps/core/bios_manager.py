@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
-#this belongs in apps/core/bios_manager.py - Version: 1
+#this belongs in apps/core/bios_manager.py - Version: 3
 # X-Seti - November20 2025 - Multi-Emulator Launcher - BIOS Manager
 
 """
 BIOS Manager
 Scans, identifies, and verifies BIOS files for emulator platforms
 Handles complex filenames and maps to emulator requirements
+Known dumps are identified by content hash, so renamed files still match
 """
 
 import os
-import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from .bios_verifier import BiosVerifier, compute_digests
 
 ##Methods list -
 # __init__
@@ -21,12 +22,13 @@ from typing import Dict, List, Optional, Tuple
 # verify_platform_bios
 # _calculate_md5
 # _identify_platform_from_filename
+# _identify_platform_from_hash
 # _map_bios_to_emulator_name
 # _normalize_filename
 
 ##class BiosManager -
 
-class BiosManager: #vers 1
+class BiosManager: #vers 3
     """Manages BIOS file scanning and verification"""
     
     # BIOS filename patterns for platform identification
@@ -129,20 +131,30 @@ class BiosManager: #vers 1
         }
     }
     
-    def __init__(self, base_dir: Path): #vers 1
+    def __init__(self, base_dir: Path, db_manager=None, identify_by_hash: bool = True): #vers 2
         """Initialize BIOS manager
         
         Args:
             base_dir: Base directory containing bios-roms folder
+            db_manager: Optional apps.database DatabaseManager, persists
+                        file digests between runs
+            identify_by_hash: Identify known dumps by content before
+                              falling back to filename patterns
         """
         self.base_dir = Path(base_dir)
         self.bios_dir = self.base_dir / "bios-roms"
+        self.identify_by_hash = identify_by_hash
+        
+        # Digest -> (platform, canonical name) lookups, digests cached by
+        # (path, size, mtime) so each file is hashed once
+        self.verifier = BiosVerifier(self.KNOWN_BIOS, db_manager=db_manager)
         
         # Cache for scanned BIOS files
         self.scanned_bios = {}  # {platform: [bios_files]}
         self.bios_info = {}     # {file_path: bios_info}
+        self.canonical_bios = {}  # {platform: {canonical_name_lower: file_path}}
         
-    def scan_bios_directory(self) -> Dict[str, List[Path]]: #vers 1
+    def scan_bios_directory(self) -> Dict[str, List[Path]]: #vers 2
         """Scan BIOS directory and organize by platform
         
         Returns:
@@ -155,8 +167,10 @@ class BiosManager: #vers 1
         print(f"Scanning BIOS directory: {self.bios_dir}")
         
         bios_files = {}
+        canonical_bios = {}
         
-        # Scan all files
+        # Collect candidate files
+        candidates = []
         for file_path in self.bios_dir.rglob("*"):
             if not file_path.is_file():
                 continue
@@ -166,8 +180,20 @@ class BiosManager: #vers 1
             if ext not in ['.rom', '.bin', '.img', '.zip']:
                 continue
                 
-            # Identify platform from filename
-            platform = self._identify_platform_from_filename(file_path.name)
+            candidates.append(file_path)
+            
+        # Identify known dumps by content (one hash per new/changed file)
+        identified = self.verifier.identify_files(candidates) if self.identify_by_hash else {}
+        
+        for file_path in candidates:
+            match = identified.get(str(file_path))
+            canonical_name = None
+            
+            if match:
+                platform, canonical_name = match
+            else:
+                # Identify platform from filename
+                platform = self._identify_platform_from_filename(file_path.name)
             
             if platform:
                 if platform not in bios_files:
@@ -175,17 +201,22 @@ class BiosManager: #vers 1
                     
                 bios_files[platform].append(file_path)
                 
+                if canonical_name:
+                    canonical_bios.setdefault(platform, {})[canonical_name.lower()] = file_path
+                    
                 # Store info
                 self.bios_info[str(file_path)] = {
                     "platform": platform,
                     "original_name": file_path.name,
+                    "canonical_name": canonical_name,
                     "size": file_path.stat().st_size,
-                    "extension": ext
+                    "extension": file_path.suffix.lower()
                 }
             else:
                 print(f"  Unknown BIOS file: {file_path.name}")
                 
         self.scanned_bios = bios_files
+        self.canonical_bios = canonical_bios
         
         # Print summary
         print(f"\nBIOS Files Found:")
@@ -200,7 +231,7 @@ class BiosManager: #vers 1
         
         return bios_files
         
-    def verify_platform_bios(self, platform: str, required_files: List[str] = None) -> Tuple[bool, str]: #vers 1
+    def verify_platform_bios(self, platform: str, required_files: List[str] = None) -> Tuple[bool, str]: #vers 2
         """Verify that required BIOS files exist for a platform
         
         Args:
@@ -227,8 +258,10 @@ class BiosManager: #vers 1
         if not required_files:
             return True, f"Found {len(platform_bios)} BIOS file(s) for {platform}"
             
-        # Check for required files
-        found_files = [f.name.lower() for f in platform_bios]
+        # Check for required files - files identified by hash count under
+        # their canonical name, whatever they are called on disk
+        found_files = {f.name.lower() for f in platform_bios}
+        found_files.update(self.canonical_bios.get(platform, {}))
         missing = []
         
         for required in required_files:
@@ -293,6 +326,17 @@ class BiosManager: #vers 1
                     
         return None
         
+    def _identify_platform_from_hash(self, file_path: Path) -> Optional[Tuple[str, str]]: #vers 1
+        """Identify a BIOS file by its content
+        
+        Args:
+            file_path: Path to BIOS file
+            
+        Returns:
+            Tuple of (platform, canonical filename) or None if unknown
+        """
+        return self.verifier.identify_files([file_path]).get(str(file_path))
+        
     def _normalize_filename(self, filename: str) -> str: #vers 1
         """Normalize complex BIOS filename to simple emulator name
         
@@ -337,7 +381,7 @@ class BiosManager: #vers 1
         # Default: return original name without path
         return Path(filename).stem
         
-    def _map_bios_to_emulator_name(self, platform: str, bios_path: Path) -> str: #vers 1
+    def _map_bios_to_emulator_name(self, platform: str, bios_path: Path) -> str: #vers 2
         """Map BIOS file to expected emulator filename
         
         Args:
@@ -347,6 +391,11 @@ class BiosManager: #vers 1
         Returns:
             Expected emulator filename
         """
+        # Dumps identified by hash already have their emulator name
+        info = self.bios_info.get(str(bios_path))
+        if info and info.get("canonical_name"):
+            return info["canonical_name"]
+            
         normalized = self._normalize_filename(bios_path.name)
         
         # Add appropriate extension
@@ -359,7 +408,7 @@ class BiosManager: #vers 1
         else:
             return normalized
             
-    def _calculate_md5(self, file_path: Path) -> str: #vers 1
+    def _calculate_md5(self, file_path: Path) -> str: #vers 2
         """Calculate MD5 hash of file
         
         Args:
@@ -368,13 +417,7 @@ class BiosManager: #vers 1
         Returns:
             MD5 hash as hex string
         """
-        md5_hash = hashlib.md5()
-        
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-                
-        return md5_hash.hexdigest()
+        return compute_digests(file_path)["md5"]
 
 
 def create_bios_links(bios_manager: BiosManager, target_dir: Path) -> None: #vers 1
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+#this belongs in apps/core/bios_verifier.py - Version: 2
+# X-Seti - December02 2025 - Multi-Emulator Launcher - BIOS Verifier
+
+"""
+BIOS Verifier
+Checks BIOS files against a catalogue of expected digests
+- Filename -> expected entry index (no nested loops per file)
+- Digest -> (system, canonical name) index, identifies renamed dumps
+- MD5, SHA1 and CRC32 computed together in one pass with a large buffer
+- Digests cached in the bios_files table, keyed by (path, size, mtime)
+- Optional parallel hashing for big BIOS sets
+"""
+
+import os
+import zlib
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+##Methods list -
+# __init__
+# compute_digests
+# get_digests
+# identify
+# identify_files
+# match_filename
+# verify_directory
+# verify_files
+# _build_digest_index
+# _build_name_index
+# _load_cache
+
+##class BiosVerifier -
+
+# Read size for hashing - hashlib releases the GIL on large updates,
+# so parallel hashing threads really run side by side
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def compute_digests(file_path) -> Dict[str, str]: #vers 1
+    """Compute MD5, SHA1 and CRC32 of a file in a single read
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Dict with md5, sha1 and crc32 (8 hex digits) keys
+    """
+    md5_hash = hashlib.md5()
+    sha1_hash = hashlib.sha1()
+    crc = 0
+
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            chunk = view[:count]
+            md5_hash.update(chunk)
+            sha1_hash.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+
+    return {
+        "md5": md5_hash.hexdigest(),
+        "sha1": sha1_hash.hexdigest(),
+        "crc32": f"{crc & 0xFFFFFFFF:08x}"
+    }
+
+
+class BiosVerifier: #vers 2
+    """Verifies BIOS files against expected digests"""
+
+    def __init__(self, catalogue: Dict[str, Dict[str, Dict]], db_manager=None, max_workers: int = 1): #vers 2
+        """Initialize BIOS verifier
+
+        Args:
+            catalogue: {system: {filename: {"md5"/"sha1"/"crc32"/"size": ...}}}
+            db_manager: apps.database DatabaseManager for the persistent
+                        digest cache (None keeps the cache in memory only)
+            max_workers: Files hashed in parallel (1 = serial)
+        """
+        self.catalogue = catalogue
+        self.db_manager = db_manager
+        self.max_workers = max(1, int(max_workers))
+        self.name_index = self._build_name_index(catalogue)
+        self.digest_index = self._build_digest_index(catalogue)
+
+        # path -> {size, mtime_ns, md5, sha1, crc32}
+        self.digest_cache = {}
+        self._cache_loaded = False
+
+    def _build_name_index(self, catalogue) -> Dict[str, List[tuple]]: #vers 1
+        """Build lowercase filename -> [(system, filename, expected)] index"""
+        index = {}
+        for system, bios_list in catalogue.items():
+            for bios_name, expected in bios_list.items():
+                index.setdefault(bios_name.lower(), []).append((system, bios_name, expected))
+        return index
+
+    def _build_digest_index(self, catalogue) -> Dict[str, tuple]: #vers 1
+        """Build digest -> (system, filename) index
+
+        Keys are the lowercase md5/sha1/crc32 values given in the catalogue,
+        entries without any digest are left out.
+        """
+        index = {}
+        for system, bios_list in catalogue.items():
+            for bios_name, expected in bios_list.items():
+                for key in ('md5', 'sha1', 'crc32'):
+                    digest = expected.get(key)
+                    if digest:
+                        index.setdefault(digest.lower(), (system, bios_name))
+        return index
+
+    def match_filename(self, filename: str) -> List[tuple]: #vers 1
+        """Get catalogue entries for a filename (case-insensitive)
+
+        Returns:
+            List of (system, canonical filename, expected info) tuples
+        """
+        return self.name_index.get(filename.lower(), [])
+
+    def _load_cache(self): #vers 1
+        """Load the persistent digest cache once"""
+        if self._cache_loaded:
+            return
+        if self.db_manager:
+            try:
+                self.digest_cache.update(self.db_manager.get_bios_digests())
+            except Exception as e:
+                print(f"Error loading BIOS digest cache: {e}")
+        self._cache_loaded = True
+
+    def get_digests(self, paths) -> Dict[str, Dict]: #vers 1
+        """Get digests for files, hashing only new or changed ones
+
+        Args:
+            paths: Iterable of file paths
+
+        Returns:
+            Dict of path string -> {size, mtime_ns, md5, sha1, crc32}
+            (unreadable files are left out)
+        """
+        self._load_cache()
+
+        results = {}
+        to_hash = []
+
+        for path in paths:
+            path = str(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            cached = self.digest_cache.get(path)
+            if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+                results[path] = cached
+            else:
+                to_hash.append((path, stat.st_size, stat.st_mtime_ns))
+
+        def hash_one(item):
+            path, size, mtime_ns = item
+            try:
+                digests = compute_digests(path)
+            except OSError as e:
+                print(f"Error hashing BIOS file {path}: {e}")
+                return None
+            digests.update({'path': path, 'size': size, 'mtime_ns': mtime_ns})
+            return digests
+
+        if self.max_workers > 1 and len(to_hash) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                hashed = list(pool.map(hash_one, to_hash))
+        else:
+            hashed = [hash_one(item) for item in to_hash]
+
+        new_entries = [entry for entry in hashed if entry]
+        for entry in new_entries:
+            self.digest_cache[entry['path']] = entry
+            results[entry['path']] = entry
+
+        if new_entries and self.db_manager:
+            try:
+                self.db_manager.save_bios_digests(new_entries)
+            except Exception as e:
+                print(f"Error saving BIOS digest cache: {e}")
+
+        return results
+
+    def identify(self, digests: Dict) -> Optional[tuple]: #vers 1
+        """Look up a file's digests in the catalogue
+
+        Args:
+            digests: Dict with md5, sha1 and crc32 keys
+
+        Returns:
+            (system, canonical filename) or None if the content is unknown
+        """
+        for key in ('md5', 'sha1', 'crc32'):
+            match = self.digest_index.get(digests.get(key))
+            if match:
+                return match
+        return None
+
+    def identify_files(self, paths) -> Dict[str, tuple]: #vers 1
+        """Identify files by content, whatever they are called
+
+        Each file is hashed at most once (unchanged files come from the
+        digest cache), then identified with a dict lookup.
+
+        Args:
+            paths: Iterable of file paths
+
+        Returns:
+            Dict of path string -> (system, canonical filename) for
+            recognised files
+        """
+        identified = {}
+        for path, digests in self.get_digests(paths).items():
+            match = self.identify(digests)
+            if match:
+                identified[path] = match
+        return identified
+
+    def verify_files(self, paths) -> List[Dict]: #vers 1
+        """Verify files whose names appear in the catalogue
+
+        Args:
+            paths: Iterable of file paths
+
+        Returns:
+            List of dicts with system, name, path, size, md5, sha1, crc32,
+            expected and verified keys (one per catalogue match)
+        """
+        candidates = [Path(path) for path in paths if self.match_filename(Path(path).name)]
+        digests = self.get_digests(candidates)
+
+        results = []
+        for path in candidates:
+            actual = digests.get(str(path))
+            if not actual:
+                continue
+
+            for system, bios_name, expected in self.match_filename(path.name):
+                verified = False
+                for key in ('md5', 'sha1', 'crc32'):
+                    if expected.get(key):
+                        verified = expected[key].lower() == actual[key]
+                        break
+
+                results.append({
+                    'system': system,
+                    'name': bios_name,
+                    'path': path,
+                    'size': actual['size'],
+                    'md5': actual['md5'],
+                    'sha1': actual['sha1'],
+                    'crc32': actual['crc32'],
+                    'expected': expected,
+                    'verified': verified
+                })
+
+        return results
+
+    def verify_directory(self, directory, recursive: bool = True) -> List[Dict]: #vers 1
+        """Verify every catalogued BIOS file in a directory
+
+        Args:
+            directory: BIOS directory
+            recursive: Include subdirectories
+
+        Returns:
+            Same as verify_files
+        """
+        directory = Path(directory)
+        if not directory.exists():
+            return []
+
+        if recursive:
+            paths = []
+            for root, dirs, files in os.walk(directory):
+                paths.extend(os.path.join(root, name) for name in files)
+        else:
+            paths = [entry.path for entry in os.scandir(directory) if entry.is_file()]
+
+        return self.verify_files(paths)
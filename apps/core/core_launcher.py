@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/core/core_launcher.py - Version: 6
+#this belongs in apps/core/core_launcher.py - Version: 9
 # X-Seti - December01 2025 - Multi-Emulator Launcher - Direct Core Launcher
 
 """
@@ -7,37 +7,106 @@ Direct Libretro Core Launcher
 Launches emulator cores directly without RetroArch
 Uses libretro API to load and run cores with ROMs
 NOW PREFERS LOCAL CORES FIRST + USER DISPLAY SETTINGS
+Launch plans (core, executables, BIOS dir) are resolved once per platform
+and reused until the cores/BIOS dirs, settings file or PATH change
 """
 
 import os
 import sys
 import ctypes
+import shutil
 from pathlib import Path
 from typing import Optional, Dict, Any
 import subprocess
 from ..database.database_manager import DatabaseManager
+from ..utils.launch_timing import span
 
 ##Methods list -
 # __init__
+# download_core
+# find_executable
 # get_core_path
+# get_launch_plan
+# invalidate_launch_plans
 # is_running
 # launch_game
 # launch_with_subprocess
 # normalize_platform_name
 # stop_emulation
 # update_database
+# _check_plan_stamp
 # _find_core_for_platform
 # _get_bios_path
+# _get_mel_settings
 # _load_core_library
 # _load_database_from_db
+# _refresh_database
 # _verify_bios
 
 ##class CoreLauncher -
 
-class CoreLauncher: #vers 6
+# Settings file read by MELSettingsManager (relative to the working dir)
+MEL_SETTINGS_FILE = Path("mel_settings.json")
+
+# PATH value -> {executable name: resolved path}
+_executable_cache = {}
+
+
+def find_executable(name: str) -> Optional[str]: #vers 2
+    """Resolve an executable on PATH without spawning `which`
+
+    Hits are memoized per PATH value, so a changed PATH is looked up
+    afresh. Misses are not, so an emulator installed while the launcher
+    runs is found on its next lookup.
+
+    Returns:
+        Full path of the executable, or None if not installed
+    """
+    search_path = os.environ.get("PATH", os.defpath)
+    found = _executable_cache.setdefault(search_path, {})
+    if name not in found:
+        executable = shutil.which(name, path=search_path)
+        if not executable:
+            return None
+        found[name] = executable
+    return found[name]
+
+
+class CoreLauncher: #vers 9
     """Direct libretro core launcher - PREFERS LOCAL CORES"""
 
-    def __init__(self, base_dir: Path, core_database: Dict = None, core_downloader=None, db_manager: DatabaseManager = None): #vers 4
+    # Installed standalone emulators tried when no local core is usable
+    STANDALONE_LAUNCHERS = {
+        "PlayStation 2": ["pcsx2", "pcsx2-qt"],
+        "PlayStation 1": ["duckstation-qt", "epsxe"],
+        "Nintendo 64": ["mupen64plus"],
+        "Super Nintendo": ["snes9x-gtk", "bsnes"],
+        "SNES": ["snes9x-gtk", "bsnes"],
+        "Nintendo Entertainment System": ["fceux"],
+        "NES": ["fceux"],
+        "Game Boy Advance": ["mgba-qt", "visualboyadvance"],
+        "GBA": ["mgba-qt", "visualboyadvance"],
+        "Nintendo DS": ["desmume", "melonDS"],
+        "Sega Genesis": ["kega-fusion", "blastem"],
+        "Sega Mega Drive": ["kega-fusion", "blastem"],
+        "Nintendo GameCube": ["dolphin-emu"],
+        "Nintendo Wii": ["dolphin-emu"],
+        "PSP": ["ppsspp-qt", "ppsspp"],
+        "Amiga": ["fs-uae", "amiberry", "amiberry-lite"],
+        "Atari ST": ["hatari"],
+        "Atari 2600": ["stella"],
+        "Atari 800": ["atari800"],
+        "Amstrad CPC": ["cap32", "caprice32"],
+        "BBC Micro": ["b2"],
+        "Commodore 64": ["vice"],
+        "C64": ["vice"],
+        "ZX Spectrum": ["fuse"],
+        "ZX Spectrum 128": ["fuse"],
+        "MSX": ["bluemsx", "openmsx"],
+        "MSX2": ["bluemsx", "openmsx"]
+    }
+
+    def __init__(self, base_dir: Path, core_database: Dict = None, core_downloader=None, db_manager: DatabaseManager = None): #vers 6
         """Initialize core launcher"""
         self.base_dir = Path(base_dir)
         self.cores_dir = self.base_dir / "cores"
@@ -50,8 +119,22 @@ class CoreLauncher: #vers 6
         self.current_process = None
         self.loaded_core = None
 
-        # Load database
-        self.core_database = core_database or self._load_database_from_db()
+        # Launch plan cache - platform -> plan, plus the installed core
+        # files; both dropped when _plan_stamp changes
+        self._launch_plans = {}
+        self._core_files = None
+        self._plan_stamp = None
+        self._mel_settings = None
+
+        # Load database - a table read from db_manager is refreshed when the
+        # platforms table changes, one passed in (even empty - the caller
+        # may fill a shared dict later) is kept as given
+        self._database_from_db = core_database is None
+        self._database_stamp = None
+        if self._database_from_db:
+            self._database_stamp = self.db_manager.get_platforms_stamp()
+            core_database = self._load_database_from_db()
+        self.core_database = core_database
 
         print(f"CoreLauncher initialized")
         print(f"  Cores dir: {self.cores_dir}")
@@ -85,12 +168,121 @@ class CoreLauncher: #vers 6
             return self.core_downloader.normalize_platform_name(platform)
         return platform
 
-    def update_database(self, new_database: Dict): #vers 1
+    def update_database(self, new_database: Dict): #vers 2
         """Update core database"""
         self.core_database = new_database
+        self._database_from_db = False
+        self.invalidate_launch_plans()
         print(f"Database updated: {len(self.core_database)} platforms")
 
-    def launch_game(self, platform: str, rom_path: Path, core_name: Optional[str] = None, game_config: Optional[Dict] = None) -> bool: #vers 4
+    def _refresh_database(self): #vers 1
+        """Reload the platform table from db_manager if it changed since loading"""
+        if not self._database_from_db:
+            return
+
+        try:
+            stamp = self.db_manager.get_platforms_stamp()
+        except Exception as e:
+            print(f"Error checking database: {e}")
+            return
+
+        if stamp != self._database_stamp:
+            self._database_stamp = stamp
+            self.core_database = self._load_database_from_db()
+            self.invalidate_launch_plans()
+
+    def download_core(self, core_name: str) -> bool: #vers 1
+        """Download a core with the core downloader and forget resolved plans
+
+        Returns:
+            True if the download succeeded
+        """
+        if not self.core_downloader or not hasattr(self.core_downloader, 'download_core'):
+            return False
+
+        success = self.core_downloader.download_core(core_name)
+        if success:
+            self.invalidate_launch_plans()
+        return success
+
+    def invalidate_launch_plans(self): #vers 1
+        """Forget resolved launch plans (e.g. after installing a core or emulator)"""
+        self._launch_plans.clear()
+        self._core_files = None
+        self._plan_stamp = None
+        self._mel_settings = None
+        _executable_cache.clear()
+
+    def _check_plan_stamp(self): #vers 2
+        """Drop cached plans if the cores/BIOS dirs, settings file or PATH changed"""
+        stamp = [os.environ.get("PATH", os.defpath)]
+        for path in (self.cores_dir, self.bios_dir, MEL_SETTINGS_FILE):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        stamp = tuple(stamp)
+
+        if stamp != self._plan_stamp:
+            self._launch_plans.clear()
+            self._core_files = None
+            self._mel_settings = None
+            self._plan_stamp = stamp
+            _executable_cache.clear()
+
+    def get_launch_plan(self, platform: str) -> Dict[str, Any]: #vers 2
+        """Resolve how a platform is launched (cached)
+
+        Args:
+            platform: Normalized platform name
+
+        Returns:
+            Dict with core_name/core_path (first installed core of the
+            platform, None if none), retroarch (executable or None),
+            emulators ([(name, executable)] installed standalone emulators),
+            bios_dir (None if missing) and complete (every executable found)
+        """
+        self._check_plan_stamp()
+
+        platform_info = self.core_database.get(platform) or {}
+        cores = tuple(platform_info.get("cores", []))
+
+        # The platform dict may be updated in place by a rescan. A plan
+        # missing an executable is resolved again, so one installed since
+        # is picked up (only misses are looked up each launch)
+        plan = self._launch_plans.get(platform)
+        if plan is not None and plan["cores"] == cores and plan["complete"]:
+            return plan
+
+        core_name = self._find_core_for_platform(platform)
+        launchers = self.STANDALONE_LAUNCHERS.get(platform, [])
+        emulators = []
+        for launcher in launchers:
+            executable = find_executable(launcher)
+            if executable:
+                emulators.append((launcher, executable))
+        retroarch = find_executable("retroarch")
+
+        plan = {
+            "cores": cores,
+            "core_name": core_name,
+            "core_path": self.get_core_path(core_name) if core_name else None,
+            "retroarch": retroarch,
+            "emulators": emulators,
+            "bios_dir": self._get_bios_path(platform),
+            "complete": retroarch is not None and len(emulators) == len(launchers)
+        }
+        self._launch_plans[platform] = plan
+        return plan
+
+    def _get_mel_settings(self): #vers 1
+        """Get the MEL settings, loaded once per settings file change"""
+        if self._mel_settings is None:
+            from apps.gui.mel_settings_manager import MELSettingsManager
+            self._mel_settings = MELSettingsManager()
+        return self._mel_settings
+
+    def launch_game(self, platform: str, rom_path: Path, core_name: Optional[str] = None, game_config: Optional[Dict] = None) -> bool: #vers 6
         """Launch a game using appropriate core
 
         Args:
@@ -106,11 +298,13 @@ class CoreLauncher: #vers 6
             print(f"ROM not found: {rom_path}")
             return False
 
-        # Reload database from database manager
-        self.core_database = self._load_database_from_db()
+        with span("resolve"):
+            # Pick up platform table changes (one small query, no reload if unchanged)
+            self._refresh_database()
 
-        # Normalize platform name
-        normalized_platform = self.normalize_platform_name(platform)
+            # Normalize platform name
+            normalized_platform = self.normalize_platform_name(platform)
+            plan = self.get_launch_plan(normalized_platform)
 
         print(f"\n=== Launching Game ===")
         print(f"Platform: '{platform}' -> '{normalized_platform}'")
@@ -124,7 +318,7 @@ class CoreLauncher: #vers 6
 
         # Select core
         if not core_name:
-            core_name = self._find_core_for_platform(normalized_platform)
+            core_name = plan["core_name"]
 
         if not core_name:
             print(f"No core available for {platform}")
@@ -132,22 +326,23 @@ class CoreLauncher: #vers 6
             return self.launch_with_subprocess(None, rom_path, normalized_platform, game_config)
 
         # Get core path
-        core_path = self.get_core_path(core_name)
-        if not core_path or not core_path.exists():
+        core_path = plan["core_path"] if core_name == plan["core_name"] else self.get_core_path(core_name)
+        if not core_path:
             print(f"Core not found: {core_name}")
             # Try launching with installed emulator instead
             return self.launch_with_subprocess(None, rom_path, normalized_platform, game_config)
 
         # Check BIOS requirements
         if platform_info.get("bios_required"):
-            bios_valid = self._verify_bios(normalized_platform, platform_info)
+            with span("bios_check"):
+                bios_valid = self._verify_bios(normalized_platform, platform_info)
             if not bios_valid:
                 print(f"Warning: Required BIOS files may be missing for {platform}")
 
         # Launch using subprocess
         return self.launch_with_subprocess(core_path, rom_path, normalized_platform, game_config)
 
-    def launch_with_subprocess(self, core_path: Optional[Path], rom_path: Path, platform: str, game_config: Optional[Dict] = None) -> bool: #vers 5
+    def launch_with_subprocess(self, core_path: Optional[Path], rom_path: Path, platform: str, game_config: Optional[Dict] = None) -> bool: #vers 7
         """Launch using local core OR installed emulator
 
         NEW BEHAVIOR: Prefers local cores FIRST, then installed emulators
@@ -159,6 +354,7 @@ class CoreLauncher: #vers 6
             platform: Platform name
             game_config: Optional game configuration dict
         """
+        plan = self.get_launch_plan(platform)
 
         # ==== PRIORITY 1: LOCAL CORES ====
         if core_path and core_path.exists():
@@ -166,12 +362,9 @@ class CoreLauncher: #vers 6
 
             # Try RetroArch first (if installed)
             try:
-                result = subprocess.run(["which", "retroarch"],
-                                      capture_output=True,
-                                      timeout=2)
-                if result.returncode == 0:
+                if plan["retroarch"]:
                     print("  Launching with RetroArch...")
-                    cmd = ["retroarch", "-L", str(core_path), str(rom_path)]
+                    cmd = [plan["retroarch"], "-L", str(core_path), str(rom_path)]
 
                     # Add custom args from game_config
                     if game_config:
@@ -183,11 +376,12 @@ class CoreLauncher: #vers 6
                             cmd.append("--fullscreen")
 
                     # Launch
-                    self.current_process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
+                    with span("spawn"):
+                        self.current_process = subprocess.Popen(
+                            cmd,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL
+                        )
                     print(f"✓ Launched with local core: {rom_path.name}")
                     return True
             except Exception as e:
@@ -196,84 +390,49 @@ class CoreLauncher: #vers 6
         # ==== PRIORITY 2: INSTALLED STANDALONE EMULATORS ====
         print("  Checking for installed standalone emulators...")
 
-        standalone_launchers = {
-            "PlayStation 2": ["pcsx2", "pcsx2-qt"],
-            "PlayStation 1": ["duckstation-qt", "epsxe"],
-            "Nintendo 64": ["mupen64plus"],
-            "Super Nintendo": ["snes9x-gtk", "bsnes"],
-            "SNES": ["snes9x-gtk", "bsnes"],
-            "Nintendo Entertainment System": ["fceux"],
-            "NES": ["fceux"],
-            "Game Boy Advance": ["mgba-qt", "visualboyadvance"],
-            "GBA": ["mgba-qt", "visualboyadvance"],
-            "Nintendo DS": ["desmume", "melonDS"],
-            "Sega Genesis": ["kega-fusion", "blastem"],
-            "Sega Mega Drive": ["kega-fusion", "blastem"],
-            "Nintendo GameCube": ["dolphin-emu"],
-            "Nintendo Wii": ["dolphin-emu"],
-            "PSP": ["ppsspp-qt", "ppsspp"],
-            "Amiga": ["fs-uae", "amiberry", "amiberry-lite"],
-            "Atari ST": ["hatari"],
-            "Atari 2600": ["stella"],
-            "Atari 800": ["atari800"],
-            "Amstrad CPC": ["cap32", "caprice32"],
-            "BBC Micro": ["b2"],
-            "Commodore 64": ["vice"],
-            "C64": ["vice"],
-            "ZX Spectrum": ["fuse"],
-            "ZX Spectrum 128": ["fuse"],
-            "MSX": ["bluemsx", "openmsx"],
-            "MSX2": ["bluemsx", "openmsx"]
-        }
-
-        launchers = standalone_launchers.get(platform, [])
+        launchers = self.STANDALONE_LAUNCHERS.get(platform, [])
 
-        for launcher in launchers:
+        for launcher, executable in plan["emulators"]:
             try:
-                result = subprocess.run(["which", launcher],
-                                      capture_output=True,
-                                      text=True,
-                                      timeout=2)
-                if result.returncode == 0:
-                    print(f"✓ Found installed emulator: {launcher}")
-
-                    # Build command
-                    cmd = [launcher, str(rom_path)]
-
-                    # ==== NEW: Load user display settings ====
-                    try:
-                        from apps.gui.mel_settings_manager import MELSettingsManager
-                        mel_settings = MELSettingsManager()
-                        display_mode = mel_settings.get_emulator_display_mode(launcher)
-
-                        if display_mode and display_mode != 'auto':
-                            # Apply saved display settings
-                            print(f"  Applying display setting: {display_mode}")
-                            cmd.extend(display_mode.split())
-                    except Exception as e:
-                        print(f"  Could not load display settings: {e}")
-
-                    # Add custom args from game_config (overrides display settings)
-                    if game_config:
-                        custom_args = game_config.get("custom_args", "")
-                        if custom_args:
-                            print(f"  Applying custom args: {custom_args}")
-                            cmd.extend(custom_args.split())
-
-                        if game_config.get("fullscreen", False):
-                            cmd.append("--fullscreen")
-
-                    # Add BIOS path if needed
-                    bios_path = self._get_bios_path(platform)
-                    if bios_path:
-                        cmd.extend(["--bios", str(bios_path)])
-
-                    # Get working directory from game_config
-                    cwd = None
-                    if game_config and game_config.get("working_dir"):
-                        cwd = game_config["working_dir"]
-
-                    # Launch
+                print(f"✓ Found installed emulator: {launcher}")
+
+                # Build command
+                cmd = [executable, str(rom_path)]
+
+                # ==== NEW: Load user display settings ====
+                try:
+                    mel_settings = self._get_mel_settings()
+                    display_mode = mel_settings.get_emulator_display_mode(launcher)
+
+                    if display_mode and display_mode != 'auto':
+                        # Apply saved display settings
+                        print(f"  Applying display setting: {display_mode}")
+                        cmd.extend(display_mode.split())
+                except Exception as e:
+                    print(f"  Could not load display settings: {e}")
+
+                # Add custom args from game_config (overrides display settings)
+                if game_config:
+                    custom_args = game_config.get("custom_args", "")
+                    if custom_args:
+                        print(f"  Applying custom args: {custom_args}")
+                        cmd.extend(custom_args.split())
+
+                    if game_config.get("fullscreen", False):
+                        cmd.append("--fullscreen")
+
+                # Add BIOS path if needed
+                bios_path = plan["bios_dir"]
+                if bios_path:
+                    cmd.extend(["--bios", str(bios_path)])
+
+                # Get working directory from game_config
+                cwd = None
+                if game_config and game_config.get("working_dir"):
+                    cwd = game_config["working_dir"]
+
+                # Launch
+                with span("spawn"):
                     self.current_process = subprocess.Popen(
                         cmd,
                         stdout=subprocess.DEVNULL,
@@ -281,8 +440,8 @@ class CoreLauncher: #vers 6
                         cwd=cwd
                     )
 
-                    print(f"✓ Launched with {launcher}: {rom_path.name}")
-                    return True
+                print(f"✓ Launched with {launcher}: {rom_path.name}")
+                return True
             except Exception as e:
                 continue
 
@@ -322,13 +481,21 @@ class CoreLauncher: #vers 6
             return self.current_process.poll() is None
         return False
 
-    def get_core_path(self, core_name: str) -> Optional[Path]: #vers 1
+    def get_core_path(self, core_name: str) -> Optional[Path]: #vers 2
         """Get full path to core file"""
+        # One listing of the cores dir, reused until its mtime changes
+        self._check_plan_stamp()
+        if self._core_files is None:
+            try:
+                self._core_files = {entry.name for entry in os.scandir(self.cores_dir) if entry.is_file()}
+            except OSError:
+                self._core_files = set()
+
         # Check for .so (Linux), .dll (Windows), .dylib (macOS)
         for ext in ['.so', '.dll', '.dylib']:
-            core_file = self.cores_dir / f"{core_name}_libretro{ext}"
-            if core_file.exists():
-                return core_file
+            core_file = f"{core_name}_libretro{ext}"
+            if core_file in self._core_files:
+                return self.cores_dir / core_file
         return None
 
     def _find_core_for_platform(self, platform: str) -> Optional[str]: #vers 1
@@ -388,7 +555,7 @@ class CoreLauncher: #vers 6
             return None
 
 
-def get_installed_emulators(): #vers 1
+def get_installed_emulators(): #vers 2
     """Scan system for installed emulators"""
     emulators = {
         # PlayStation
@@ -429,14 +596,8 @@ def get_installed_emulators(): #vers 1
     installed = {}
 
     for emu, platform in emulators.items():
-        try:
-            result = subprocess.run(["which", emu],
-                                  capture_output=True,
-                                  timeout=1)
-            if result.returncode == 0:
-                installed[emu] = platform
-        except:
-            pass
+        if find_executable(emu):
+            installed[emu] = platform
 
     return installed
 
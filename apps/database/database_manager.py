@@ -1,17 +1,56 @@
 import sqlite3
 import json
+import hashlib
 import os
+import re
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 import logging
+from .schema import migrate, index_new_games, LIBRARY_MIGRATIONS
 
 logger = logging.getLogger(__name__)
 
+# Search results returned when the caller gives no limit
+SEARCH_LIMIT = 500
+
+# Searches matching more rows than this skip bm25 ranking, which scores
+# every match (a one-letter query can hit most of a large library)
+RANK_LIMIT = 20000
+
+# Launches kept in launch_stats - older rows are pruned on insert
+LAUNCH_STATS_KEEP = 500
+
+
+def fts_match_query(text: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression
+    
+    Every word becomes a quoted prefix term ("mar"* "bro"*), all of which
+    must match, so user input can never be parsed as FTS5 syntax.
+    
+    Returns:
+        MATCH expression, or '' if text holds no searchable words
+    """
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', text))
+
 class DatabaseManager:
-    """SQLite database manager for the emulator launcher"""
+    """SQLite database manager for the emulator launcher
+    
+    Each thread gets one long-lived connection (WAL journal,
+    synchronous=NORMAL, statement cache). Writes go through transaction(),
+    which nests - only the outermost block commits, so a caller can wrap a
+    whole scan and pay for a single commit.
+    """
+    
+    # Prepared statements kept per connection by the sqlite3 module
+    STATEMENT_CACHE_SIZE = 256
     
     def __init__(self, db_path: str = "apps/database/mel_database.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
         self.ensure_db_directory()
         self.init_database()
     
@@ -20,297 +59,786 @@ class DatabaseManager:
         db_dir = os.path.dirname(self.db_path)
         os.makedirs(db_dir, exist_ok=True)
     
-    def init_database(self):
-        """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Platforms table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS platforms (
-                id INTEGER PRIMARY KEY,
-                name TEXT UNIQUE NOT NULL,
-                normalized_name TEXT,
-                rom_directory TEXT,
-                bios_directory TEXT,
-                core_path TEXT,
-                extension_filter TEXT,
-                total_games INTEGER DEFAULT 0,
-                has_bios INTEGER DEFAULT 0,
-                last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Games table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS games (
-                id INTEGER PRIMARY KEY,
-                platform_id INTEGER,
-                name TEXT NOT NULL,
-                file_path TEXT NOT NULL,
-                file_size INTEGER,
-                file_hash TEXT,
-                is_multidisk INTEGER DEFAULT 0,
-                disk_number INTEGER,
-                total_disks INTEGER,
-                has_bios INTEGER DEFAULT 0,
-                last_played TIMESTAMP,
-                play_count INTEGER DEFAULT 0,
-                FOREIGN KEY (platform_id) REFERENCES platforms (id)
-            )
-        ''')
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode - transactions are started explicitly by transaction()
+            conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                   check_same_thread=False,
+                                   cached_statements=self.STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements as one transaction
         
-        # Cores table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS cores (
-                id INTEGER PRIMARY KEY,
-                platform_name TEXT UNIQUE,
-                core_name TEXT,
-                core_path TEXT,
-                available_cores TEXT, -- JSON array of available cores
-                preferred_core TEXT,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        Nested blocks join the outer transaction; the outermost block commits
+        on success and rolls back if an exception escapes.
         
-        # BIOS files table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bios_files (
-                id INTEGER PRIMARY KEY,
-                platform_id INTEGER,
-                filename TEXT NOT NULL,
-                file_path TEXT NOT NULL,
-                required INTEGER DEFAULT 1,
-                size INTEGER,
-                md5_hash TEXT,
-                FOREIGN KEY (platform_id) REFERENCES platforms (id)
-            )
-        ''')
+        Yields:
+            Cursor on this thread's connection
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
         
-        # Create indexes for better performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_platforms_name ON platforms(name)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_platform ON games(platform_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_name ON games(name)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_bios_platform ON bios_files(platform_id)')
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield cursor
+            finally:
+                self._local.depth -= 1
+            return
         
-        conn.commit()
-        conn.close()
-        logger.info(f"Database initialized at {self.db_path}")
+        conn.execute("BEGIN")
+        self._local.depth = 1
+        try:
+            yield cursor
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            self._local.depth = 0
+    
+    def _query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        """Run a read query on this thread's connection"""
+        return self._get_connection().execute(sql, params).fetchall()
+    
+    def close(self):
+        """Close every pooled connection (reopened on next use)"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
     
-    def add_platform(self, name: str, normalized_name: str = None, rom_directory: str = None, 
-                     bios_directory: str = None, core_path: str = None, 
-                     extension_filter: str = None, total_games: int = 0, 
+    def init_database(self):
+        """Create the database or bring its schema up to date"""
+        version = migrate(self._get_connection(), LIBRARY_MIGRATIONS, "Library database")
+        logger.info(f"Database initialized at {self.db_path} (schema version {version})")
+    
+    def _last_game_id(self, cursor) -> int:
+        """Get the highest games id (new rows are numbered above it)"""
+        return cursor.execute("SELECT COALESCE(MAX(id), 0) FROM games").fetchone()[0]
+    
+    def add_platform(self, name: str, normalized_name: str = None, rom_directory: str = None,
+                     bios_directory: str = None, core_path: str = None,
+                     extension_filter: str = None, total_games: int = 0,
                      has_bios: int = 0) -> int:
         """Add a platform to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         if normalized_name is None:
             normalized_name = name.lower().replace(' ', '_')
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO platforms 
-                (name, normalized_name, rom_directory, bios_directory, core_path, extension_filter, total_games, has_bios)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (name, normalized_name, rom_directory, bios_directory, core_path, extension_filter, total_games, has_bios))
+            with self.transaction() as cursor:
+                # Upsert keeps the existing row id so games/BIOS rows stay attached
+                cursor.execute('''
+                    INSERT INTO platforms
+                    (name, normalized_name, rom_directory, bios_directory, core_path, extension_filter, total_games, has_bios)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        normalized_name = excluded.normalized_name,
+                        rom_directory = excluded.rom_directory,
+                        bios_directory = excluded.bios_directory,
+                        core_path = excluded.core_path,
+                        extension_filter = excluded.extension_filter,
+                        total_games = excluded.total_games,
+                        has_bios = excluded.has_bios,
+                        last_scanned = CURRENT_TIMESTAMP
+                ''', (name, normalized_name, rom_directory, bios_directory, core_path, extension_filter, total_games, has_bios))
+                
+                platform_id = cursor.execute(
+                    "SELECT id FROM platforms WHERE name = ?", (name,)
+                ).fetchone()[0]
             
-            platform_id = cursor.lastrowid or cursor.execute(
-                "SELECT id FROM platforms WHERE name = ?", (name,)
-            ).fetchone()[0]
-            
-            conn.commit()
             logger.info(f"Added/updated platform: {name} (ID: {platform_id})")
             return platform_id
         except Exception as e:
             logger.error(f"Error adding platform {name}: {e}")
             raise
-        finally:
-            conn.close()
+    
+    def upsert_platforms_bulk(self, platforms: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert or update many platforms in one transaction
+        
+        Args:
+            platforms: List of dicts with add_platform's keyword arguments
+                       ('name' required)
+            
+        Returns:
+            Dict of platform name -> row id
+        """
+        if not platforms:
+            return {}
+        
+        rows = []
+        for p in platforms:
+            normalized_name = p.get('normalized_name') or p['name'].lower().replace(' ', '_')
+            rows.append((p['name'], normalized_name, p.get('rom_directory'), p.get('bios_directory'),
+                         p.get('core_path'), p.get('extension_filter'), p.get('total_games', 0),
+                         p.get('has_bios', 0)))
+        
+        with self.transaction() as cursor:
+            cursor.executemany('''
+                INSERT INTO platforms
+                (name, normalized_name, rom_directory, bios_directory, core_path, extension_filter, total_games, has_bios)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    normalized_name = excluded.normalized_name,
+                    rom_directory = excluded.rom_directory,
+                    bios_directory = excluded.bios_directory,
+                    core_path = excluded.core_path,
+                    extension_filter = excluded.extension_filter,
+                    total_games = excluded.total_games,
+                    has_bios = excluded.has_bios,
+                    last_scanned = CURRENT_TIMESTAMP
+            ''', rows)
+            
+            names = [row[0] for row in rows]
+            placeholders = ','.join('?' * len(names))
+            ids = {name: platform_id for name, platform_id in cursor.execute(
+                f"SELECT name, id FROM platforms WHERE name IN ({placeholders})", names)}
+        
+        logger.info(f"Upserted {len(rows)} platform(s)")
+        return ids
     
     def get_platform(self, platform_name: str) -> Optional[Dict[str, Any]]:
         """Get a platform by name"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM platforms WHERE name = ? OR normalized_name = ?", 
-                      (platform_name, platform_name.lower().replace(' ', '_')))
-        row = cursor.fetchone()
-        conn.close()
+        rows = self._query("SELECT * FROM platforms WHERE name = ? OR normalized_name = ?",
+                           (platform_name, platform_name.lower().replace(' ', '_')))
         
-        if row:
-            return dict(row)
+        if rows:
+            return dict(rows[0])
         return None
     
     def get_all_platforms(self) -> List[Dict[str, Any]]:
         """Get all platforms from the database"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM platforms ORDER BY name")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._query("SELECT * FROM platforms ORDER BY name")
         
         return [dict(row) for row in rows]
     
+    def get_platforms_stamp(self) -> tuple:
+        """Get a cheap change marker for the platforms table
+        
+        Returns:
+            (row count, highest id, latest last_scanned, total games) -
+            differs whenever platforms are added, removed or rescanned
+        """
+        row = self._query(
+            "SELECT COUNT(*), MAX(id), MAX(last_scanned), TOTAL(total_games) FROM platforms")[0]
+        return tuple(row)
+    
     def update_platform_games_count(self, platform_name: str, count: int):
         """Update the total games count for a platform"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("UPDATE platforms SET total_games = ? WHERE name = ?", 
-                      (count, platform_name))
-        conn.commit()
-        conn.close()
+        with self.transaction() as cursor:
+            cursor.execute("UPDATE platforms SET total_games = ? WHERE name = ?",
+                          (count, platform_name))
     
     def add_game(self, platform_id: int, name: str, file_path: str, file_size: int = 0,
                  file_hash: str = None, is_multidisk: int = 0, disk_number: int = None,
                  total_disks: int = None, has_bios: int = 0) -> int:
         """Add a game to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute('''
-                INSERT INTO games 
-                (platform_id, name, file_path, file_size, file_hash, 
-                 is_multidisk, disk_number, total_disks, has_bios)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (platform_id, name, file_path, file_size, file_hash, 
-                  is_multidisk, disk_number, total_disks, has_bios))
-            
-            game_id = cursor.lastrowid
-            conn.commit()
+            with self.transaction() as cursor:
+                last_id = self._last_game_id(cursor)
+                cursor.execute('''
+                    INSERT INTO games
+                    (platform_id, name, file_path, file_size, file_hash,
+                     is_multidisk, disk_number, total_disks, has_bios)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (platform_id, name, file_path, file_size, file_hash,
+                      is_multidisk, disk_number, total_disks, has_bios))
+                
+                game_id = cursor.lastrowid
+                index_new_games(cursor, last_id)
             logger.info(f"Added game: {name} to platform ID {platform_id}")
             return game_id
         except Exception as e:
             logger.error(f"Error adding game {name}: {e}")
             raise
-        finally:
-            conn.close()
+    
+    def add_games_bulk(self, games: List[Dict[str, Any]]) -> int:
+        """Insert or update many games in one transaction, keyed by file_path
+        
+        Play statistics of existing rows are kept, and a known file_hash is
+        not overwritten by an empty one.
+        
+        Args:
+            games: List of dicts with add_game's keyword arguments
+                   ('platform_id', 'name' and 'file_path' required), plus
+                   optional display_name, game_type, disks, rom_files and
+                   mtime_ns for stored game entries
+            
+        Returns:
+            Number of rows written
+        """
+        if not games:
+            return 0
+        
+        with self.transaction() as cursor:
+            last_id = self._last_game_id(cursor)
+            cursor.executemany('''
+                INSERT INTO games
+                (platform_id, name, file_path, file_size, file_hash,
+                 is_multidisk, disk_number, total_disks, has_bios,
+                 display_name, game_type, disks, rom_files, mtime_ns)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(file_path) DO UPDATE SET
+                    platform_id = excluded.platform_id,
+                    name = excluded.name,
+                    file_size = excluded.file_size,
+                    file_hash = COALESCE(excluded.file_hash, games.file_hash),
+                    is_multidisk = excluded.is_multidisk,
+                    disk_number = excluded.disk_number,
+                    total_disks = excluded.total_disks,
+                    has_bios = excluded.has_bios,
+                    display_name = excluded.display_name,
+                    game_type = excluded.game_type,
+                    disks = excluded.disks,
+                    rom_files = excluded.rom_files,
+                    mtime_ns = excluded.mtime_ns
+            ''', [(g['platform_id'], g['name'], g['file_path'], g.get('file_size', 0), g.get('file_hash'),
+                   g.get('is_multidisk', 0), g.get('disk_number'), g.get('total_disks'), g.get('has_bios', 0),
+                   g.get('display_name'), g.get('game_type'),
+                   json.dumps(g['disks']) if g.get('disks') is not None else None,
+                   json.dumps(g['rom_files']) if g.get('rom_files') is not None else None,
+                   g.get('mtime_ns'))
+                  for g in games])
+            index_new_games(cursor, last_id)
+        
+        logger.info(f"Upserted {len(games)} game(s)")
+        return len(games)
     
     def get_platform_games(self, platform_id: int) -> List[Dict[str, Any]]:
         """Get all games for a specific platform"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        rows = self._query("SELECT * FROM games WHERE platform_id = ? ORDER BY name", (platform_id,))
+        
+        return [dict(row) for row in rows]
+    
+    def get_game_entries(self, platform_id: int) -> List[Dict[str, Any]]:
+        """Get the stored game entries of a platform (one indexed query)
+        
+        Only rows written from GameScanner entries are returned, not the
+        per-file rows of the platform scan.
+        
+        Returns:
+            List of game entry dicts in GameScanner's format, plus size,
+            mtime_ns and hash keys
+        """
+        rows = self._query('''
+            SELECT p.name AS platform, g.name, g.display_name, g.game_type, g.file_path,
+                   g.file_size, g.file_hash, g.total_disks, g.disks, g.rom_files, g.mtime_ns
+            FROM games g JOIN platforms p ON p.id = g.platform_id
+            WHERE g.platform_id = ? AND g.game_type IS NOT NULL
+            ORDER BY g.name
+        ''', (platform_id,))
+        
+        entries = []
+        for row in rows:
+            rom_files = json.loads(row['rom_files']) if row['rom_files'] else None
+            entry = {
+                'name': row['name'],
+                'display_name': row['display_name'] or row['name'],
+                'type': row['game_type'],
+                'path': row['file_path'],
+                'platform': row['platform'],
+                'file_count': len(rom_files) if rom_files else 1,
+                'disk_count': row['total_disks'] or 0,
+                'disks': json.loads(row['disks']) if row['disks'] else [row['file_path']],
+                'size': row['file_size'],
+                'mtime_ns': row['mtime_ns'],
+                'hash': row['file_hash']
+            }
+            if rom_files is not None:
+                entry['rom_files'] = rom_files
+            entries.append(entry)
+        return entries
+    
+    def search_games(self, query: str, platform_name: str = None, limit: int = SEARCH_LIMIT) -> List[Dict[str, Any]]:
+        """Search games by name, display name, platform or extension
+        
+        Every word of the query matches as a prefix ("mar bro" finds
+        "Super Mario Bros"), best matches first (unranked when more than
+        RANK_LIMIT games match).
+        
+        Args:
+            query: Search text
+            platform_name: Only search this platform (optional)
+            limit: Maximum number of results (-1 for no limit)
+            
+        Returns:
+            List of dicts with id, name, display_name, file_path and platform keys
+        """
+        match = fts_match_query(query)
+        if not match:
+            return []
+        
+        condition = "games_search MATCH ?"
+        params = [match]
+        if platform_name:
+            # The column phrase lets FTS narrow the hits, the equality test
+            # drops platforms that merely contain the name ("Sega CD" in "Sega CD 32X")
+            words = re.findall(r'\w+', platform_name)
+            if words:
+                params[0] = f'platform : "{" ".join(words)}" AND ({match})'
+            condition += " AND platform = ?"
+            params.append(platform_name)
         
-        cursor.execute("SELECT * FROM games WHERE platform_id = ? ORDER BY name", (platform_id,))
-        rows = cursor.fetchall()
-        conn.close()
+        matches = self._query(
+            f"SELECT COUNT(*) FROM (SELECT rowid FROM games_search WHERE {condition} LIMIT ?)",
+            params + [RANK_LIMIT + 1])[0][0]
+        # Name hits outrank display name, platform and extension hits
+        order = "ORDER BY bm25(games_search, 10.0, 5.0, 2.0, 1.0)" if matches <= RANK_LIMIT else ""
+        
+        rows = self._query(f'''
+            SELECT g.id, g.name, g.display_name, g.file_path, s.platform
+            FROM (SELECT rowid, platform FROM games_search WHERE {condition} {order} LIMIT ?) s
+            JOIN games g ON g.id = s.rowid
+        ''', params + [limit])
         
         return [dict(row) for row in rows]
     
-    def add_bios_file(self, platform_id: int, filename: str, file_path: str, 
+    def remove_stale_game_entries(self, platform_id: int, keep_paths) -> int:
+        """Remove stored game entries of a platform whose path is not in keep_paths
+        
+        Returns:
+            Number of entries removed
+        """
+        keep_paths = set(keep_paths)
+        rows = self._query("SELECT file_path FROM games WHERE platform_id = ? AND game_type IS NOT NULL",
+                           (platform_id,))
+        stale = [row[0] for row in rows if row[0] not in keep_paths]
+        self.remove_games_by_paths(stale)
+        return len(stale)
+    
+    def set_games_stamp(self, platform_id: int, stamp: Optional[int]):
+        """Record the ROM directory stamp the stored game entries match"""
+        with self.transaction() as cursor:
+            cursor.execute("UPDATE platforms SET games_stamp = ? WHERE id = ?", (stamp, platform_id))
+    
+    def clear_games_stamps(self):
+        """Mark every platform's stored game entries for a rescan"""
+        with self.transaction() as cursor:
+            cursor.execute("UPDATE platforms SET games_stamp = NULL")
+    
+    def add_bios_file(self, platform_id: int, filename: str, file_path: str,
                       required: int = 1, size: int = None, md5_hash: str = None):
         """Add a BIOS file to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO bios_files 
-            (platform_id, filename, file_path, required, size, md5_hash)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (platform_id, filename, file_path, required, size, md5_hash))
+        with self.transaction() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO bios_files
+                (platform_id, filename, file_path, required, size, md5_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (platform_id, filename, file_path, required, size, md5_hash))
         
-        conn.commit()
-        conn.close()
         logger.info(f"Added BIOS file: {filename} for platform ID {platform_id}")
     
+    def add_bios_files_bulk(self, bios_files: List[Dict[str, Any]]):
+        """Insert or update many BIOS rows in one transaction
+        
+        Rows are keyed by (platform_id, filename).
+        
+        Args:
+            bios_files: List of dicts with add_bios_file's keyword arguments
+                        ('platform_id', 'filename' and 'file_path' required)
+        """
+        if not bios_files:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany('''
+                INSERT INTO bios_files
+                (platform_id, filename, file_path, required, size, md5_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(platform_id, filename) WHERE platform_id IS NOT NULL DO UPDATE SET
+                    file_path = excluded.file_path,
+                    required = excluded.required,
+                    size = excluded.size,
+                    md5_hash = excluded.md5_hash
+            ''', [(b['platform_id'], b['filename'], b['file_path'], b.get('required', 1),
+                   b.get('size'), b.get('md5_hash')) for b in bios_files])
+        
+        logger.info(f"Added {len(bios_files)} BIOS file(s)")
+    
     def get_platform_bios(self, platform_id: int) -> List[Dict[str, Any]]:
         """Get all BIOS files for a specific platform"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM bios_files WHERE platform_id = ?", (platform_id,))
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._query("SELECT * FROM bios_files WHERE platform_id = ?", (platform_id,))
         
         return [dict(row) for row in rows]
     
     def add_core_info(self, platform_name: str, core_name: str = None, core_path: str = None,
                       available_cores: List[str] = None, preferred_core: str = None):
         """Add or update core information for a platform"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         available_cores_json = json.dumps(available_cores) if available_cores else None
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO cores 
-            (platform_name, core_name, core_path, available_cores, preferred_core)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (platform_name, core_name, core_path, available_cores_json, preferred_core))
+        with self.transaction() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO cores
+                (platform_name, core_name, core_path, available_cores, preferred_core)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (platform_name, core_name, core_path, available_cores_json, preferred_core))
         
-        conn.commit()
-        conn.close()
         logger.info(f"Added/updated core info for platform: {platform_name}")
     
+    def add_core_info_bulk(self, cores: List[Dict[str, Any]]):
+        """Insert or update core information for many platforms in one transaction
+        
+        Args:
+            cores: List of dicts with add_core_info's keyword arguments
+                   ('platform_name' required)
+        """
+        if not cores:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany('''
+                INSERT INTO cores
+                (platform_name, core_name, core_path, available_cores, preferred_core)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(platform_name) DO UPDATE SET
+                    core_name = excluded.core_name,
+                    core_path = excluded.core_path,
+                    available_cores = excluded.available_cores,
+                    preferred_core = excluded.preferred_core,
+                    last_updated = CURRENT_TIMESTAMP
+            ''', [(c['platform_name'], c.get('core_name'), c.get('core_path'),
+                   json.dumps(c['available_cores']) if c.get('available_cores') else None,
+                   c.get('preferred_core')) for c in cores])
+        
+        logger.info(f"Added/updated core info for {len(cores)} platform(s)")
+    
     def get_core_info(self, platform_name: str) -> Optional[Dict[str, Any]]:
         """Get core information for a platform"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        rows = self._query("SELECT * FROM cores WHERE platform_name = ?", (platform_name,))
         
-        cursor.execute("SELECT * FROM cores WHERE platform_name = ?", (platform_name,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            result = dict(row)
+        if rows:
+            result = dict(rows[0])
             # Parse the JSON available_cores field
             if result.get('available_cores'):
                 result['available_cores'] = json.loads(result['available_cores'])
             return result
         return None
     
+    def upsert_game_files(self, platform_id: int, files: List[Dict[str, Any]]):
+        """Insert or update one games row per ROM file, keyed by file_path
+        
+        Args:
+            platform_id: Platform the files belong to
+            files: List of dicts with 'path', 'name' and 'size' keys
+        """
+        if not files:
+            return
+        
+        with self.transaction() as cursor:
+            last_id = self._last_game_id(cursor)
+            cursor.executemany('''
+                INSERT INTO games (platform_id, name, file_path, file_size)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(file_path) DO UPDATE SET
+                    platform_id = excluded.platform_id,
+                    name = excluded.name,
+                    file_size = excluded.file_size
+            ''', [(platform_id, os.path.splitext(f['name'])[0], f['path'], f.get('size', 0))
+                  for f in files])
+            index_new_games(cursor, last_id)
+        logger.info(f"Upserted {len(files)} game file(s) for platform ID {platform_id}")
+    
+    def remove_games_by_paths(self, file_paths: List[str]):
+        """Remove games rows for files that no longer exist"""
+        if not file_paths:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany("DELETE FROM games WHERE file_path = ?",
+                               [(path,) for path in file_paths])
+        logger.info(f"Removed {len(file_paths)} game file(s)")
+    
+    def remove_platform(self, platform_name: str):
+        """Remove a platform together with its games, BIOS rows and scan index"""
+        with self.transaction() as cursor:
+            row = cursor.execute("SELECT id FROM platforms WHERE name = ?", (platform_name,)).fetchone()
+            if row:
+                cursor.execute("DELETE FROM games WHERE platform_id = ?", (row[0],))
+                cursor.execute("DELETE FROM bios_files WHERE platform_id = ?", (row[0],))
+                cursor.execute("DELETE FROM platforms WHERE id = ?", (row[0],))
+            cursor.execute("DELETE FROM scan_index WHERE platform_name = ?", (platform_name,))
+        logger.info(f"Removed platform: {platform_name}")
+    
+    def clear_platform_bios(self, platform_id: int):
+        """Clear BIOS rows for a platform (before re-adding them on rescan)"""
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM bios_files WHERE platform_id = ?", (platform_id,))
+    
+    def get_scan_index(self) -> Dict[str, Dict[str, Any]]:
+        """Get the directory scan index
+        
+        Returns:
+            Dict of directory path -> index row (JSON columns decoded)
+        """
+        rows = self._query("SELECT * FROM scan_index")
+        
+        index = {}
+        for row in rows:
+            entry = dict(row)
+            for key in ('extensions', 'subdirs', 'rom_files'):
+                entry[key] = json.loads(entry[key]) if entry[key] else []
+            index[entry['path']] = entry
+        return index
+    
+    def save_scan_index(self, platform_name: str, entries: List[Dict[str, Any]]):
+        """Insert or replace scan index rows for rescanned directories
+        
+        Args:
+            platform_name: Platform the directories belong to
+            entries: List of dicts with path, mtime_ns, inode, entry_count,
+                     rom_count, extensions, subdirs and rom_files keys
+        """
+        if not entries:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany('''
+                INSERT OR REPLACE INTO scan_index
+                (path, platform_name, mtime_ns, inode, entry_count, rom_count, extensions, subdirs, rom_files)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(e['path'], platform_name, e['mtime_ns'], e['inode'], e['entry_count'], e['rom_count'],
+                   json.dumps(sorted(e['extensions'])), json.dumps(e['subdirs']), json.dumps(e['rom_files']))
+                  for e in entries])
+        logger.info(f"Saved {len(entries)} scan index row(s) for platform: {platform_name}")
+    
+    def remove_scan_index(self, paths: List[str]):
+        """Remove scan index rows for directories that no longer exist"""
+        if not paths:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany("DELETE FROM scan_index WHERE path = ?", [(path,) for path in paths])
+    
+    def prune_scan_index(self, platform_names: List[str]):
+        """Remove scan index rows of every platform not in platform_names"""
+        with self.transaction() as cursor:
+            if platform_names:
+                placeholders = ','.join('?' * len(platform_names))
+                cursor.execute(f"DELETE FROM scan_index WHERE platform_name NOT IN ({placeholders})",
+                               list(platform_names))
+            else:
+                cursor.execute("DELETE FROM scan_index")
+    
+    def get_scan_stamp(self, platform_name: str) -> Optional[int]:
+        """Get one stamp for every indexed directory of a platform (one indexed query)
+        
+        Changes whenever the platform scan records a changed, added or
+        removed directory anywhere in the platform tree (folder games and
+        disc subfolders included).
+        
+        Returns:
+            Integer stamp, or None if the platform has no index rows or one
+            of its directories was indexed with a racy (zero) stamp
+        """
+        rows = self._query("SELECT path, mtime_ns, inode FROM scan_index WHERE platform_name = ? ORDER BY path",
+                           (platform_name,))
+        if not rows or any(not row['mtime_ns'] for row in rows):
+            return None
+        
+        digest = hashlib.sha1()
+        for row in rows:
+            digest.update(f"{row['path']}\0{row['mtime_ns']}\0{row['inode']}\n".encode('utf-8', 'surrogateescape'))
+        # 60 bits, so the stamp fits the INTEGER games_stamp column
+        return int(digest.hexdigest()[:15], 16)
+    
+    def clear_scan_index(self):
+        """Clear the directory scan index (forces a full rescan)"""
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM scan_index")
+        logger.info("Cleared scan index")
+    
+    def get_bios_digests(self) -> Dict[str, Dict[str, Any]]:
+        """Get cached BIOS file digests
+        
+        Digest cache rows are bios_files rows with mtime_ns set and no
+        platform, so clear_platform_bios never touches them.
+        
+        Returns:
+            Dict of file path -> {size, mtime_ns, md5, sha1, crc32}
+        """
+        rows = self._query('''
+            SELECT file_path, size, mtime_ns, md5_hash, sha1_hash, crc32
+            FROM bios_files WHERE mtime_ns IS NOT NULL AND platform_id IS NULL
+        ''')
+        
+        return {row[0]: {'size': row[1], 'mtime_ns': row[2], 'md5': row[3], 'sha1': row[4], 'crc32': row[5]}
+                for row in rows}
+    
+    def save_bios_digests(self, digests: List[Dict[str, Any]]):
+        """Insert or update cached BIOS file digests, keyed by file path
+        
+        Args:
+            digests: List of dicts with path, size, mtime_ns, md5, sha1 and crc32 keys
+        """
+        if not digests:
+            return
+        
+        with self.transaction() as cursor:
+            for d in digests:
+                cursor.execute('''
+                    UPDATE bios_files SET size = ?, mtime_ns = ?, md5_hash = ?, sha1_hash = ?, crc32 = ?
+                    WHERE file_path = ? AND mtime_ns IS NOT NULL AND platform_id IS NULL
+                ''', (d['size'], d['mtime_ns'], d['md5'], d['sha1'], d['crc32'], d['path']))
+                if cursor.rowcount == 0:
+                    cursor.execute('''
+                        INSERT INTO bios_files
+                        (platform_id, filename, file_path, required, size, md5_hash, mtime_ns, sha1_hash, crc32)
+                        VALUES (NULL, ?, ?, 0, ?, ?, ?, ?, ?)
+                    ''', (os.path.basename(d['path']), d['path'], d['size'], d['md5'],
+                          d['mtime_ns'], d['sha1'], d['crc32']))
+        logger.info(f"Saved {len(digests)} BIOS digest(s)")
+    
+    def get_archive_manifests(self, platform_name: str) -> Dict[str, Dict[str, Any]]:
+        """Get cached archive member listings for a platform
+        
+        Returns:
+            Dict of archive path -> manifest row (members decoded)
+        """
+        rows = self._query("SELECT * FROM archive_manifest WHERE platform_name = ?", (platform_name,))
+        
+        manifests = {}
+        for row in rows:
+            entry = dict(row)
+            entry['members'] = json.loads(entry['members']) if entry['members'] else []
+            manifests[entry['path']] = entry
+        return manifests
+    
+    def save_archive_manifests(self, platform_name: str, manifests: List[Dict[str, Any]]):
+        """Insert or replace archive member listings
+        
+        Args:
+            platform_name: Platform the archives belong to
+            manifests: List of dicts with path, archive_type, size, mtime_ns
+                       and members ([name, size, crc] lists) keys
+        """
+        if not manifests:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany('''
+                INSERT OR REPLACE INTO archive_manifest
+                (path, platform_name, archive_type, size, mtime_ns, members)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [(m['path'], platform_name, m['archive_type'], m['size'], m['mtime_ns'],
+                   json.dumps(m['members'])) for m in manifests])
+        logger.info(f"Saved {len(manifests)} archive manifest(s) for platform: {platform_name}")
+    
+    def remove_archive_manifests(self, paths: List[str]):
+        """Remove cached listings of archives that no longer exist"""
+        if not paths:
+            return
+        
+        with self.transaction() as cursor:
+            cursor.executemany("DELETE FROM archive_manifest WHERE path = ?", [(path,) for path in paths])
+    
+    def clear_archive_manifests(self):
+        """Clear the archive manifest cache (forces archives to be reopened)"""
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM archive_manifest")
+        logger.info("Cleared archive manifest cache")
+    
     def clear_platform_games(self, platform_id: int):
         """Clear all games for a specific platform (useful when rescanning)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM games WHERE platform_id = ?", (platform_id,))
-        conn.commit()
-        conn.close()
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM games WHERE platform_id = ?", (platform_id,))
         logger.info(f"Cleared games for platform ID {platform_id}")
     
     def clear_all_games(self):
         """Clear all games from the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM games")
-        conn.commit()
-        conn.close()
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM games")
         logger.info("Cleared all games from database")
     
     def clear_all_platforms(self):
         """Clear all platforms from the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM platforms")
-        cursor.execute("DELETE FROM games")  # Also clear games since they reference platforms
-        cursor.execute("DELETE FROM bios_files")  # Also clear BIOS files
-        conn.commit()
-        conn.close()
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM platforms")
+            cursor.execute("DELETE FROM games")  # Also clear games since they reference platforms
+            # Also clear BIOS files - but not the digest cache rows, which
+            # belong to no platform and stay valid while the files are unchanged
+            cursor.execute("DELETE FROM bios_files WHERE NOT (mtime_ns IS NOT NULL AND platform_id IS NULL)")
+            cursor.execute("DELETE FROM scan_index")  # Index would otherwise skip unchanged dirs
         logger.info("Cleared all platforms from database")
     
+    def add_launch_stats(self, platform: str, rom_name: str, success: bool, total_ms: float,
+                         phases: Dict[str, float], keep: int = LAUNCH_STATS_KEEP) -> int:
+        """Record the phase timings of one launch, keeping a rolling history
+        
+        Args:
+            platform: Platform name
+            rom_name: ROM file name
+            success: Whether the launch succeeded
+            total_ms: Whole launch in milliseconds
+            phases: Dict of phase -> milliseconds
+            keep: Number of most recent launches kept
+            
+        Returns:
+            Row id of the new record
+        """
+        with self.transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO launch_stats (platform, rom_name, success, total_ms, phases)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (platform, rom_name, 1 if success else 0, total_ms, json.dumps(phases)))
+            launch_id = cursor.lastrowid
+            cursor.execute("DELETE FROM launch_stats WHERE id <= ?", (launch_id - keep,))
+        return launch_id
+    
+    def get_launch_stats(self, platform: str = None, limit: int = None) -> List[Dict[str, Any]]:
+        """Get recorded launch timings, newest first
+        
+        Args:
+            platform: Only launches of this platform (optional)
+            limit: Maximum number of launches (optional)
+            
+        Returns:
+            List of dicts with platform, rom_name, success, total_ms,
+            launched_at and phases (phase -> milliseconds)
+        """
+        sql = "SELECT platform, rom_name, success, total_ms, launched_at, phases FROM launch_stats"
+        params = []
+        if platform:
+            sql += " WHERE platform = ?"
+            params.append(platform)
+        sql += " ORDER BY id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        launches = []
+        for row in self._query(sql, params):
+            launch = dict(row)
+            launch['success'] = bool(launch['success'])
+            launch['phases'] = json.loads(launch['phases']) if launch['phases'] else {}
+            launches.append(launch)
+        return launches
+    
     def get_database_stats(self) -> Dict[str, int]:
         """Get statistics about the database contents"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._get_connection()
         
         stats = {}
-        stats['platforms'] = cursor.execute("SELECT COUNT(*) FROM platforms").fetchone()[0]
-        stats['games'] = cursor.execute("SELECT COUNT(*) FROM games").fetchone()[0]
-        stats['bios_files'] = cursor.execute("SELECT COUNT(*) FROM bios_files").fetchone()[0]
-        stats['cores'] = cursor.execute("SELECT COUNT(*) FROM cores").fetchone()[0]
+        stats['platforms'] = conn.execute("SELECT COUNT(*) FROM platforms").fetchone()[0]
+        stats['games'] = conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+        stats['bios_files'] = conn.execute("SELECT COUNT(*) FROM bios_files").fetchone()[0]
+        stats['cores'] = conn.execute("SELECT COUNT(*) FROM cores").fetchone()[0]
         
-        conn.close()
         return stats
 
 # Example usage and testing
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Database Schema
+Versioned schemas for the launcher's SQLite databases:
+- LIBRARY_MIGRATIONS: platforms/games/cores/bios_files
+  (mel_database.db, apps.database DatabaseManager)
+- PATHS_MIGRATIONS: rom_paths/game_roms/bios_roms
+  (config/database.db, apps.methods DatabaseManager)
+- CACHE_MIGRATIONS: extraction cache manifest
+  (cache/extracted.db, apps.methods ExtractionCache)
+
+Each migration is a function of a cursor and runs once, in order. The
+number of the last one applied is kept in PRAGMA user_version. Existing
+databases start at version 0 whatever tables they already have, so every
+migration must be safe to run over a schema that already has its changes
+(IF NOT EXISTS, ensure_columns, ensure_unique_index).
+
+To change a schema, append a migration - never edit one that has shipped.
+"""
+
+import sqlite3
+import logging
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version recorded in a database"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, migrations: List[Callable], name: str = "database") -> int:
+    """Bring a database up to the latest schema version
+
+    Each pending migration runs in its own BEGIN IMMEDIATE transaction
+    together with its user_version bump, so a failed step leaves the
+    database at the previous version and a second process opening the same
+    file waits instead of applying it twice. Must not be called inside an
+    open transaction.
+
+    Args:
+        conn: Open connection
+        migrations: Ordered migration functions (version = position + 1)
+        name: Database name for log messages
+
+    Returns:
+        Schema version after migrating
+    """
+    latest = len(migrations)
+    version = get_schema_version(conn)
+
+    if version > latest:
+        logger.warning(f"{name} schema version {version} is newer than this launcher ({latest})")
+        return version
+
+    while version < latest:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock
+            version = get_schema_version(conn)
+            if version >= latest:
+                conn.rollback()
+                break
+            migration = migrations[version]
+            migration(cursor)
+            version += 1
+            cursor.execute(f"PRAGMA user_version = {version}")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        logger.info(f"{name} schema migrated to version {version} ({migration.__name__})")
+
+    return version
+
+
+def ensure_columns(cursor, table: str, columns: Dict[str, str]):
+    """Add any missing columns to an existing table
+
+    Args:
+        cursor: Open cursor
+        table: Table name
+        columns: Dict of column name -> SQL type
+    """
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cursor.fetchall()}
+    for column, sql_type in columns.items():
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}")
+
+
+def ensure_unique_index(cursor, index: str, table: str, columns: str, where: str = None):
+    """Create a unique index, first dropping duplicate rows of older databases
+
+    The newest row (highest id) of each duplicate key is kept.
+
+    Args:
+        cursor: Open cursor
+        index: Index name
+        table: Table name
+        columns: Indexed columns (duplicates are grouped by these)
+        where: Optional partial index condition
+    """
+    exists = cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                            (index,)).fetchone()
+    if exists:
+        return
+
+    condition = f" WHERE {where}" if where else ""
+    also = f" AND {where}" if where else ""
+    cursor.execute(f'''
+        DELETE FROM {table} WHERE id NOT IN (
+            SELECT MAX(id) FROM {table}{condition} GROUP BY {columns}
+        ){also}
+    ''')
+    cursor.execute(f"CREATE UNIQUE INDEX {index} ON {table}({columns}){condition}")
+
+
+def _table_exists(cursor, table: str) -> bool:
+    return cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                          (table,)).fetchone() is not None
+
+
+# ---------------------------------------------------------------------------
+# Library database (mel_database.db)
+# ---------------------------------------------------------------------------
+
+def games_search_columns(row: str) -> str:
+    """SQL for the games_search values of a games row alias
+
+    The extension is the text after the last '.' of the path ('' for
+    folders and files without one): rtrim strips every character but
+    '.', leaving the path up to its last dot.
+    """
+    path = f"{row}.file_path"
+    suffix = f"substr({path}, length(rtrim({path}, replace({path}, '.', ''))) + 1)"
+    return (f"{row}.id, {row}.name, {row}.display_name, "
+            f"(SELECT name FROM platforms WHERE id = {row}.platform_id), "
+            f"CASE WHEN instr({suffix}, '/') > 0 THEN '' ELSE lower({suffix}) END")
+
+
+def index_new_games(cursor, after_id: int):
+    """Add games rows with an id above after_id to games_search"""
+    cursor.execute(f'''
+        INSERT INTO games_search (rowid, name, display_name, platform, extension)
+        SELECT {games_search_columns('games')} FROM games WHERE games.id > ?
+    ''', (after_id,))
+
+
+def library_baseline(cursor):
+    """Platforms, games, cores and BIOS files tables"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS platforms (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL,
+            normalized_name TEXT,
+            rom_directory TEXT,
+            bios_directory TEXT,
+            core_path TEXT,
+            extension_filter TEXT,
+            total_games INTEGER DEFAULT 0,
+            has_bios INTEGER DEFAULT 0,
+            last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            platform_id INTEGER,
+            name TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            file_size INTEGER,
+            file_hash TEXT,
+            is_multidisk INTEGER DEFAULT 0,
+            disk_number INTEGER,
+            total_disks INTEGER,
+            has_bios INTEGER DEFAULT 0,
+            last_played TIMESTAMP,
+            play_count INTEGER DEFAULT 0,
+            FOREIGN KEY (platform_id) REFERENCES platforms (id)
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cores (
+            id INTEGER PRIMARY KEY,
+            platform_name TEXT UNIQUE,
+            core_name TEXT,
+            core_path TEXT,
+            available_cores TEXT, -- JSON array of available cores
+            preferred_core TEXT,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bios_files (
+            id INTEGER PRIMARY KEY,
+            platform_id INTEGER,
+            filename TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            required INTEGER DEFAULT 1,
+            size INTEGER,
+            md5_hash TEXT,
+            FOREIGN KEY (platform_id) REFERENCES platforms (id)
+        )
+    ''')
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_platforms_name ON platforms(name)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_platform ON games(platform_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_name ON games(name)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_bios_platform ON bios_files(platform_id)')
+
+
+def library_scan_cache(cursor):
+    """Directory scan index and archive manifest cache"""
+    # One row per scanned ROM directory so a rescan only descends into
+    # directories whose stamp changed
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scan_index (
+            path TEXT PRIMARY KEY,
+            platform_name TEXT NOT NULL,
+            mtime_ns INTEGER,
+            inode INTEGER,
+            entry_count INTEGER DEFAULT 0,
+            rom_count INTEGER DEFAULT 0,
+            extensions TEXT, -- JSON array of extensions found directly in this directory
+            subdirs TEXT, -- JSON array of child directory paths
+            rom_files TEXT, -- JSON array of ROM file names directly in this directory
+            last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Member listing of each ROM archive so game entries can be rebuilt
+    # without reopening unchanged archives
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS archive_manifest (
+            path TEXT PRIMARY KEY,
+            platform_name TEXT NOT NULL,
+            archive_type TEXT,
+            size INTEGER,
+            mtime_ns INTEGER,
+            members TEXT, -- JSON array of [name, uncompressed_size, crc32]
+            last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_scan_index_platform ON scan_index(platform_name)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_archive_manifest_platform ON archive_manifest(platform_name)')
+
+
+def library_bios_digests(cursor):
+    """BIOS digest cache columns (see DatabaseManager.save_bios_digests)"""
+    ensure_columns(cursor, 'bios_files', {
+        'mtime_ns': 'INTEGER',
+        'sha1_hash': 'TEXT',
+        'crc32': 'TEXT'
+    })
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_bios_file_path ON bios_files(file_path)')
+
+
+def library_unique_keys(cursor):
+    """Unique keys for the bulk upserts"""
+    ensure_unique_index(cursor, 'idx_games_file_path_unique', 'games', 'file_path')
+    cursor.execute('DROP INDEX IF EXISTS idx_games_file_path')  # Superseded by the unique index
+    # Digest cache rows (platform_id NULL) are not covered
+    ensure_unique_index(cursor, 'idx_bios_platform_filename', 'bios_files',
+                        'platform_id, filename', where='platform_id IS NOT NULL')
+
+
+def library_game_entries(cursor):
+    """Stored GameScanner entries"""
+    ensure_columns(cursor, 'games', {
+        'display_name': 'TEXT',
+        'game_type': 'TEXT',  # GameScanner entry type (file/zip/7z/rar/folder), NULL for plain file rows
+        'disks': 'TEXT',  # JSON array
+        'rom_files': 'TEXT',  # JSON array
+        'mtime_ns': 'INTEGER'
+    })
+    # ROM directory mtime_ns when game entries were stored, NULL = rescan
+    ensure_columns(cursor, 'platforms', {'games_stamp': 'INTEGER'})
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_platform_name ON games(platform_id, name)')
+
+
+def library_games_search(cursor):
+    """games_search FTS5 index (rowid = games.id)
+
+    Inserts are indexed by the DatabaseManager insert methods with one
+    set-based statement (index_new_games), which is several times faster
+    than a per-row trigger on large scans. Updates and deletes are followed
+    by triggers.
+    """
+    exists = _table_exists(cursor, 'games_search')
+
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS games_search USING fts5(
+            name, display_name, platform, extension,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS games_search_delete AFTER DELETE ON games BEGIN
+            DELETE FROM games_search WHERE rowid = old.id;
+        END
+    ''')
+    # Rescans rewrite every row - only re-index the ones that changed
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS games_search_update
+        AFTER UPDATE OF name, display_name, platform_id, file_path ON games
+        WHEN old.name IS NOT new.name OR old.display_name IS NOT new.display_name
+             OR old.platform_id IS NOT new.platform_id OR old.file_path IS NOT new.file_path
+        BEGIN
+            DELETE FROM games_search WHERE rowid = old.id;
+            INSERT INTO games_search (rowid, name, display_name, platform, extension)
+            VALUES ({games_search_columns('new')});
+        END
+    ''')
+
+    if not exists:
+        index_new_games(cursor, 0)
+
+
+def library_launch_stats(cursor):
+    """Rolling per-launch phase timings (see apps.utils.launch_timing)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS launch_stats (
+            id INTEGER PRIMARY KEY,
+            launched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            platform TEXT,
+            rom_name TEXT,
+            success INTEGER,
+            total_ms REAL,
+            phases TEXT -- JSON object of phase -> milliseconds
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_launch_stats_platform ON launch_stats(platform)')
+
+
+LIBRARY_MIGRATIONS = [
+    library_baseline,
+    library_scan_cache,
+    library_bios_digests,
+    library_unique_keys,
+    library_game_entries,
+    library_games_search,
+    library_launch_stats,
+]
+
+
+# ---------------------------------------------------------------------------
+# Paths database (config/database.db)
+# ---------------------------------------------------------------------------
+
+def paths_baseline(cursor):
+    """ROM/BIOS/core path tables and the game and BIOS ROM lists"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rom_paths (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT UNIQUE NOT NULL,
+            platform TEXT,
+            description TEXT,
+            enabled BOOLEAN DEFAULT 1,
+            last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bios_paths (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT UNIQUE NOT NULL,
+            description TEXT,
+            enabled BOOLEAN DEFAULT 1
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS core_paths (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT UNIQUE NOT NULL,
+            description TEXT,
+            enabled BOOLEAN DEFAULT 1
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS game_roms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            path TEXT NOT NULL,
+            platform TEXT NOT NULL,
+            size INTEGER,
+            extension TEXT,
+            last_modified TIMESTAMP,
+            added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            verified BOOLEAN DEFAULT 0,
+            checksum TEXT
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bios_roms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            path TEXT NOT NULL,
+            platform TEXT,
+            size INTEGER,
+            required BOOLEAN DEFAULT 0,
+            added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            verified BOOLEAN DEFAULT 0,
+            checksum TEXT
+        )
+    ''')
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_roms_platform ON game_roms(platform)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_roms_extension ON game_roms(extension)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_bios_roms_platform ON bios_roms(platform)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_rom_paths_platform ON rom_paths(platform)')
+
+
+def paths_rom_search(cursor):
+    """rom_search FTS5 index over game and BIOS ROMs, kept up by triggers"""
+    exists = _table_exists(cursor, 'rom_search')
+
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS rom_search USING fts5(
+            name, display_name, platform, extension,
+            rom_type UNINDEXED, rom_id UNINDEXED,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    ''')
+
+    # display_name: file name without the bracketed tags, e.g. "(USA)"
+    display = "trim(CASE WHEN instr({0}.name, '(') > 1 THEN substr({0}.name, 1, instr({0}.name, '(') - 1) ELSE {0}.name END)"
+    columns = {
+        'game_roms': ('game', "{0}.extension"),
+        'bios_roms': ('bios', "''")
+    }
+    for table, (rom_type, extension) in columns.items():
+        values = (f"{display.format('new')}, new.platform, {extension.format('new')}, "
+                  f"'{rom_type}', new.id")
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO rom_search (name, display_name, platform, extension, rom_type, rom_id)
+                VALUES (new.name, {values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN
+                DELETE FROM rom_search WHERE rom_type = '{rom_type}' AND rom_id = old.id;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE ON {table} BEGIN
+                DELETE FROM rom_search WHERE rom_type = '{rom_type}' AND rom_id = old.id;
+                INSERT INTO rom_search (name, display_name, platform, extension, rom_type, rom_id)
+                VALUES (new.name, {values});
+            END
+        ''')
+
+        if not exists:
+            cursor.execute(f'''
+                INSERT INTO rom_search (name, display_name, platform, extension, rom_type, rom_id)
+                SELECT name, {display.format(table)}, platform, {extension.format(table)}, '{rom_type}', id
+                FROM {table}
+            ''')
+
+
+PATHS_MIGRATIONS = [
+    paths_baseline,
+    paths_rom_search,
+]
+
+
+# ---------------------------------------------------------------------------
+# Extraction cache manifest (cache/extracted.db)
+# ---------------------------------------------------------------------------
+
+def cache_baseline(cursor):
+    """One row per extracted archive directory under cache/extracted"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            cache_key TEXT PRIMARY KEY,
+            archive_path TEXT NOT NULL,
+            archive_size INTEGER,
+            archive_mtime INTEGER,
+            main_rom TEXT NOT NULL, -- relative to the entry directory
+            size_bytes INTEGER NOT NULL,
+            created REAL,
+            last_access REAL
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_entries_access ON cache_entries(last_access)')
+
+
+def cache_content_keys(cursor):
+    """Archive content digests; drops entries under the old stem_mtime keys"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS archive_digests (
+            stamp_key TEXT PRIMARY KEY, -- path + size + mtime
+            archive_path TEXT NOT NULL,
+            digest TEXT NOT NULL
+        )
+    ''')
+    # Their directories are removed by ExtractionCache on startup
+    cursor.execute("DELETE FROM cache_entries WHERE cache_key NOT LIKE 'p\\_%' ESCAPE '\\' "
+                   "AND cache_key NOT LIKE 'c\\_%' ESCAPE '\\'")
+
+
+CACHE_MIGRATIONS = [
+    cache_baseline,
+    cache_content_keys,
+]
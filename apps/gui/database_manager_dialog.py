@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/gui/database_manager_dialog.py - Version: 1
+#this belongs in apps/gui/database_manager_dialog.py - Version: 2
 # X-Seti - November30 2025 - Multi-Emulator Launcher - Database Manager Dialog
 
 """
@@ -884,7 +884,7 @@ class DatabaseManagerDialog(QDialog): #vers 1
                 else:
                     QMessageBox.warning(self, "Error", "Name and path cannot be empty")
     
-    def _search_roms(self): #vers 1
+    def _search_roms(self): #vers 2
         """Search for ROMs based on the search box"""
         query = self.roms_search_box.text().strip()
         search_type = self.roms_search_type.currentText()
@@ -894,21 +894,9 @@ class DatabaseManagerDialog(QDialog): #vers 1
             self._refresh_roms()
             return
         
-        # Search for ROMs
-        if search_type == "Game":
-            roms = self.database_manager.get_game_roms()
-            # Filter by query
-            roms = [rom for rom in roms if query.lower() in rom['name'].lower()]
-        elif search_type == "BIOS":
-            roms = self.database_manager.get_bios_roms()
-            # Filter by query
-            roms = [rom for rom in roms if query.lower() in rom['name'].lower()]
-        else:  # All
-            # Search in both game and BIOS ROMs
-            game_roms = self.database_manager.get_game_roms()
-            bios_roms = self.database_manager.get_bios_roms()
-            roms = [rom for rom in game_roms if query.lower() in rom['name'].lower()] + \
-                   [rom for rom in bios_roms if query.lower() in rom['name'].lower()]
+        # Full-text index lookup, best matches first
+        rom_type = {"Game": "game", "BIOS": "bios"}.get(search_type, "both")
+        roms = self.database_manager.search_roms(query, rom_type)
         
         # Update the table
         self.game_roms_table.setRowCount(len(roms))
@@ -916,9 +904,9 @@ class DatabaseManagerDialog(QDialog): #vers 1
             self.game_roms_table.setItem(row, 0, QTableWidgetItem(str(rom['id'])))
             self.game_roms_table.setItem(row, 1, QTableWidgetItem(rom['name']))
             self.game_roms_table.setItem(row, 2, QTableWidgetItem(rom['path']))
-            self.game_roms_table.setItem(row, 3, QTableWidgetItem(rom.get('platform', '')))
-            self.game_roms_table.setItem(row, 4, QTableWidgetItem(str(rom.get('size', 0))))
-            self.game_roms_table.setItem(row, 5, QTableWidgetItem(rom.get('extension', '')))
+            self.game_roms_table.setItem(row, 3, QTableWidgetItem(rom.get('platform') or ''))
+            self.game_roms_table.setItem(row, 4, QTableWidgetItem(str(rom.get('size') or 0)))
+            self.game_roms_table.setItem(row, 5, QTableWidgetItem(rom.get('extension') or ''))
     
     def _update_stats(self): #vers 1
         """Update the stats label"""
@@ -187,6 +187,7 @@ from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QS
 from PyQt6.QtWidgets import (QApplication, QSlider, QCheckBox, QTreeWidget,
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget, QDialog, QFormLayout, QSpinBox,  QListWidgetItem, QLabel, QPushButton, QFrame, QFileDialog, QLineEdit, QTextEdit, QMessageBox, QScrollArea, QGroupBox, QTableWidget, QTableWidgetItem, QColorDialog, QHeaderView, QAbstractItemView, QMenu, QComboBox, QInputDialog, QTabWidget, QDoubleSpinBox, QRadioButton
 )
+from PyQt6.QtWidgets import QListView
 from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect, QByteArray
 from PyQt6.QtGui import QFont, QIcon, QPixmap, QImage, QPainter, QPen, QBrush,  QColor, QCursor
 from PyQt6.QtSvg import QSvgRenderer
@@ -194,13 +195,23 @@ from PyQt6.QtSvg import QSvgRenderer
 # Import SVG icon factory
 from apps.methods.svg_icon_factory import SVGIconFactory
 from apps.components.emulator_embed_widget import EmulatorEmbedWidget
+from apps.components.game_list_model import GameListModel
 from apps.methods.platform_scanner import PlatformScanner
+from apps.methods.scan_session import ScanSession
+from apps.methods.game_scanner import GameScanner
+from apps.methods.rom_loader import RomLoader
+from apps.methods.bios_manager import BiosManager
+from apps.methods.core_downloader import CoreDownloader
+from apps.core.core_launcher import CoreLauncher
 from apps.methods.platform_icons import PlatformIcons
 from apps.methods.artwork_loader import ArtworkLoader
+from apps.methods.artwork_service import ArtworkService
+from apps.methods.rom_prefetcher import RomPrefetcher
 from apps.methods.system_core_scanner import SystemCoreScanner
 from apps.gui.mel_settings_dialog import MELSettingsDialog
 from apps.gui.mel_settings_manager import MELSettingsManager
 from apps.utils.debug_logger import debug, info, warning, error, verbose, init_logger
+from apps.utils.launch_timing import LaunchTimer, span
 from apps.gui.game_manager_dialog import GameManagerDialog, GameConfig
 from apps.gui.ports_manager_dialog import PortsManagerDialog
 from apps.gui.load_core_dialog import LoadCoreDialog
@@ -244,6 +255,8 @@ except ImportError:
 # _create_titlebar
 # _download_game_artwork
 # _enable_move_mode
+# _extracts_archives
+# _filter_game_names
 # _get_resize_corner
 # _get_theme_colors
 # _handle_corner_resize
@@ -253,14 +266,18 @@ except ImportError:
 # _on_artwork_downloaded
 # _on_core_loaded
 # _on_game_config_saved
+# _on_game_filter_changed
 # _on_game_selected
 # _on_launch_game
 # _on_platform_selected
 # _on_port_selected
+# _on_rom_prefetched
 # _on_stop_emulation
 # _on_theme_changed
+# _on_title_artwork_ready
 # _open_mel_settings
 # _open_rom_folder
+# _prefetch_selected
 # _refresh_platforms
 # _save_config
 # _scan_roms
@@ -425,7 +442,7 @@ class EmulatorListWidget(QListWidget): #vers 2
             dialog.exec()
 
 
-    def _open_as_emulator(self, platform): #vers 1
+    def _open_as_emulator(self, platform): #vers 2
         """Open emulator binary selection dialog to use for this platform"""
         # Find parent EmuLauncherGUI
         parent_widget = self.parent()
@@ -435,8 +452,8 @@ class EmulatorListWidget(QListWidget): #vers 2
         if parent_widget and hasattr(parent_widget, '_on_launch_game'):
             # Get the selected game from the game list
             game_list = getattr(parent_widget, 'game_list', None)
-            if game_list and game_list.currentItem():
-                selected_game = game_list.currentItem().text()
+            if game_list and game_list.current_game():
+                selected_game = game_list.current_game()
                 
                 # Get the ROM path for the selected game
                 rom_path = None
@@ -565,17 +582,27 @@ class EmulatorListWidget(QListWidget): #vers 2
                 item.setText(platform)
 
 
-class GameListWidget(QListWidget): #vers 2
-    """Panel 2: List of games for selected platform with artwork support"""
+class GameListWidget(QListView): #vers 4
+    """Panel 2: List of games for selected platform with artwork support
+    
+    Backed by GameListModel - rows are fetched in batches and thumbnails
+    are only loaded for rows the view actually paints.
+    """
     
     game_selected = pyqtSignal(str)
     
-    def __init__(self, parent=None): #vers 3
+    def __init__(self, parent=None): #vers 4
         super().__init__(parent)
-        self.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.currentRowChanged.connect(self.on_selection_changed)
+        self.game_model = GameListModel(self)
+        self.setModel(self.game_model)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.selectionModel().currentRowChanged.connect(self.on_selection_changed)
         self.setIconSize(QSize(64, 64))  # Set icon size for artwork
         
+        # Same-height rows: the view never has to ask every row for its size
+        self.setUniformItemSizes(True)
+        
         # Enable alternating row colors for visual distinction
         self.setAlternatingRowColors(True)
         
@@ -583,7 +610,7 @@ class GameListWidget(QListWidget): #vers 2
         self.current_platform = None
         
 
-    def populate_games(self, games, artwork_loader=None, platform=None): #vers 2
+    def populate_games(self, games, artwork_loader=None, platform=None): #vers 3
         """Populate with game names and artwork thumbnails
         
         Args:
@@ -591,27 +618,78 @@ class GameListWidget(QListWidget): #vers 2
             artwork_loader: ArtworkLoader instance for thumbnails
             platform: Platform name for artwork lookup
         """
-        self.clear()
         self.artwork_loader = artwork_loader
         self.current_platform = platform
+        self.game_model.set_games(games, artwork_loader, platform)
+        
+
+    def set_artwork_service(self, artwork_service): #vers 1
+        """Decode thumbnails in the background through an ArtworkService"""
+        self.game_model.set_artwork_service(artwork_service)
+        self.verticalScrollBar().valueChanged.connect(self._cancel_offscreen_artwork)
+        
+
+    def _cancel_offscreen_artwork(self, *args): #vers 1
+        """Drop queued thumbnail requests for rows scrolled out of view"""
+        viewport = self.viewport().rect()
+        first = self.indexAt(viewport.topLeft()).row()
+        last = self.indexAt(viewport.bottomLeft()).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = self.game_model.rowCount() - 1
+        self.game_model.cancel_outside(first, last)
+        
+
+    def refresh_artwork(self): #vers 1
+        """Reload thumbnails of visible rows (e.g. after an artwork download)"""
+        self.game_model.clear_icons()
+        
+
+    def count(self): #vers 1
+        """Number of games in the list"""
+        return self.game_model.total_count()
+        
+
+    def currentRow(self): #vers 1
+        """Current row, or -1 if nothing is selected"""
+        index = self.currentIndex()
+        return index.row() if index.isValid() else -1
+        
+
+    def setCurrentRow(self, row): #vers 1
+        """Select row, fetching it first if it is not loaded yet"""
+        if row < 0 or row >= self.game_model.total_count():
+            return
+        while row >= self.game_model.rowCount():
+            self.game_model.fetchMore()
+        self.setCurrentIndex(self.game_model.index(row))
+        
+
+    def current_game(self): #vers 1
+        """Name of the selected game (None if nothing is selected)"""
+        return self.game_model.game_at(self.currentRow())
         
-        for game in games:
-            item = QListWidgetItem()
-            item.setText(game)
-            
-            # Add artwork thumbnail if available
-            if artwork_loader and platform:
-                icon = artwork_loader.get_game_icon(game, platform, size=64)
-                item.setIcon(icon)
-            
-            self.addItem(item)
-            
 
-    def on_selection_changed(self, row): #vers 1
+    def select_game(self, game_name): #vers 1
+        """Select a game by name
+        
+        Returns:
+            True if the game was found
+        """
+        row = self.game_model.find_row(game_name)
+        if row < 0:
+            return False
+        self.setCurrentRow(row)
+        return True
+        
+
+    def on_selection_changed(self, current, previous=None): #vers 2
         """Handle game selection"""
-        if row >= 0:
-            game = self.item(row).text()
-            self.game_selected.emit(game)
+        if current.isValid():
+            game = self.game_model.game_at(current.row())
+            if game is not None:
+                self.game_selected.emit(game)
 
 
 class EmulatorDisplayWidget(QWidget): #vers 4
@@ -957,7 +1035,8 @@ class EmuLauncherGUI(QWidget): #vers 20
     window_closed = pyqtSignal()
 
     def __init__(self, parent=None, main_window=None, core_downloader=None, platform_scanner=None,
-                rom_loader=None, bios_manager=None, game_scanner=None, core_launcher=None, gamepad_config=None, game_config=None, system_core_scanner=None): #vers 14
+                rom_loader=None, bios_manager=None, game_scanner=None, core_launcher=None, gamepad_config=None, game_config=None, system_core_scanner=None,
+                scan_session=None): #vers 19
         """Initialize Multi-Emulator Launcher GUI
 
         Args:
@@ -967,6 +1046,7 @@ class EmuLauncherGUI(QWidget): #vers 20
             core_launcher: CoreLauncher instance (optional)
             gamepad_config: GamepadConfig instance (optional)
             game_config: GameConfig instance (optional)
+            scan_session: ScanSession shared with the main launcher (optional)
         """
         print(App_name, "Initializing ...")
 
@@ -981,6 +1061,7 @@ class EmuLauncherGUI(QWidget): #vers 20
         self.bios_manager = bios_manager if bios_manager else getattr(self, 'bios_manager', None)
         self.game_scanner = game_scanner if game_scanner else getattr(self, 'game_scanner', None)
         self.system_core_scanner = system_core_scanner if system_core_scanner else getattr(self, 'system_core_scanner', None)
+        self.scan_session = scan_session
 
         self.main_window = main_window
 
@@ -1008,24 +1089,25 @@ class EmuLauncherGUI(QWidget): #vers 20
 
         # Initialize PlatformScanner with MEL settings path (if not provided)
         if not self.platform_scanner:
-            roms_dir = self.mel_settings.get_rom_path()
-            self.platform_scanner = PlatformScanner(roms_dir)
-            # Scan platforms immediately to build database for CoreLauncher
-            self.platform_scanner.scan_platforms()
+            if self.scan_session:
+                self.platform_scanner = self.scan_session.platform_scanner
+            else:
+                roms_dir = self.mel_settings.get_rom_path()
+                self.platform_scanner = PlatformScanner(roms_dir)
+
+        # One scan per session - shared by CoreLauncher, RomLoader and GameScanner
+        if not self.scan_session:
+            self.scan_session = ScanSession(self.platform_scanner)
+        dynamic_platforms = self.scan_session.ensure_scanned()
 
         # Initialize core systems (if not provided)
         if not self.core_downloader:
             self.core_downloader = CoreDownloader(Path.cwd())
 
         if not self.core_launcher:
-            # Build core database from scanned platforms
-            platform_db = {}
-            if self.platform_scanner and hasattr(self.platform_scanner, 'platforms'):
-                platform_db = self.platform_scanner.platforms
-            
             self.core_launcher = CoreLauncher(
                 Path.cwd(),
-                platform_db,
+                dynamic_platforms,
                 self.core_downloader
             )
 
@@ -1033,9 +1115,11 @@ class EmuLauncherGUI(QWidget): #vers 20
         if not self.rom_loader:
             config = {
                 'rom_path': str(Path.cwd() / "roms"),
-                'cache_path': str(Path.cwd() / "cache")
+                'cache_path': str(Path.cwd() / "cache"),
+                'extraction_cache_mb': self.mel_settings.get_extraction_cache_mb(),
+                'extraction_cache_dedupe': self.mel_settings.get_extraction_cache_dedupe(),
+                'ram_extraction_mb': self.mel_settings.get_ram_extraction_mb()
             }
-            dynamic_platforms = getattr(self.platform_scanner, 'scan_platforms', lambda: {})()
             self.rom_loader = RomLoader(config, dynamic_platforms)
 
         if not self.game_scanner:
@@ -1043,8 +1127,7 @@ class EmuLauncherGUI(QWidget): #vers 20
                 'rom_path': str(Path.cwd() / "roms"),
                 'cache_path': str(Path.cwd() / "cache")
             }
-            dynamic_platforms = getattr(self.platform_scanner, 'scan_platforms', lambda: {})()
-            self.game_scanner = GameScanner(config, dynamic_platforms)
+            self.game_scanner = GameScanner(config, dynamic_platforms, self.platform_scanner.db_manager)
 
         if not self.bios_manager:
             self.bios_manager = BiosManager(Path.cwd() / "bios")
@@ -1091,15 +1174,29 @@ class EmuLauncherGUI(QWidget): #vers 20
         self.current_platform = None
         self.current_rom_path = None
         self.available_roms = {}
+        self.available_games = {}  # {platform: {game name: game entry}}
         self.current_process = None  # Track custom emulator processes
+        self.current_game_entry = None
 
         # Initialize icon factory and display mode
         self.platform_icons = PlatformIcons()
         self.icon_display_mode = "icons_and_text"
 
-        # Initialize artwork loader
+        # Initialize artwork loader - thumbnails and title art are decoded
+        # off the GUI thread by the artwork service
         artwork_dir = Path.cwd() / "artwork"
-        self.artwork_loader = ArtworkLoader(artwork_dir)
+        self.artwork_loader = ArtworkLoader(
+            artwork_dir,
+            cache_budget_bytes=self.mel_settings.get_artwork_cache_mb() * 1024 * 1024,
+            thumbnail_dir=self.mel_settings.get_cache_path() / "thumbnails"
+        )
+        self.artwork_service = ArtworkService(self.artwork_loader, parent=self)
+        self.artwork_service.title_ready.connect(self._on_title_artwork_ready)
+
+        # Extract the highlighted game in the background so Launch finds
+        # it already in the extraction cache
+        self.rom_prefetcher = RomPrefetcher(self.rom_loader, parent=self)
+        self.rom_prefetcher.prefetched.connect(self._on_rom_prefetched)
 
         # Initialize AppSettings
         if APPSETTINGS_AVAILABLE:
@@ -1411,7 +1508,7 @@ class EmuLauncherGUI(QWidget): #vers 20
         return panel
 
 
-    def _create_middle_panel(self): #vers 1
+    def _create_middle_panel(self): #vers 3
         """Create Panel 2: Game list for selected platform"""
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -1426,8 +1523,16 @@ class EmuLauncherGUI(QWidget): #vers 20
         header.setStyleSheet("font-weight: bold; padding: 5px;")
         layout.addWidget(header)
 
+        # Filter box - looked up in the games search index
+        self.game_filter = QLineEdit()
+        self.game_filter.setPlaceholderText("Filter games...")
+        self.game_filter.setClearButtonEnabled(True)
+        self.game_filter.textChanged.connect(self._on_game_filter_changed)
+        layout.addWidget(self.game_filter)
+
         # Game list
         self.game_list = GameListWidget()
+        self.game_list.set_artwork_service(self.artwork_service)
         self.game_list.game_selected.connect(self._on_game_selected)
         layout.addWidget(self.game_list)
 
@@ -1657,16 +1762,15 @@ class EmuLauncherGUI(QWidget): #vers 20
         return status_bar
 
 
-    def _refresh_platforms(self): #vers 3
+    def _refresh_platforms(self): #vers 4
         """Refresh platform list using current ROM path from settings"""
         # Get ROM path from MEL settings
         roms_dir = self.mel_settings.get_rom_path()
 
-        # Update platform scanner with new path
-        self.platform_scanner = PlatformScanner(roms_dir)
-
-        # Scan for platforms - CORRECT METHOD NAME
-        discovered_platforms = self.platform_scanner.scan_platforms()
+        # Rescan through the shared session so GameScanner, RomLoader and
+        # CoreLauncher all see the new platforms
+        discovered_platforms = self.scan_session.refresh(roms_dir)
+        self.platform_scanner = self.scan_session.platform_scanner
 
         if discovered_platforms:
             platform_names = list(discovered_platforms.keys())
@@ -1823,7 +1927,7 @@ class EmuLauncherGUI(QWidget): #vers 20
             self.mel_settings.settings['bios_path'] = path
             self.mel_settings.save_mel_settings()
 
-    def _scan_bios_files(self): #vers 2
+    def _scan_bios_files(self): #vers 3
         """Scan BIOS directory and populate table with found files"""
         bios_path = Path(self.bios_path_edit.text())
 
@@ -1866,43 +1970,37 @@ class EmuLauncherGUI(QWidget): #vers 20
         # Database to save
         bios_database = {}
 
-        # Scan for BIOS files
-        found_files = list(bios_path.rglob('*'))
-
-        for file_path in found_files:
-            if file_path.is_file():
-                # Check if this matches any known BIOS
-                for system, bios_list in known_bios.items():
-                    for bios_name, expected_info in bios_list.items():
-                        if file_path.name.lower() == bios_name.lower():
-                            # Calculate MD5
-                            import hashlib
-                            md5_hash = hashlib.md5()
-                            with open(file_path, 'rb') as f:
-                                for chunk in iter(lambda: f.read(4096), b""):
-                                    md5_hash.update(chunk)
-                            actual_md5 = md5_hash.hexdigest()
-
-                            # Check status
-                            if expected_info.get('md5') == actual_md5:
-                                status = "âœ“ Verified"
-                            else:
-                                status = "âš  Unknown Version"
-
-                            # Add to table
-                            self._add_bios_to_table(system, file_path, expected_info, actual_md5, status)
-
-                            # Save to database
-                            if system not in bios_database:
-                                bios_database[system] = {}
-
-                            size_mb = file_path.stat().st_size / 1024 / 1024
-                            bios_database[system][file_path.name] = {
-                                'path': str(file_path),
-                                'size': f"{size_mb:.2f} MB",
-                                'md5': actual_md5,
-                                'status': status
-                            }
+        # Scan for BIOS files - digests of unchanged files come from the
+        # database cache, only new or modified files are hashed
+        from apps.core.bios_verifier import BiosVerifier
+        verifier = BiosVerifier(known_bios, db_manager=self.platform_scanner.db_manager, max_workers=4)
+
+        for result in verifier.verify_directory(bios_path):
+            system = result['system']
+            file_path = result['path']
+            expected_info = result['expected']
+            actual_md5 = result['md5']
+
+            # Check status
+            if result['verified']:
+                status = "âœ“ Verified"
+            else:
+                status = "âš  Unknown Version"
+
+            # Add to table
+            self._add_bios_to_table(system, file_path, expected_info, actual_md5, status)
+
+            # Save to database
+            if system not in bios_database:
+                bios_database[system] = {}
+
+            size_mb = result['size'] / 1024 / 1024
+            bios_database[system][file_path.name] = {
+                'path': str(file_path),
+                'size': f"{size_mb:.2f} MB",
+                'md5': actual_md5,
+                'status': status
+            }
 
         # Save to settings
         self.mel_settings.settings['bios_database'] = bios_database
@@ -2073,7 +2171,7 @@ class EmuLauncherGUI(QWidget): #vers 20
             self.display_widget.enable_launch_buttons(True)
 
 
-    def _on_launch_game(self): #vers 3
+    def _on_launch_game(self): #vers 6
         """Launch selected game with CoreLauncher and embed window"""
         if not self.current_platform or not self.current_rom_path:
             if hasattr(self, 'status_label'):
@@ -2095,18 +2193,45 @@ class EmuLauncherGUI(QWidget): #vers 20
         if hasattr(self, 'status_label'):
             self.status_label.setText(f"Launching {game_name}...")
 
+        # Time the launch phases into the launch_stats table
+        launch_timer = LaunchTimer(self.current_platform, self.current_rom_path.name,
+                                   getattr(self.platform_scanner, 'db_manager', None))
+
         # Launch game with config
-        success = self.core_launcher.launch_game(
-            self.current_platform,
-            self.current_rom_path,
-            core_name=game_config.get("core") if game_config else None,
-            game_config=game_config
-        )
+        with launch_timer.recording():
+            # Prefer the extracted ROM if the prefetcher has cached it
+            rom_path = self.current_rom_path
+            if self.current_game_entry and self.rom_loader:
+                with span("rom_load"):
+                    cached_rom = self.rom_loader.get_cached_rom(self.current_game_entry)
+                if cached_rom:
+                    rom_path = Path(cached_rom)
+                elif self._extracts_archives(self.current_platform, rom_path):
+                    # Extract through RomLoader (cache, RAM or temp dir) -
+                    # load_rom times itself as rom_load
+                    try:
+                        rom_path = Path(self.rom_loader.load_rom(self.current_game_entry))
+                    except Exception as e:
+                        print(f"Error extracting {rom_path.name}, launching the archive: {e}")
+
+            success = self.core_launcher.launch_game(
+                self.current_platform,
+                rom_path,
+                core_name=game_config.get("core") if game_config else None,
+                game_config=game_config
+            )
 
         # Embed the emulator window if launch was successful
+        embedding = False
         if success and self.core_launcher.current_process:
             if hasattr(self, 'display_widget') and hasattr(self.display_widget, 'embed_window'):
-                self.display_widget.embed_window(self.core_launcher.current_process)
+                # The launch record is finished once embedding ends
+                self.display_widget.embed_window(self.core_launcher.current_process,
+                                                 launch_timer=launch_timer)
+                embedding = True
+
+        if not embedding:
+            launch_timer.finish(success)
 
         # Update status
         if hasattr(self, 'status_label'):
@@ -2115,6 +2240,16 @@ class EmuLauncherGUI(QWidget): #vers 20
             else:
                 self.status_label.setText(f"Launch failed: {game_name}")
 
+    def _extracts_archives(self, platform, rom_path): #vers 1
+        """Check if a launch path is an archive the platform's core cannot open itself
+
+        Only platforms whose config sets zip_support to 'extract' are
+        extracted before launch; the rest get the archive as before.
+        """
+        platform_config = self.rom_loader.platforms.get(platform) or {}
+        return (rom_path.suffix.lower() in ('.zip', '.7z', '.rar')
+                and platform_config.get('zip_support') == 'extract')
+
     def _launch_with_custom_emulator(self, platform: str, rom_path: Path, emulator_path: str): #vers 1
         """Launch game with a custom emulator binary selected by user"""
         import subprocess
@@ -2191,8 +2326,12 @@ class EmuLauncherGUI(QWidget): #vers 20
                     self.status_label.setText("No emulation running")
 
 
-    def _on_platform_selected(self, platform): #vers 5
-        """Handle platform selection - scan for actual ROMs using discovered info"""
+    def _on_platform_selected(self, platform): #vers 7
+        """Handle platform selection - load games stored by the last scan
+
+        The ROM directory is only rescanned when it changed since the
+        entries were stored, or after Refresh / Scan ROMs.
+        """
         self.current_platform = platform
         self.current_rom_path = None
         self.platform_status.setText(f"Platform: {platform}")
@@ -2219,19 +2358,19 @@ class EmuLauncherGUI(QWidget): #vers 20
             self.status_label.setText(f"ROM directory not found: {roms_dir}")
             return
 
-        # Get valid extensions from discovered info
-        extensions = platform_info.get('extensions', [])
-
-        # Find all ROM files
-        rom_files = []
-        for ext in extensions:
-            rom_files.extend(list(roms_dir.glob(f"*{ext}")))
+        # Game entries from the database (one query), rescanned if stale
+        games = self.game_scanner.load_platform_games(platform)
 
-        # Store ROM paths
+        # Store game entries and the ROM path each one launches
+        self.available_games[platform] = {game['name']: game for game in games}
+        rom_files = [self.game_scanner.get_launch_path(game) for game in games]
         self.available_roms[platform] = rom_files
 
-        # Populate game list with filenames AND artwork
-        game_names = [rom.stem for rom in rom_files]
+        # Populate game list with game names AND artwork
+        game_names = [game['name'] for game in games]
+        filter_text = self.game_filter.text().strip() if hasattr(self, 'game_filter') else ""
+        if filter_text:
+            game_names = self._filter_game_names(platform, filter_text)
         self.game_list.populate_games(game_names, self.artwork_loader, platform)
         
         # Clear welcome message when games are loaded
@@ -2242,7 +2381,48 @@ class EmuLauncherGUI(QWidget): #vers 20
         self.status_label.setText(f"Found {rom_count} ROM(s) for {platform}")
 
 
-    def _on_game_selected(self, game): #vers 4
+    def _filter_game_names(self, platform, text): #vers 2
+        """Get the names of a platform's games matching filter text
+
+        Every word of the text matches as a prefix of the name, display
+        name or extension. Hits are stored per file (one per disc), so
+        they are matched to the listed games by path. Names keep the game
+        list order.
+        """
+        games = self.available_games.get(platform, {})
+        try:
+            results = self.platform_scanner.db_manager.search_games(text, platform, limit=-1)
+        except Exception as e:
+            print(f"Error filtering games: {e}")
+            return list(games)
+
+        matched = {str(result['file_path']) for result in results}
+        filtered = []
+        for name, game_entry in games.items():
+            paths = [str(game_entry.get('path', ''))]
+            if game_entry.get('type') == 'multidisk':
+                paths += [str(disk) for disk in game_entry.get('disks') or []]
+            if any(path in matched for path in paths):
+                filtered.append(name)
+        return filtered
+
+
+    def _on_game_filter_changed(self, text): #vers 1
+        """Show only the games matching the filter box (all when empty)"""
+        platform = self.current_platform
+        if not platform or platform not in self.available_games:
+            return
+
+        text = text.strip()
+        if text:
+            game_names = self._filter_game_names(platform, text)
+        else:
+            game_names = list(self.available_games[platform])
+        self.game_list.populate_games(game_names, self.artwork_loader, platform)
+        self.status_label.setText(f"Showing {len(game_names)} of {len(self.available_games[platform])} game(s)")
+
+
+    def _on_game_selected(self, game): #vers 7
         """Handle game selection - find ROM path and enable launch"""
         self.game_status.setText(f"Game: {game}")
 
@@ -2250,7 +2430,18 @@ class EmuLauncherGUI(QWidget): #vers 20
             return
 
         # Find ROM path for this game
-        if self.current_platform in self.available_roms:
+        game_entry = self.available_games.get(self.current_platform, {}).get(game)
+        self.current_game_entry = game_entry
+        self._prefetch_selected(game, game_entry)
+        if game_entry:
+            self.current_rom_path = self.game_scanner.get_launch_path(game_entry)
+            self.status_label.setText(f"Ready to launch: {game}")
+
+            # ENABLE LAUNCH BUTTON
+            if hasattr(self, 'display_widget') and hasattr(self.display_widget, 'launch_btn'):
+                self.display_widget.launch_btn.setEnabled(True)
+
+        elif self.current_platform in self.available_roms:
             roms = self.available_roms[self.current_platform]
 
             # Match game name to ROM file
@@ -2265,12 +2456,53 @@ class EmuLauncherGUI(QWidget): #vers 20
 
                     break
 
-        # Load and display title artwork
-        if hasattr(self, 'artwork_loader') and hasattr(self, 'display_widget'):
-            title_artwork = self.artwork_loader.get_title_artwork(game, self.current_platform)
+        # Load and display title artwork - cached art shows at once, the
+        # rest arrives through _on_title_artwork_ready
+        if hasattr(self, 'artwork_service') and hasattr(self, 'display_widget'):
+            title_artwork = self.artwork_service.request_title(game, self.current_platform)
             self.display_widget.show_title_artwork(title_artwork)
 
 
+    def _prefetch_selected(self, game, game_entry): #vers 1
+        """Start extracting the selected game (and prefetch_neighbours games
+        either side of it), cancelling prefetches for anything else"""
+        if not hasattr(self, 'rom_prefetcher'):
+            return
+        if not game_entry:
+            self.rom_prefetcher.prefetch([])
+            return
+
+        games = [(game, game_entry)]
+        neighbours = self.mel_settings.get_prefetch_neighbours()
+        row = self.game_list.currentRow() if hasattr(self, 'game_list') else -1
+        if neighbours and row >= 0:
+            platform_games = self.available_games.get(self.current_platform, {})
+            for offset in range(1, neighbours + 1):
+                for neighbour_row in (row + offset, row - offset):
+                    name = self.game_list.game_model.game_at(neighbour_row)
+                    if name in platform_games:
+                        games.append((name, platform_games[name]))
+
+        self.rom_prefetcher.prefetch(games)
+
+
+    def _on_rom_prefetched(self, platform, game_name, rom_path): #vers 1
+        """Note in the status bar that the selected game is extracted"""
+        if platform != self.current_platform or not hasattr(self, 'game_list'):
+            return
+        if self.game_list.current_game() == game_name and hasattr(self, 'status_label'):
+            self.status_label.setText(f"Ready to launch: {game_name} (extracted)")
+
+
+    def _on_title_artwork_ready(self, game_name, platform, pixmap): #vers 1
+        """Show title artwork decoded in the background if still selected"""
+        if platform != self.current_platform or not hasattr(self, 'display_widget'):
+            return
+        if not hasattr(self, 'game_list') or self.game_list.current_game() != game_name:
+            return
+        self.display_widget.show_title_artwork(pixmap if not pixmap.isNull() else None)
+
+
     def _on_stop_emulation(self): #vers 1
         """Stop current emulation"""
         if not self.core_launcher:
@@ -2483,7 +2715,7 @@ class EmuLauncherGUI(QWidget): #vers 20
         name = re.sub(r'[\s_]+', ' ', name).strip()
         return name.lower()
 
-    def _on_port_selected(self, platform: str, game_name: str): #vers 1
+    def _on_port_selected(self, platform: str, game_name: str): #vers 2
         """Handle port selection from ports manager"""
         # Switch to selected platform
         self.current_platform = platform
@@ -2494,11 +2726,7 @@ class EmuLauncherGUI(QWidget): #vers 20
 
         # Find and select the game
         if hasattr(self, 'game_list'):
-            for i in range(self.game_list.count()):
-                item = self.game_list.item(i)
-                if item.text() == game_name:
-                    self.game_list.setCurrentRow(i)
-                    break
+            self.game_list.select_game(game_name)
 
         # Update status
         if hasattr(self, 'status_label'):
@@ -2549,25 +2777,21 @@ class EmuLauncherGUI(QWidget): #vers 20
 
         dialog.exec()
 
-    def _on_artwork_downloaded(self, game_name: str, platform: str): #vers 1
+    def _on_artwork_downloaded(self, game_name: str, platform: str): #vers 3
         """Handle artwork download completion"""
-        # Clear artwork cache
-        if hasattr(self, 'artwork_loader'):
-            self.artwork_loader.clear_cache()
+        # Cancel queued decodes and clear artwork cache
+        if hasattr(self, 'artwork_service'):
+            self.artwork_service.clear()
 
-        # Reload artwork for current game
+        # Reload artwork for current game (decoded in the background if needed)
         if game_name == self.current_rom_path.stem and platform == self.current_platform:
-            title_artwork = self.artwork_loader.get_title_artwork(game_name, platform)
+            title_artwork = self.artwork_service.request_title(game_name, platform)
             if title_artwork and hasattr(self, 'display_widget'):
                 self.display_widget.show_title_artwork(title_artwork)
 
         # Refresh game list to show new thumbnails
         if hasattr(self, 'game_list') and self.current_platform:
-            current_selection = self.game_list.currentRow()
-            # Repopulate with artwork
-            game_names = [rom.stem for rom in self.available_roms.get(self.current_platform, [])]
-            self.game_list.populate_games(game_names, self.artwork_loader, self.current_platform)
-            self.game_list.setCurrentRow(current_selection)
+            self.game_list.refresh_artwork()
 
         # Update status
         if hasattr(self, 'status_label'):
@@ -2772,7 +2996,7 @@ class EmuLauncherGUI(QWidget): #vers 20
 
         return theme_data
 
-    def _apply_theme(self): #vers 9
+    def _apply_theme(self): #vers 10
         """Apply comprehensive theme to all GUI elements with direct widget styling"""
 
         if self.app_settings and APPSETTINGS_AVAILABLE:
@@ -2846,26 +3070,26 @@ class EmuLauncherGUI(QWidget): #vers 20
             # Style game list
             if hasattr(self, 'game_list'):
                 self.game_list.setStyleSheet(f"""
-                    QListWidget {{
+                    QListView {{
                         background-color: {bg_primary} !important;
                         color: {text_primary} !important;
                         border: 1px solid {border} !important;
                         border-radius: 4px;
                         padding: 2px;
                     }}
-                    QListWidget::item {{
+                    QListView::item {{
                         padding: 5px;
                         border-radius: 3px;
                         color: {text_primary} !important;
                     }}
-                    QListWidget::item:alternate {{
+                    QListView::item:alternate {{
                         background-color: {panel_bg_alt} !important;
                     }}
-                    QListWidget::item:selected {{
+                    QListView::item:selected {{
                         background-color: {accent} !important;
                         color: #FFFFFF !important;
                     }}
-                    QListWidget::item:hover {{
+                    QListView::item:hover {{
                         background-color: {accent_hover} !important;
                     }}
                 """)
@@ -2973,7 +3197,7 @@ class EmuLauncherGUI(QWidget): #vers 20
             for btn in self.display_widget.findChildren(QPushButton):
                 btn.setStyleSheet(button_style)
 
-    def _apply_theme_not_found(self): #vers 5
+    def _apply_theme_not_found(self): #vers 6
         """Apply theme to all GUI elements - comprehensive styling"""
 
         if self.app_settings and APPSETTINGS_AVAILABLE:
@@ -3084,7 +3308,7 @@ class EmuLauncherGUI(QWidget): #vers 20
                 }}
 
                 /* Lists */
-                QListWidget {{
+                QListWidget, GameListWidget {{
                     background-color: {bg_primary};
                     alternate-background-color: {bg_secondary};
                     border: 1px solid {border};
@@ -3094,17 +3318,17 @@ class EmuLauncherGUI(QWidget): #vers 20
                     selection-color: {selection_text};
                 }}
 
-                QListWidget::item {{
+                QListWidget::item, GameListWidget::item {{
                     padding: 5px;
                     border-bottom: 1px solid {bg_tertiary};
                 }}
 
-                QListWidget::item:selected {{
+                QListWidget::item:selected, GameListWidget::item:selected {{
                     background-color: {selection_bg};
                     color: {selection_text};
                 }}
 
-                QListWidget::item:hover {{
+                QListWidget::item:hover, GameListWidget::item:hover {{
                     background-color: {accent_primary};
                 }}
 
@@ -3521,10 +3745,14 @@ class EmuLauncherGUI(QWidget): #vers 20
                 self.display_widget.stop_btn.setIcon(SVGIconFactory.stop_icon(20, icon_color))
                 self.display_widget.stop_btn.repaint()
 
-    def _open_mel_settings(self): #vers 2
+    def _open_mel_settings(self): #vers 3
         """Open MEL settings dialog for path configuration"""
         dialog = MELSettingsDialog(self.mel_settings, self)
         if dialog.exec():
+            # Emulator preferences and paths may have changed
+            if self.core_launcher:
+                self.core_launcher.invalidate_launch_plans()
+
             # Settings saved, refresh platforms with new ROM path
             self._refresh_platforms()
             
@@ -3535,10 +3763,12 @@ class EmuLauncherGUI(QWidget): #vers 20
             if hasattr(self, 'status_label'):
                 self.status_label.setText("Settings saved - platforms refreshed")
 
-    def _open_settings_dialog(self): #vers 1
+    def _open_settings_dialog(self): #vers 2
         """Open settings dialog and refresh on save"""
         dialog = SettingsDialog(self.mel_settings, self)
         if dialog.exec():
+            if self.core_launcher:
+                self.core_launcher.invalidate_launch_plans()
             # Refresh platform list with new ROM path
             self._scan_platforms()
             self.status_label.setText("Settings saved - platforms refreshed")
@@ -3675,7 +3905,7 @@ class EmuLauncherGUI(QWidget): #vers 20
         # Show menu at global position
         menu.exec(self.mapToGlobal(pos))
 
-    def _scan_roms(self): #vers 2
+    def _scan_roms(self): #vers 3
         """Scan for ROMs in configured directory with option to browse"""
         from PyQt6.QtWidgets import QMessageBox, QFileDialog, QProgressDialog
         from pathlib import Path
@@ -3717,17 +3947,13 @@ class EmuLauncherGUI(QWidget): #vers 20
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setValue(10)
 
-        # Update scanner with current path
-        self.platform_scanner = PlatformScanner(roms_dir)
         progress.setValue(30)
 
-        # Scan platforms
-        discovered_platforms = self.platform_scanner.scan_platforms()
+        # Rescan through the shared session - GameScanner, RomLoader and
+        # CoreLauncher hold the same platforms dict and pick up the result
+        discovered_platforms = self.scan_session.refresh(roms_dir)
+        self.platform_scanner = self.scan_session.platform_scanner
         progress.setValue(60)
-        
-        # Update CoreLauncher with new platform database
-        if self.core_launcher and discovered_platforms:
-            self.core_launcher.update_database(discovered_platforms)
 
         if discovered_platforms:
             # Count total ROMs
@@ -3834,7 +4060,7 @@ class EmuLauncherGUI(QWidget): #vers 20
             QMessageBox.warning(self, "Error", f"Could not open folder:\n{e}")
 
 
-    def _show_game_manager(self): #vers 1
+    def _show_game_manager(self): #vers 2
         """Show game manager dialog for current platform"""
         if not self.current_platform:
             QMessageBox.warning(
@@ -3854,7 +4080,10 @@ class EmuLauncherGUI(QWidget): #vers 20
             return
 
         # Get game names
-        game_names = [rom.stem for rom in self.available_roms[self.current_platform]]
+        if self.current_platform in self.available_games:
+            game_names = list(self.available_games[self.current_platform])
+        else:
+            game_names = [rom.stem for rom in self.available_roms[self.current_platform]]
 
         if not game_names:
             QMessageBox.information(
@@ -5249,8 +5478,13 @@ class EmuLauncherGUI(QWidget): #vers 20
         else:
             self.showMaximized()
 
-    def closeEvent(self, event): #vers 1
+    def closeEvent(self, event): #vers 3
         """Handle close event"""
+        if hasattr(self, 'rom_prefetcher'):
+            self.rom_prefetcher.shutdown()
+        if self.rom_loader:
+            # Frees RAM-backed extractions as well
+            self.rom_loader.cleanup()
         self.window_closed.emit()
         event.accept()
 
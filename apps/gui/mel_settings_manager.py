@@ -1,5 +1,5 @@
 # X-Seti - November27 2025 - Multi-Emulator Launcher - Settings Path Manager
-# This file goes in /apps/gui/mel_settings_manager.py - Version: 4
+# This file goes in /apps/gui/mel_settings_manager.py - Version: 9
 """
 MEL Settings Manager - Handles MEL-specific settings
 - Directory paths (ROMs, BIOS, cores, saves, cache)
@@ -7,6 +7,10 @@ MEL Settings Manager - Handles MEL-specific settings
 - Emulator preferences per platform
 - Debug settings (enabled, level)
 - Themed titlebar toggle
+- Artwork cache memory budget
+- Extraction cache disk budget
+- Number of neighbouring games to extract ahead
+- RAM budget for temporary extractions
 """
 
 from pathlib import Path
@@ -16,13 +20,18 @@ import subprocess
 ##Methods list -
 # __init__
 # add_rom_path
+# get_artwork_cache_mb
 # get_bios_path
 # get_cache_path
 # get_core_path
 # get_debug_enabled
 # get_debug_level
 # get_emulator_for_platform
+# get_extraction_cache_dedupe
+# get_extraction_cache_mb
 # get_icon_display_mode
+# get_prefetch_neighbours
+# get_ram_extraction_mb
 # get_rom_path
 # get_rom_paths
 # get_save_path
@@ -30,20 +39,25 @@ import subprocess
 # remove_rom_path
 # save_mel_settings
 # scan_installed_emulators
+# set_artwork_cache_mb
 # set_bios_path
 # set_cache_path
 # set_core_path
 # set_debug_enabled
 # set_debug_level
 # set_emulator_for_platform
+# set_extraction_cache_dedupe
+# set_extraction_cache_mb
 # set_icon_display_mode
+# set_prefetch_neighbours
+# set_ram_extraction_mb
 # set_rom_path
 # set_rom_paths
 # set_save_path
 # set_themed_titlebar
 # _load_settings
 
-class MELSettingsManager: #vers 4
+class MELSettingsManager: #vers 9
     """Manages all MEL-specific settings"""
     
     def __init__(self, settings_file="mel_settings.json"): #vers 4
@@ -103,7 +117,7 @@ class MELSettingsManager: #vers 4
             'mame': ['Arcade', 'MAME'],
         }
     
-    def _load_settings(self): #vers 4
+    def _load_settings(self): #vers 9
         """Load MEL settings from file"""
         defaults = {
             'rom_paths': ['roms'],
@@ -115,6 +129,11 @@ class MELSettingsManager: #vers 4
             'use_themed_titlebar': True,
             'debug_enabled': False,
             'debug_level': 'INFO',
+            'artwork_cache_mb': 256,  # memory budget for cached artwork
+            'extraction_cache_mb': 10240,  # disk budget for extracted archives
+            'extraction_cache_dedupe': False,  # key extractions by archive contents
+            'prefetch_neighbours': 0,  # games either side of the selection to extract ahead
+            'ram_extraction_mb': 0,  # /dev/shm budget for temporary extractions (0 = disk only)
             'emulator_preferences': {}  # platform -> emulator_name mapping
         }
         
@@ -229,6 +248,30 @@ class MELSettingsManager: #vers 4
         """Get themed titlebar preference"""
         return self.settings.get('use_themed_titlebar', True)
     
+    def get_artwork_cache_mb(self): #vers 1
+        """Get artwork cache memory budget in MB"""
+        return int(self.settings.get('artwork_cache_mb', 256))
+    
+    def get_extraction_cache_dedupe(self): #vers 1
+        """Get whether identical archives share one extraction"""
+        return bool(self.settings.get('extraction_cache_dedupe', False))
+    
+    def get_extraction_cache_mb(self): #vers 1
+        """Get extracted archive cache disk budget in MB (0 = unlimited)"""
+        return int(self.settings.get('extraction_cache_mb', 10240))
+    
+    def get_prefetch_neighbours(self): #vers 1
+        """Get how many games either side of the selection are extracted ahead"""
+        return max(0, int(self.settings.get('prefetch_neighbours', 0)))
+    
+    def get_ram_extraction_mb(self): #vers 1
+        """Get the RAM budget for temporary extractions in MB (0 = disk only)
+        
+        Used when launching archives of platforms with zip_support 'extract'
+        that do not cache their extractions.
+        """
+        return max(0, int(self.settings.get('ram_extraction_mb', 0)))
+    
     # Debug settings
     def get_debug_enabled(self): #vers 1
         """Get debug mode enabled status"""
@@ -330,6 +373,31 @@ class MELSettingsManager: #vers 4
         self.settings['use_themed_titlebar'] = bool(enabled)
         self.save_mel_settings()
     
+    def set_artwork_cache_mb(self, megabytes): #vers 1
+        """Set artwork cache memory budget in MB"""
+        self.settings['artwork_cache_mb'] = max(16, int(megabytes))
+        self.save_mel_settings()
+    
+    def set_extraction_cache_dedupe(self, enabled): #vers 1
+        """Set whether identical archives share one extraction"""
+        self.settings['extraction_cache_dedupe'] = bool(enabled)
+        self.save_mel_settings()
+    
+    def set_extraction_cache_mb(self, megabytes): #vers 1
+        """Set extracted archive cache disk budget in MB (0 = unlimited)"""
+        self.settings['extraction_cache_mb'] = max(0, int(megabytes))
+        self.save_mel_settings()
+    
+    def set_prefetch_neighbours(self, count): #vers 1
+        """Set how many games either side of the selection are extracted ahead"""
+        self.settings['prefetch_neighbours'] = max(0, int(count))
+        self.save_mel_settings()
+    
+    def set_ram_extraction_mb(self, megabytes): #vers 1
+        """Set the RAM budget for temporary extractions in MB (0 = disk only)"""
+        self.settings['ram_extraction_mb'] = max(0, int(megabytes))
+        self.save_mel_settings()
+    
     # Debug setters
     def set_debug_enabled(self, enabled): #vers 1
         """Set debug mode enabled"""
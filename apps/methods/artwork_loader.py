@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/methods/artwork_loader.py - Version: 1
+#this belongs in apps/methods/artwork_loader.py - Version: 6
 # X-Seti - November22 2025 - Multi-Emulator Launcher - Artwork Loader
 
 """
@@ -15,21 +15,30 @@ from PyQt6.QtGui import QPainter
 
 # Around line 30, add after self.generic_icon = ...
 from apps.methods.retroarch_artwork import RetroArchArtwork
+from apps.methods.lru_cache import ByteLRUCache, MISSING
+from apps.methods.thumbnail_cache import ThumbnailCache
 
 ##Methods list -
 # __init__
+# _icon_key
+# _title_key
+# cache_stats
 # get_game_icon
 # get_generic_icon
 # get_title_artwork
 
-class ArtworkLoader: #vers 1
+class ArtworkLoader: #vers 6
     """Loads and caches game artwork"""
     
-    def __init__(self, artwork_dir=None): #vers 1
+    def __init__(self, artwork_dir=None, cache_budget_bytes=256 * 1024 * 1024, thumbnail_dir=None): #vers 4
         """Initialize artwork loader
         
         Args:
             artwork_dir: Path to artwork directory (defaults to ./artwork)
+            cache_budget_bytes: Memory budget shared by the icon, title and
+                                RetroArch path caches (LRU eviction)
+            thumbnail_dir: On-disk cache of pre-scaled icons
+                           (defaults to ./cache/thumbnails)
         """
         if artwork_dir is None:
             artwork_dir = Path.cwd() / "artwork"
@@ -37,38 +46,58 @@ class ArtworkLoader: #vers 1
         self.artwork_dir = Path(artwork_dir)
         self.artwork_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache for loaded pixmaps
-        self.icon_cache = {}
-        self.title_cache = {}
+        # One byte-bounded LRU for loaded pixmaps - icon and title keys
+        # never collide, so both names point at the same cache
+        self.cache = ByteLRUCache(cache_budget_bytes)
+        self.icon_cache = self.cache
+        self.title_cache = self.cache
+        
+        # Pre-scaled icons on disk, survive restarts
+        self.thumbnail_cache = ThumbnailCache(thumbnail_dir)
 
-        # Generic icon (SVG-based)
+        # Generic icon (SVG-based) - one per size, shared by every game
+        # without artwork and kept out of the byte budget
         self.generic_icon = self._create_generic_icon()
-        self.retroarch = RetroArchArtwork()
+        self._generic_icons = {64: self.generic_icon}
+        self.retroarch = RetroArchArtwork(cache=self.cache)
         if self.retroarch.thumbnails_dir:
             from apps.utils.debug_logger import info
             info(f"RetroArch artwork enabled: {self.retroarch.thumbnails_dir}", "ARTWORK")
 
-    def _find_artwork_file(self, game_name, platform, subdir): #vers 2
-        """Find artwork file - checks RetroArch first, then local"""
-
+    def _find_artwork_file(self, game_name, platform, subdir): #vers 3
+        """Find artwork file - checks RetroArch first, then local
+        
+        Searches for artwork in:
+        - RetroArch thumbnails (Named_Boxarts / Named_Titles)
+        - artwork/[platform]/[subdir]/[game_name].png/.jpg/...
+        - artwork/[game_name].png/.jpg/... (backwards compatibility)
+        
+        Args:
+            game_name: Name of the game
+            platform: Platform name
+            subdir: Subdirectory ("thumbnails" or "titles")
+            
+        Returns:
+            Path to artwork file or None
+        """
         # Try RetroArch artwork first
         if self.retroarch and self.retroarch.thumbnails_dir:
             artwork_type = 'Named_Boxarts' if subdir == 'thumbnails' else 'Named_Titles'
             retroarch_artwork = self.retroarch.get_game_artwork(platform, game_name, artwork_type)
             if retroarch_artwork:
                 return retroarch_artwork
-
+        
         # Fall back to local artwork
         clean_name = game_name.replace(" ", "_").replace(":", "").replace("/", "_")
-        platform_dir = self.artwork_dir / platform / subdir
-
-        for ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif']:
-            artwork_file = platform_dir / f"{clean_name}{ext}"
-            if artwork_file.exists():
-                return artwork_file
-
+        
+        for search_dir in (self.artwork_dir / platform / subdir, self.artwork_dir):
+            for ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif']:
+                artwork_file = search_dir / f"{clean_name}{ext}"
+                if artwork_file.exists():
+                    return artwork_file
+        
         return None
-
+    
     def _create_generic_icon(self, size=64): #vers 1
         """Create generic game controller icon for missing artwork
         
@@ -97,7 +126,15 @@ class ArtworkLoader: #vers 1
         
         return QIcon(pixmap)
     
-    def get_game_icon(self, game_name, platform, size=64): #vers 1
+    def _icon_key(self, game_name, platform, size=64): #vers 1
+        """Cache key for a game icon (shared with ArtworkService)"""
+        return f"{platform}/{game_name}_{size}"
+    
+    def _title_key(self, game_name, platform): #vers 1
+        """Cache key for title artwork (shared with ArtworkService)"""
+        return f"{platform}/{game_name}_title"
+    
+    def get_game_icon(self, game_name, platform, size=64): #vers 5
         """Get game icon (64x64 thumbnail) for game list
         
         Args:
@@ -108,33 +145,29 @@ class ArtworkLoader: #vers 1
         Returns:
             QIcon - either loaded artwork or generic icon
         """
-        cache_key = f"{platform}/{game_name}_{size}"
+        cache_key = self._icon_key(game_name, platform, size)
         
         # Check cache first
-        if cache_key in self.icon_cache:
-            return self.icon_cache[cache_key]
+        icon = self.icon_cache.get(cache_key, MISSING)
+        if icon is not MISSING:
+            # None marks a game known to have no artwork
+            return icon if icon is not None else self.get_generic_icon(size)
         
         # Try to find artwork file
         artwork_path = self._find_artwork_file(game_name, platform, "thumbnails")
         
         if artwork_path and artwork_path.exists():
-            # Load the artwork
-            pixmap = QPixmap(str(artwork_path))
-            if not pixmap.isNull():
-                # Scale to requested size maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    size, size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                icon = QIcon(scaled_pixmap)
+            # Load the pre-scaled thumbnail (decoded and stored on first use)
+            image = self.thumbnail_cache.get_image(artwork_path, size)
+            if not image.isNull():
+                icon = QIcon(QPixmap.fromImage(image))
                 self.icon_cache[cache_key] = icon
                 return icon
         
         # Return generic icon if artwork not found
         return self.generic_icon
     
-    def get_title_artwork(self, game_name, platform): #vers 1
+    def get_title_artwork(self, game_name, platform): #vers 3
         """Get full-size title artwork for display panel
         
         Args:
@@ -144,11 +177,12 @@ class ArtworkLoader: #vers 1
         Returns:
             QPixmap - title artwork or None if not found
         """
-        cache_key = f"{platform}/{game_name}_title"
+        cache_key = self._title_key(game_name, platform)
         
         # Check cache first
-        if cache_key in self.title_cache:
-            return self.title_cache[cache_key]
+        pixmap = self.title_cache.get(cache_key, MISSING)
+        if pixmap is not MISSING:
+            return pixmap
         
         # Try to find title artwork
         artwork_path = self._find_artwork_file(game_name, platform, "titles")
@@ -161,43 +195,8 @@ class ArtworkLoader: #vers 1
         
         return None
     
-    def _find_artwork_file(self, game_name, platform, subdir): #vers 1
-        """Find artwork file for game
-        
-        Searches for artwork in:
-        - artwork/[platform]/[subdir]/[game_name].png
-        - artwork/[platform]/[subdir]/[game_name].jpg
-        
-        Args:
-            game_name: Name of the game
-            platform: Platform name  
-            subdir: Subdirectory ("thumbnails" or "titles")
-            
-        Returns:
-            Path to artwork file or None
-        """
-        # Clean game name for filename
-        clean_name = game_name.replace(" ", "_").replace(":", "").replace("/", "_")
-        
-        # Check platform-specific directories
-        platform_dir = self.artwork_dir / platform / subdir
-        
-        # Try common image extensions
-        for ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif']:
-            artwork_file = platform_dir / f"{clean_name}{ext}"
-            if artwork_file.exists():
-                return artwork_file
-        
-        # Also check root level (backwards compatibility)
-        for ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif']:
-            artwork_file = self.artwork_dir / f"{clean_name}{ext}"
-            if artwork_file.exists():
-                return artwork_file
-        
-        return None
-    
-    def get_generic_icon(self, size=64): #vers 1
-        """Get generic controller icon
+    def get_generic_icon(self, size=64): #vers 2
+        """Get generic controller icon (created once per size)
         
         Args:
             size: Icon size in pixels
@@ -205,13 +204,15 @@ class ArtworkLoader: #vers 1
         Returns:
             QIcon with generic game controller
         """
-        if size == 64:
-            return self.generic_icon
-        else:
-            # Create new generic icon at requested size
-            return self._create_generic_icon(size)
+        icon = self._generic_icons.get(size)
+        if icon is None:
+            icon = self._generic_icons[size] = self._create_generic_icon(size)
+        return icon
+    
+    def clear_cache(self): #vers 2
+        """Clear artwork cache (icons, titles and RetroArch paths)"""
+        self.cache.clear()
     
-    def clear_cache(self): #vers 1
-        """Clear artwork cache"""
-        self.icon_cache.clear()
-        self.title_cache.clear()
+    def cache_stats(self): #vers 1
+        """Get artwork cache counters (entries, bytes, hits, misses, evictions)"""
+        return self.cache.stats()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/artwork_service.py - Version: 4
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Artwork Service
+
+"""
+Artwork Service - Asynchronous front end for ArtworkLoader
+Artwork files are found, decoded and scaled to QImage on a bounded
+QThreadPool. Results come back to the GUI thread through signals, where
+they are turned into QIcon/QPixmap and stored in the ArtworkLoader caches.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, Qt
+from PyQt6.QtGui import QImage, QPixmap, QIcon
+from apps.methods.lru_cache import MISSING
+
+##Methods list -
+# __init__
+# cancel
+# cancel_all
+# clear
+# is_pending
+# request_icon
+# request_title
+# _on_decoded
+# _queue
+# _retire
+
+##class _DecodeSignals -
+##class _DecodeTask -
+##class ArtworkService -
+
+class _DecodeSignals(QObject): #vers 1
+    """Signals for a decode task (QRunnable cannot emit by itself)"""
+
+    # key, kind, game_name, platform, image (null QImage if not found)
+    decoded = pyqtSignal(str, str, str, str, QImage)
+
+
+class _DecodeTask(QRunnable): #vers 2
+    """Find, load and scale one artwork image off the GUI thread"""
+
+    def __init__(self, artwork_loader, key, kind, game_name, platform, size): #vers 1
+        super().__init__()
+        self.setAutoDelete(False)
+        self.artwork_loader = artwork_loader
+        self.key = key
+        self.kind = kind
+        self.game_name = game_name
+        self.platform = platform
+        self.size = size
+        self.cancelled = False
+        self.done = False
+        self.signals = _DecodeSignals()
+
+    def run(self): #vers 2
+        """Decode the artwork and emit the result"""
+        if self.cancelled:
+            self.done = True
+            return
+
+        image = QImage()
+        subdir = "thumbnails" if self.kind == "icon" else "titles"
+        try:
+            artwork_path = self.artwork_loader._find_artwork_file(self.game_name, self.platform, subdir)
+            if artwork_path and not self.cancelled:
+                if self.size:
+                    # Icons come from the on-disk thumbnail cache
+                    image = self.artwork_loader.thumbnail_cache.get_image(artwork_path, self.size)
+                else:
+                    image = QImage(str(artwork_path))
+        except Exception as e:
+            from apps.utils.debug_logger import error
+            error(f"Error decoding artwork for {self.game_name}: {e}", "ARTWORK")
+            image = QImage()
+
+        self.done = True
+        if not self.cancelled:
+            self.signals.decoded.emit(self.key, self.kind, self.game_name, self.platform, image)
+
+
+class ArtworkService(QObject): #vers 3
+    """Queues artwork requests and delivers decoded images by signal"""
+
+    icon_ready = pyqtSignal(str, str, QIcon)      # game_name, platform, icon
+    title_ready = pyqtSignal(str, str, QPixmap)   # game_name, platform, pixmap (null if none)
+
+    def __init__(self, artwork_loader, max_workers=2, parent=None): #vers 1
+        """Initialize artwork service
+
+        Args:
+            artwork_loader: ArtworkLoader that finds files and holds the caches
+            max_workers: Decode threads (kept small so scrolling stays smooth)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.artwork_loader = artwork_loader
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, max_workers))
+        self._pending = {}
+        # Cancelled tasks already running - referenced until they finish
+        self._retired = []
+
+    def request_icon(self, game_name, platform, size=64): #vers 2
+        """Get a game icon without blocking
+
+        Returns:
+            The cached icon, or the generic placeholder while the real one
+            is decoded (icon_ready is emitted when it is done)
+        """
+        key = self.artwork_loader._icon_key(game_name, platform, size)
+        icon = self.artwork_loader.icon_cache.get(key, MISSING)
+        if icon is MISSING:
+            self._queue(key, "icon", game_name, platform, size)
+        elif icon is not None:
+            return icon
+
+        # Placeholder while decoding, or for a game known to have no artwork
+        return self.artwork_loader.get_generic_icon(size)
+
+    def request_title(self, game_name, platform): #vers 2
+        """Get title artwork without blocking
+
+        Returns:
+            The cached QPixmap (None if known to be missing), or None while
+            it is decoded (title_ready is emitted when it is done)
+        """
+        key = self.artwork_loader._title_key(game_name, platform)
+        pixmap = self.artwork_loader.title_cache.get(key, MISSING)
+        if pixmap is not MISSING:
+            return pixmap
+
+        self._queue(key, "title", game_name, platform, 0)
+        return None
+
+    def is_pending(self, game_name, platform, size=64): #vers 1
+        """Check if an icon is queued or being decoded"""
+        return self.artwork_loader._icon_key(game_name, platform, size) in self._pending
+
+    def _queue(self, key, kind, game_name, platform, size): #vers 1
+        """Queue a decode task unless one is already pending for key"""
+        if key in self._pending:
+            return
+
+        task = _DecodeTask(self.artwork_loader, key, kind, game_name, platform, size)
+        task.signals.decoded.connect(self._on_decoded, Qt.ConnectionType.QueuedConnection)
+        self._pending[key] = task
+        self.pool.start(task)
+
+    def cancel(self, game_name, platform, size=64): #vers 1
+        """Cancel a queued icon request (e.g. its row scrolled off-screen)"""
+        key = self.artwork_loader._icon_key(game_name, platform, size)
+        task = self._pending.pop(key, None)
+        if task:
+            self._retire(task)
+
+    def cancel_all(self): #vers 1
+        """Cancel every queued request (e.g. on platform switch)"""
+        for task in self._pending.values():
+            self._retire(task)
+        self._pending.clear()
+
+    def _retire(self, task): #vers 1
+        """Cancel a task - drop it from the queue or keep it until it stops"""
+        task.cancelled = True
+        if not self.pool.tryTake(task):
+            self._retired.append(task)
+        self._retired = [t for t in self._retired if not t.done]
+
+    def clear(self): #vers 1
+        """Cancel pending requests and drop cached artwork"""
+        self.cancel_all()
+        self.artwork_loader.clear_cache()
+
+    def _on_decoded(self, key, kind, game_name, platform, image): #vers 2
+        """Store a decoded image in the loader caches and announce it (GUI thread)"""
+        task = self._pending.pop(key, None)
+        if task is None or task.cancelled:
+            return
+
+        if kind == "icon":
+            if image.isNull():
+                # Cache the miss as None - the shared placeholder is not
+                # charged to the byte budget once per game
+                self.artwork_loader.icon_cache[key] = None
+                icon = self.artwork_loader.get_generic_icon(task.size)
+            else:
+                icon = QIcon(QPixmap.fromImage(image))
+                self.artwork_loader.icon_cache[key] = icon
+            self.icon_ready.emit(game_name, platform, icon)
+        else:
+            pixmap = QPixmap.fromImage(image) if not image.isNull() else None
+            self.artwork_loader.title_cache[key] = pixmap
+            self.title_ready.emit(game_name, platform, pixmap if pixmap else QPixmap())
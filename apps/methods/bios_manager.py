@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/methods/bios_manager.py - Version: 1
+#this belongs in apps/methods/bios_manager.py - Version: 2
 # X-Seti - November28 2025 - Multi-Emulator Launcher - BIOS Manager
 
 """
@@ -16,14 +16,19 @@ import hashlib
 ##Methods list -
 # __init__
 # find_bios_files
+# get_bios_inventory
 # get_platform_bios_requirements
 # is_platform_bios_complete
 # get_missing_bios
 # get_bios_paths
 # get_platform_bios_info
+# invalidate_bios_inventory
 # scan_bios_directory
+# _bios_directories
+# _directory_stamps
+# _scan_bios_entries
 
-class BiosManager: #vers 1
+class BiosManager: #vers 2
     """Manages BIOS files for different platforms"""
     
     # Common BIOS directory paths
@@ -111,15 +116,51 @@ class BiosManager: #vers 1
         },
     }
     
-    def __init__(self, bios_dir: Path = None): #vers 1
+    # File types picked up as BIOS images
+    BIOS_EXTENSIONS = ('.rom', '.bin', '.img', '.iso')
+    
+    def __init__(self, bios_dir: Path = None): #vers 2
         """Initialize BIOS manager
         
         Args:
             bios_dir: Optional custom BIOS directory
         """
         self.bios_dir = Path(bios_dir) if bios_dir else None
+        # BIOS inventory snapshot - see get_bios_inventory
         self.bios_cache = {}
         
+    def _scan_bios_entries(self, bios_path: Path) -> Dict[str, Dict]:
+        """List one BIOS directory
+        
+        Args:
+            bios_path: Directory to scan
+            
+        Returns:
+            Dict of lowercase filename -> {"path", "size", "mtime"}
+        """
+        entries = {}
+        
+        try:
+            with os.scandir(bios_path) as items:
+                for item in items:
+                    if not item.name.lower().endswith(self.BIOS_EXTENSIONS):
+                        continue
+                    try:
+                        if not item.is_file():
+                            continue
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries[item.name.lower()] = {
+                        "path": Path(item.path),
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime
+                    }
+        except OSError:
+            pass
+        
+        return entries
+    
     def scan_bios_directory(self, bios_path: Path) -> Dict[str, Path]:
         """Scan a BIOS directory for available files
         
@@ -129,16 +170,58 @@ class BiosManager: #vers 1
         Returns:
             Dict of filename -> Path
         """
-        bios_files = {}
+        return {name: entry["path"] for name, entry in self._scan_bios_entries(bios_path).items()}
+    
+    def _bios_directories(self) -> List[Path]:
+        """BIOS directories in lookup order (later ones win on name clashes)"""
+        directories = [self.bios_dir] if self.bios_dir else []
+        directories.extend(self.BIOS_PATHS)
+        return directories
+    
+    def _directory_stamps(self) -> List:
+        """mtime of every BIOS directory (None if missing) - adding,
+        removing or renaming a file changes its directory's stamp"""
+        stamps = []
+        for bios_path in self._bios_directories():
+            try:
+                stamps.append(os.stat(bios_path).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return stamps
+    
+    def get_bios_inventory(self, refresh: bool = False) -> Dict[str, Dict]:
+        """Get the BIOS inventory snapshot
+        
+        Every BIOS directory is listed once; the snapshot is reused until
+        one of the directory mtimes changes, so per-platform queries during
+        a scan cost a handful of stat calls instead of full listings.
         
-        if not bios_path.exists():
-            return bios_files
+        Args:
+            refresh: Rebuild even if the directories look unchanged
             
-        for item in bios_path.iterdir():
-            if item.is_file() and item.suffix.lower() in ['.rom', '.bin', '.img', '.iso']:
-                bios_files[item.name.lower()] = item
-                
-        return bios_files
+        Returns:
+            Dict of lowercase filename -> {"path", "size", "mtime"}
+        """
+        stamps = self._directory_stamps()
+        
+        if not refresh and self.bios_cache.get("stamps") == stamps:
+            return self.bios_cache["files"]
+        
+        inventory = {}
+        for bios_path, stamp in zip(self._bios_directories(), stamps):
+            if stamp is not None:
+                inventory.update(self._scan_bios_entries(bios_path))
+        
+        self.bios_cache = {
+            "stamps": stamps,
+            "files": inventory,
+            "paths": {name: entry["path"] for name, entry in inventory.items()}
+        }
+        return inventory
+    
+    def invalidate_bios_inventory(self):
+        """Drop the BIOS inventory snapshot (next query relists directories)"""
+        self.bios_cache = {}
     
     def find_bios_files(self) -> Dict[str, Path]:
         """Find all available BIOS files in common locations
@@ -146,17 +229,8 @@ class BiosManager: #vers 1
         Returns:
             Dict of filename -> Path
         """
-        all_bios = {}
-        
-        # Use custom BIOS directory if provided
-        if self.bios_dir:
-            all_bios.update(self.scan_bios_directory(self.bios_dir))
-            
-        # Scan common BIOS paths
-        for bios_path in self.BIOS_PATHS:
-            all_bios.update(self.scan_bios_directory(bios_path))
-            
-        return all_bios
+        self.get_bios_inventory()
+        return dict(self.bios_cache["paths"])
     
     def get_platform_bios_requirements(self, platform_name: str) -> Dict:
         """Get BIOS requirements for a specific platform
@@ -219,7 +293,8 @@ class BiosManager: #vers 1
         """
         platform_name = self.normalize_platform_name(platform_name)
         requirements = self.get_platform_bios_requirements(platform_name)
-        available_bios = self.find_bios_files()
+        self.get_bios_inventory()
+        available_bios = self.bios_cache["paths"]
         
         bios_paths = {}
         
@@ -291,13 +366,14 @@ class BiosManager: #vers 1
         platform_name = self.normalize_platform_name(platform_name)
         requirements = self.get_platform_bios_requirements(platform_name)
         bios_paths = self.get_bios_paths(platform_name)
+        missing = [name for name, path in bios_paths.items() if path is None]
         
         return {
             "platform": platform_name,
             "required_files": requirements["required"],
             "available_files": {name: str(path) if path else None for name, path in bios_paths.items()},
-            "missing_files": self.get_missing_bios(platform_name),
-            "bios_complete": self.is_platform_bios_complete(platform_name),
+            "missing_files": missing,
+            "bios_complete": not missing,
             "bios_directory": str(self.bios_dir) if self.bios_dir else "auto-detected"
         }
 
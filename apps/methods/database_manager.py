@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/methods/database_manager.py - Version: 1
+#this belongs in apps/methods/database_manager.py - Version: 3
 # X-Seti - November30 2025 - Multi-Emulator Launcher - Dynamic Database Manager
 
 """
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Tuple
 import os
 import threading
 from contextlib import contextmanager
+from ..database.database_manager import fts_match_query, SEARCH_LIMIT, RANK_LIMIT
+from ..database.schema import migrate, PATHS_MIGRATIONS
 
 ##Methods list -
 # __init__
@@ -47,7 +49,7 @@ from contextlib import contextmanager
 # restore_database
 # get_database_path
 
-class DatabaseManager: #vers 1
+class DatabaseManager: #vers 3
     """Manages a comprehensive database for Game ROMs, BIOS ROMs, and editable paths"""
     
     def __init__(self, db_path: Path = None):
@@ -64,80 +66,11 @@ class DatabaseManager: #vers 1
         self._create_tables()
     
     def _create_tables(self):
-        """Create database tables if they don't exist"""
+        """Create the database tables or bring their schema up to date"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Table for ROM paths (game ROMs)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS rom_paths (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT UNIQUE NOT NULL,
-                    platform TEXT,
-                    description TEXT,
-                    enabled BOOLEAN DEFAULT 1,
-                    last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Table for BIOS paths
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS bios_paths (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT UNIQUE NOT NULL,
-                    description TEXT,
-                    enabled BOOLEAN DEFAULT 1
-                )
-            ''')
-            
-            # Table for core paths
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS core_paths (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT UNIQUE NOT NULL,
-                    description TEXT,
-                    enabled BOOLEAN DEFAULT 1
-                )
-            ''')
-            
-            # Table for game ROMs
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS game_roms (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    path TEXT NOT NULL,
-                    platform TEXT NOT NULL,
-                    size INTEGER,
-                    extension TEXT,
-                    last_modified TIMESTAMP,
-                    added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    verified BOOLEAN DEFAULT 0,
-                    checksum TEXT
-                )
-            ''')
-            
-            # Table for BIOS ROMs
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS bios_roms (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    path TEXT NOT NULL,
-                    platform TEXT,
-                    size INTEGER,
-                    required BOOLEAN DEFAULT 0,
-                    added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    verified BOOLEAN DEFAULT 0,
-                    checksum TEXT
-                )
-            ''')
-            
-            # Create indexes for better performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_roms_platform ON game_roms(platform)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_roms_extension ON game_roms(extension)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_bios_roms_platform ON bios_roms(platform)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_rom_paths_platform ON rom_paths(platform)')
-            
-            conn.commit()
+            # Migrations manage their own transactions
+            conn.isolation_level = None
+            migrate(conn, PATHS_MIGRATIONS, "Paths database")
     
     @contextmanager
     def _get_connection(self):
@@ -651,40 +584,57 @@ class DatabaseManager: #vers 1
                     return table
         return None
     
-    def search_roms(self, query: str, rom_type: str = 'both') -> List[Dict]:
-        """Search for ROMs by name
+    def search_roms(self, query: str, rom_type: str = 'both', limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """Search for ROMs by name, platform or extension
+        
+        Uses the rom_search full-text index: every word of the query matches
+        as a prefix ("mar bro" finds "Super Mario Bros"), best matches first
+        (unranked when more than RANK_LIMIT ROMs match).
         
         Args:
             query: Search query string
             rom_type: 'game', 'bios', or 'both'
+            limit: Maximum number of results
             
         Returns:
-            List of matching ROMs
+            List of matching ROMs (with a 'type' key), best match first
         """
+        match = fts_match_query(query)
+        if not match:
+            return []
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            if rom_type == 'game':
-                cursor.execute('''
-                    SELECT *, 'game' as type FROM game_roms 
-                    WHERE name LIKE ? 
-                    ORDER BY platform, name
-                ''', (f'%{query}%',))
-            elif rom_type == 'bios':
-                cursor.execute('''
-                    SELECT *, 'bios' as type FROM bios_roms 
-                    WHERE name LIKE ? 
-                    ORDER BY platform, name
-                ''', (f'%{query}%',))
-            else:  # both
-                cursor.execute('''
-                    SELECT *, 'game' as type FROM game_roms WHERE name LIKE ?
-                    UNION ALL
-                    SELECT *, 'bios' as type FROM bios_roms WHERE name LIKE ?
-                    ORDER BY platform, name
-                ''', (f'%{query}%', f'%{query}%'))
-            
-            return [dict(row) for row in cursor.fetchall()]
+            condition = "rom_search MATCH ?"
+            params = [match]
+            if rom_type in ('game', 'bios'):
+                condition += " AND rom_type = ?"
+                params.append(rom_type)
+            sql = f"SELECT rom_type, rom_id FROM rom_search WHERE {condition}"
+            
+            matches = cursor.execute(
+                f"SELECT COUNT(*) FROM (SELECT rowid FROM rom_search WHERE {condition} LIMIT ?)",
+                params + [RANK_LIMIT + 1]).fetchone()[0]
+            if matches <= RANK_LIMIT:
+                # Name hits outrank display name, platform and extension hits
+                sql += " ORDER BY bm25(rom_search, 10.0, 5.0, 2.0, 1.0)"
+            sql += " LIMIT ?"
+            params.append(limit)
+            
+            hits = cursor.execute(sql, params).fetchall()
+            
+            rows = {}
+            for hit_type, table in (('game', 'game_roms'), ('bios', 'bios_roms')):
+                ids = [hit['rom_id'] for hit in hits if hit['rom_type'] == hit_type]
+                if not ids:
+                    continue
+                placeholders = ','.join('?' * len(ids))
+                for row in cursor.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", ids):
+                    rows[(hit_type, row['id'])] = dict(row, type=hit_type)
+            
+            return [rows[(hit['rom_type'], hit['rom_id'])] for hit in hits
+                    if (hit['rom_type'], hit['rom_id']) in rows]
     
     def get_rom_stats(self) -> Dict[str, int]:
         """Get statistics about ROMs in the database
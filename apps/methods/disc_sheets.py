@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/disc_sheets.py - Version: 1
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Disc Sheets
+
+"""
+Disc Sheets
+Parses the text files that tie disc images together, so only the files a
+game boots from need to be pulled out of an archive:
+- .cue  -> FILE "track.bin" BINARY lines
+- .gdi  -> track lines: number lba type sector_size "file" offset
+- .m3u  -> one disc image (usually a .cue/.chd) per line
+Referenced names are resolved against the sheet's own directory.
+"""
+
+import shlex
+import posixpath
+from typing import Dict, List, Optional
+
+##Methods list -
+# is_sheet
+# match_member
+# parse_cue
+# parse_gdi
+# parse_m3u
+# sheet_references
+
+# Sheet extensions (playlist first - it is the preferred entry point)
+SHEET_EXTENSIONS = ['.m3u', '.cue', '.gdi']
+
+
+def _decode(data: bytes) -> str:
+    """Decode sheet text (UTF-8 with BOM, falling back to Latin-1)"""
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def is_sheet(name: str) -> bool: #vers 1
+    """Check if a file name is a cue/gdi/m3u sheet"""
+    return posixpath.splitext(name.lower())[1] in SHEET_EXTENSIONS
+
+
+def parse_cue(text: str) -> List[str]: #vers 1
+    """Get the files referenced by FILE lines of a cue sheet"""
+    files = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.upper().startswith('FILE '):
+            continue
+        rest = line[5:].strip()
+        if rest.startswith('"'):
+            end = rest.find('"', 1)
+            name = rest[1:end] if end > 0 else rest[1:]
+        else:
+            # FILE name TYPE - the type is the last word
+            name = rest.rsplit(None, 1)[0] if ' ' in rest else rest
+        if name:
+            files.append(name)
+    return files
+
+
+def parse_gdi(text: str) -> List[str]: #vers 1
+    """Get the track files of a GD-ROM .gdi sheet"""
+    files = []
+    for line in text.splitlines()[1:]:  # First line is the track count
+        try:
+            fields = shlex.split(line)
+        except ValueError:
+            fields = line.split()
+        if len(fields) >= 5:
+            files.append(fields[4])
+    return files
+
+
+def parse_m3u(text: str) -> List[str]: #vers 1
+    """Get the entries of an m3u playlist (comments and blank lines skipped)"""
+    return [line.strip() for line in text.splitlines()
+            if line.strip() and not line.strip().startswith('#')]
+
+
+def sheet_references(sheet_name: str, data: bytes) -> List[str]: #vers 1
+    """Get the paths a sheet refers to, relative to the archive/folder root
+
+    Args:
+        sheet_name: Sheet path within the archive (decides the format)
+        data: Sheet contents
+
+    Returns:
+        Referenced paths ('/' separated, in sheet order)
+    """
+    ext = posixpath.splitext(sheet_name.lower())[1]
+    text = _decode(data)
+
+    if ext == '.cue':
+        names = parse_cue(text)
+    elif ext == '.gdi':
+        names = parse_gdi(text)
+    elif ext == '.m3u':
+        names = parse_m3u(text)
+    else:
+        return []
+
+    base = posixpath.dirname(sheet_name.replace('\\', '/'))
+    references = []
+    for name in names:
+        path = posixpath.normpath(posixpath.join(base, name.replace('\\', '/')))
+        if path not in references:
+            references.append(path)
+    return references
+
+
+def match_member(reference: str, members: Dict[str, str]) -> Optional[str]: #vers 1
+    """Find the archive member a sheet reference points at
+
+    Sheets are often written on case-insensitive file systems, and some
+    store bare file names for tracks kept in a subdirectory.
+
+    Args:
+        reference: Path from sheet_references
+        members: Dict of lowercase member name -> member name
+
+    Returns:
+        Member name, or None if the archive does not hold it
+    """
+    member = members.get(reference.lower())
+    if member:
+        return member
+
+    # Fall back to a unique file name match anywhere in the archive
+    base_name = posixpath.basename(reference.lower())
+    matches = [name for lower, name in members.items() if posixpath.basename(lower) == base_name]
+    return matches[0] if len(matches) == 1 else None
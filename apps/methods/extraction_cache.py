@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/extraction_cache.py - Version: 4
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Extraction Cache
+
+"""
+Extraction Cache
+Size-bounded store for archives extracted by RomLoader (cache_extracted
+platforms). Each archive gets a directory under cache/extracted; the
+manifest (cache/extracted.db) records its source archive, main ROM, size
+and last access. The total size is kept in memory, so checking the
+budget never walks the cache. Before an archive is extracted, its
+uncompressed size is reserved and the least recently launched entries
+are deleted until it fits. Entries launched this session (pinned) are
+never evicted, since a running emulator may still be reading them.
+Entries whose archive has changed or gone are dropped on lookup and at
+startup.
+
+Entry keys never depend on the file name alone:
+- p_<hash> - full archive path + size + mtime (the default)
+- c_<hash> - SHA-256 of the archive's contents, so the same archive
+  found under several paths is extracted once (content_hash=True)
+Both also hash the platform, since the files picked from an archive
+depend on the platform's extensions.
+"""
+
+import os
+import time
+import hashlib
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..database.schema import migrate, CACHE_MIGRATIONS
+
+##Methods list -
+# __init__
+# add
+# clear
+# close
+# entry_path
+# evict
+# key_for
+# lookup
+# prepare
+# prune_stale
+# release
+# remove
+# total_size
+# _archive_digest
+# _archive_stamp
+# _delete_entry
+# _directory_size
+# _reconcile
+
+##class ExtractionCache -
+
+# Default budget when the settings do not give one
+DEFAULT_BUDGET_MB = 10240
+
+# Read size when hashing archive contents
+DIGEST_CHUNK = 1024 * 1024
+
+
+class ExtractionCache: #vers 4
+    """LRU manifest of extracted archive directories"""
+
+    def __init__(self, cache_dir, manifest_path, budget_bytes: int = DEFAULT_BUDGET_MB * 1024 * 1024,
+                 content_hash: bool = False): #vers 3
+        """Initialize extraction cache
+
+        Args:
+            cache_dir: Directory holding one subdirectory per entry
+            manifest_path: SQLite manifest file (kept outside cache_dir)
+            budget_bytes: Total size to evict down to (0 = unlimited)
+            content_hash: Key entries by archive contents (each archive is
+                          hashed once per size/mtime)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.budget_bytes = max(0, int(budget_bytes))
+        self.content_hash = content_hash
+        self.lock = threading.RLock()
+        # Entries launched this session - never evicted
+        self.pinned = set()
+        # Cache key -> bytes set aside for an extraction in progress
+        self._reserved = {}
+
+        # One connection shared by the GUI and worker threads under the lock
+        self.conn = sqlite3.connect(str(manifest_path), check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        migrate(self.conn, CACHE_MIGRATIONS, "Extraction cache")
+
+        self._total_size = 0
+        self._reconcile()
+        self.prune_stale()
+        self.evict()
+
+    def _archive_digest(self, archive_path, stamp_key: str, hash_missing: bool = True) -> Optional[str]: #vers 2
+        """Get the SHA-256 of an archive, hashing it only if its
+        path/size/mtime stamp has not been seen before (and hash_missing)"""
+        with self.lock:
+            row = self.conn.execute("SELECT digest FROM archive_digests WHERE stamp_key = ?",
+                                    (stamp_key,)).fetchone()
+        if row:
+            return row['digest']
+        if not hash_missing:
+            return None
+
+        sha256 = hashlib.sha256()
+        with open(archive_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(DIGEST_CHUNK), b""):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO archive_digests (stamp_key, archive_path, digest) "
+                              "VALUES (?, ?, ?)", (stamp_key, str(archive_path), digest))
+        return digest
+
+    def _archive_stamp(self, archive_path): #vers 1
+        """Get (size, mtime) of an archive, or None if it is gone"""
+        try:
+            stat = os.stat(archive_path)
+        except OSError:
+            return None
+        return stat.st_size, int(stat.st_mtime)
+
+    def _delete_entry(self, cache_key: str, size_bytes: int): #vers 1
+        """Delete an entry's directory and manifest row (lock held)"""
+        shutil.rmtree(self.cache_dir / cache_key, ignore_errors=True)
+        self.conn.execute("DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,))
+        self._total_size -= size_bytes
+
+    def _directory_size(self, directory) -> int: #vers 1
+        """Get the total file size below a directory"""
+        total = 0
+        pending = [str(directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+        return total
+
+    def _reconcile(self): #vers 1
+        """Match the manifest to the directories on disk
+
+        Rows whose directory is missing are dropped; directories with no
+        row (interrupted extractions, caches from older versions) are
+        deleted since their main ROM is unknown. Sets the running total.
+        """
+        with self.lock:
+            on_disk = set()
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and entry.name != 'temp':
+                        on_disk.add(entry.name)
+
+            rows = self.conn.execute("SELECT cache_key, size_bytes FROM cache_entries").fetchall()
+            known = set()
+            for row in rows:
+                if row['cache_key'] in on_disk:
+                    known.add(row['cache_key'])
+                    self._total_size += row['size_bytes']
+                else:
+                    self.conn.execute("DELETE FROM cache_entries WHERE cache_key = ?", (row['cache_key'],))
+
+            for name in on_disk - known:
+                shutil.rmtree(self.cache_dir / name, ignore_errors=True)
+
+    def add(self, cache_key: str, archive_path, main_rom, pin: bool = False) -> int: #vers 2
+        """Record a finished extraction and evict down to the budget
+
+        The entry's reservation (see prepare) is replaced by its real size.
+
+        Args:
+            cache_key: Entry directory name (from entry_path)
+            archive_path: Source archive
+            main_rom: Main ROM path, absolute or relative to the entry
+            pin: The entry is being launched - never evict it this session
+
+        Returns:
+            Size of the entry in bytes
+        """
+        entry_dir = self.entry_path(cache_key)
+        main_rom = Path(main_rom)
+        if main_rom.is_absolute():
+            main_rom = main_rom.relative_to(entry_dir)
+
+        size_bytes = self._directory_size(entry_dir)
+        stamp = self._archive_stamp(archive_path) or (None, None)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute("SELECT size_bytes FROM cache_entries WHERE cache_key = ?",
+                                    (cache_key,)).fetchone()
+            if row:
+                self._total_size -= row['size_bytes']
+            self._reserved.pop(cache_key, None)
+            if pin:
+                self.pinned.add(cache_key)
+
+            self.conn.execute('''
+                INSERT OR REPLACE INTO cache_entries
+                (cache_key, archive_path, archive_size, archive_mtime, main_rom, size_bytes, created, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (cache_key, str(archive_path), stamp[0], stamp[1], main_rom.as_posix(), size_bytes, now, now))
+            self._total_size += size_bytes
+
+            self.evict(keep=cache_key)
+
+        return size_bytes
+
+    def clear(self): #vers 1
+        """Delete every entry"""
+        with self.lock:
+            for row in self.conn.execute("SELECT cache_key, size_bytes FROM cache_entries").fetchall():
+                self._delete_entry(row['cache_key'], row['size_bytes'])
+            self._total_size = 0
+
+    def close(self): #vers 1
+        """Close the manifest"""
+        with self.lock:
+            self.conn.close()
+
+    def entry_path(self, cache_key: str) -> Path: #vers 1
+        """Get the directory of an entry"""
+        return self.cache_dir / cache_key
+
+    def evict(self, keep: Optional[str] = None) -> int: #vers 2
+        """Delete least recently used entries until the entries and the
+        reservations of extractions in progress fit the budget
+
+        Pinned entries are skipped, so the cache may stay over budget.
+
+        Args:
+            keep: Entry never evicted (the one being added)
+
+        Returns:
+            Number of entries deleted
+        """
+        if not self.budget_bytes:
+            return 0
+
+        evicted = 0
+        with self.lock:
+            if self._total_size + sum(self._reserved.values()) <= self.budget_bytes:
+                return 0
+
+            rows = self.conn.execute("SELECT cache_key, size_bytes FROM cache_entries "
+                                     "ORDER BY last_access").fetchall()
+            for row in rows:
+                if self._total_size + sum(self._reserved.values()) <= self.budget_bytes:
+                    break
+                if row['cache_key'] == keep or row['cache_key'] in self.pinned:
+                    continue
+                self._delete_entry(row['cache_key'], row['size_bytes'])
+                evicted += 1
+
+        return evicted
+
+    def key_for(self, archive_path, variant: str = "", hash_missing: bool = True) -> Optional[str]: #vers 2
+        """Get the entry key of an archive
+
+        Args:
+            archive_path: Archive file
+            variant: Anything else the extracted files depend on (the
+                     platform name)
+            hash_missing: With content hashing, hash an archive whose
+                          digest is not known yet (False returns None)
+
+        Returns:
+            p_<hash> of path + size + mtime, or c_<hash> of the contents
+            when content hashing is on
+        """
+        archive_path = os.path.abspath(archive_path)
+        stat = os.stat(archive_path)
+        stamp = f"{archive_path}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        stamp_key = hashlib.sha1(stamp.encode('utf-8', 'surrogateescape')).hexdigest()
+
+        if self.content_hash:
+            digest = self._archive_digest(archive_path, stamp_key, hash_missing)
+            if digest is None:
+                return None
+            return "c_" + hashlib.sha1(f"{variant}\0{digest}".encode('utf-8')).hexdigest()[:32]
+
+        return "p_" + hashlib.sha1(f"{variant}\0{stamp_key}".encode('utf-8')).hexdigest()[:32]
+
+    def lookup(self, cache_key: str, pin: bool = False) -> Optional[str]: #vers 3
+        """Get the cached main ROM of an entry and mark it used
+
+        An entry whose main ROM is missing, or (path keys only) whose
+        archive changed or disappeared, is deleted. Content-keyed entries
+        stay valid whichever copy of the archive they came from.
+
+        Args:
+            cache_key: Entry key (from key_for)
+            pin: The entry is being launched - never evict it this session
+
+        Returns:
+            Absolute path of the main ROM, or None on a miss
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM cache_entries WHERE cache_key = ?",
+                                    (cache_key,)).fetchone()
+            if not row:
+                return None
+
+            main_rom = self.entry_path(cache_key) / row['main_rom']
+            stale = (not cache_key.startswith('c_') and
+                     self._archive_stamp(row['archive_path']) != (row['archive_size'], row['archive_mtime']))
+            if stale or not main_rom.is_file():
+                self._delete_entry(cache_key, row['size_bytes'])
+                return None
+
+            self.conn.execute("UPDATE cache_entries SET last_access = ? WHERE cache_key = ?",
+                              (time.time(), cache_key))
+            if pin:
+                self.pinned.add(cache_key)
+            return str(main_rom)
+
+    def prepare(self, cache_key: str, reserve_bytes: int = 0) -> Path: #vers 2
+        """Get an empty directory to extract an entry into
+
+        Anything already there (an old or partial extraction) is removed.
+        reserve_bytes is set aside until add or release, and older entries
+        are evicted to make room for it before anything is written.
+
+        Args:
+            cache_key: Entry key (from key_for)
+            reserve_bytes: Most the extraction can write (uncompressed
+                           archive size)
+        """
+        with self.lock:
+            self.remove(cache_key)
+            self._reserved[cache_key] = max(0, int(reserve_bytes))
+            self.evict(keep=cache_key)
+        entry_dir = self.entry_path(cache_key)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        return entry_dir
+
+    def prune_stale(self) -> int: #vers 2
+        """Delete path-keyed entries whose source archive changed or
+        disappeared, and digests of archives that are gone
+
+        Returns:
+            Number of entries deleted
+        """
+        pruned = 0
+        with self.lock:
+            rows = self.conn.execute('''
+                SELECT cache_key, archive_path, archive_size, archive_mtime, size_bytes
+                FROM cache_entries WHERE cache_key NOT LIKE 'c\\_%' ESCAPE '\\'
+            ''').fetchall()
+            for row in rows:
+                if self._archive_stamp(row['archive_path']) != (row['archive_size'], row['archive_mtime']):
+                    self._delete_entry(row['cache_key'], row['size_bytes'])
+                    pruned += 1
+
+            # A changed archive gets a new stamp key, so only missing ones matter
+            for row in self.conn.execute("SELECT stamp_key, archive_path FROM archive_digests").fetchall():
+                if not os.path.exists(row['archive_path']):
+                    self.conn.execute("DELETE FROM archive_digests WHERE stamp_key = ?", (row['stamp_key'],))
+
+        return pruned
+
+    def release(self, cache_key: str): #vers 1
+        """Drop the reservation of an extraction that failed or was cancelled"""
+        with self.lock:
+            self._reserved.pop(cache_key, None)
+
+    def remove(self, cache_key: str) -> bool: #vers 1
+        """Delete one entry
+
+        Returns:
+            True if the entry existed
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT size_bytes FROM cache_entries WHERE cache_key = ?",
+                                    (cache_key,)).fetchone()
+            if not row:
+                return False
+            self._delete_entry(cache_key, row['size_bytes'])
+            return True
+
+    @property
+    def total_size(self) -> int: #vers 1
+        """Total size of all entries in bytes (kept up to date, not measured)"""
+        return self._total_size
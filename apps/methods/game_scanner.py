@@ -1,30 +1,45 @@
 # X-Seti - November28 2025 - Multi-Emulator Launcher - Game Scanner
-# This belongs in methods/game_scanner.py - Version: 3
+# This belongs in methods/game_scanner.py - Version: 7
 """
 Game Scanner - Scans ROM directories, handles ZIP/7Z/RAR files, multi-disk games, and folder structures.
 Enhanced to work with dynamic core detection and BIOS management.
 """
 
 ##Methods list -
+# _archive_entry
+# _archive_scanner
 # _clean_name
 # _create_game_entry
 # _detect_multidisk
+# _game_row
 # _group_multidisk_games
 # _is_valid_rom
+# _platform_id
+# _platform_path
+# _platform_stamp
 # _scan_7z
 # _scan_folder
+# _scan_item
 # _scan_rar
 # _scan_zip
 # discover_platforms
+# get_launch_path
+# iter_platform_games
+# iter_stored_games
+# load_platform_games
+# read_archive_members
 # scan_platform
 # scan_platform_with_bios_info
+# store_platform_games
 
 import os
 import zipfile
 import re
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from .bios_manager import BiosManager
+from ..database.database_manager import DatabaseManager
 
 try:
     import py7zr
@@ -41,17 +56,117 @@ except ImportError:
     print("Warning: rarfile not installed. .rar support disabled.")
 
 
-class GameScanner: #vers 3
-    def __init__(self, config, platforms): #vers 3
+def read_archive_members(archive_path): #vers 1
+    """List the files inside a ZIP/7Z/RAR archive
+    
+    Module level so it can run in a thread or process pool worker.
+    
+    Args:
+        archive_path: Path to the archive
+        
+    Returns:
+        List of [name, uncompressed_size, crc32] per file, or None if the
+        archive cannot be read
+    """
+    archive_path = Path(archive_path)
+    suffix = archive_path.suffix.lower()
+    
+    try:
+        if suffix == '.zip':
+            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+                return [[info.filename, info.file_size, info.CRC]
+                        for info in zip_ref.infolist() if not info.is_dir()]
+        
+        if suffix == '.7z' and SEVENZ_AVAILABLE:
+            with py7zr.SevenZipFile(archive_path, 'r') as archive:
+                return [[info.filename, info.uncompressed, info.crc32]
+                        for info in archive.list() if not info.is_directory]
+        
+        if suffix == '.rar' and RAR_AVAILABLE:
+            with rarfile.RarFile(archive_path, 'r') as archive:
+                return [[info.filename, info.file_size, info.CRC]
+                        for info in archive.infolist() if not info.isdir()]
+    except Exception as e:
+        print(f"Error scanning {suffix[1:].upper()} {archive_path}: {e}")
+    
+    return None
+
+
+class GameScanner: #vers 7
+    # Archive suffix -> entry type, peeked through the worker pool
+    ARCHIVE_TYPES = {'.zip': 'zip', '.7z': '7z', '.rar': 'rar'}
+    
+    # Game rows written per add_games_bulk call when storing a scan
+    GAME_BATCH_SIZE = 1000
+
+    def __init__(self, config, platforms, db_manager=None): #vers 5
         self.config = config
         self.platforms = platforms
         self.rom_path = Path(config['rom_path'])
         self.bios_manager = BiosManager()
+        # Archive member listings are cached here, keyed by (path, size, mtime)
+        self.db_manager = db_manager or DatabaseManager()
         
         self.skip_extensions = [
             '.txt', '.nfo', '.jpg', '.png', '.gif', '.pdf', 
             '.diz', '.doc', '.rtf', '.md', '.html'
         ]
+        
+        # Archive peeking pool: 'archive_workers' <= 1 scans serially,
+        # 'archive_pool' is 'thread' (default) or 'process'
+        self.archive_workers = int(config.get('archive_workers', min(8, os.cpu_count() or 1)))
+        self.archive_pool = config.get('archive_pool', 'thread')
+    
+    def _archive_entry(self, archive_path, archive_type, members, platform_name, extensions): #vers 3
+        """Build a game entry from an archive member listing
+        
+        Args:
+            archive_path: Path to the archive
+            archive_type: 'zip', '7z' or 'rar'
+            members: List of [name, size, crc] from read_archive_members
+            platform_name: Platform the archive belongs to
+            extensions: Valid ROM extensions for the platform
+            
+        Returns:
+            Game entry dict, or None if the archive holds no ROMs
+        """
+        rom_files = [member[0] for member in members if self._is_valid_rom(member[0], extensions)]
+        
+        if not rom_files and {ext.lower() for ext in extensions} <= set(self.ARCHIVE_TYPES):
+            # Platform extensions come from loose files - a folder of archives
+            # only lists '.zip' etc, so take any member that is not junk
+            rom_files = [member[0] for member in members
+                         if os.path.splitext(member[0].lower())[1] not in self.skip_extensions + ['']]
+        
+        if not rom_files:
+            return None
+        
+        disk_files = self._detect_multidisk(rom_files)
+        
+        game_name = archive_path.stem
+        
+        return {
+            'name': game_name,
+            'display_name': self._clean_name(game_name),
+            'type': archive_type,
+            'path': str(archive_path),
+            'platform': platform_name,
+            'file_count': len(rom_files),
+            'disk_count': len(disk_files) if disk_files else 0,
+            'disks': disk_files if disk_files else [str(archive_path)],
+            'rom_files': rom_files
+        }
+    
+    def _archive_scanner(self, item): #vers 1
+        """Get the peek method for an archive file, or None if not an archive"""
+        suffix = item.suffix.lower()
+        if suffix == '.zip':
+            return self._scan_zip
+        if suffix == '.7z':
+            return self._scan_7z
+        if suffix == '.rar':
+            return self._scan_rar
+        return None
     
     def _clean_name(self, name): #vers 1
         """Clean up game name for display"""
@@ -111,6 +226,41 @@ class GameScanner: #vers 3
         
         return None
     
+    def _game_row(self, game, platform_id): #vers 4
+        """Build the games table row for a game entry
+        
+        Args:
+            game: Game entry dict
+            platform_id: Platform row id
+            
+        Returns:
+            Row dict for DatabaseManager.add_games_bulk
+        """
+        disk_count = game.get('disk_count', 0)
+        
+        try:
+            stat = os.stat(game['path'])
+            file_size = stat.st_size if game['type'] != 'folder' else 0
+            mtime_ns = stat.st_mtime_ns
+        except OSError:
+            file_size = 0
+            mtime_ns = None
+        
+        return {
+            'platform_id': platform_id,
+            'name': game['name'],
+            'display_name': game.get('display_name'),
+            'game_type': game['type'],
+            'file_path': game['path'],
+            'file_size': file_size,
+            'mtime_ns': mtime_ns,
+            'file_hash': game.get('hash'),
+            'is_multidisk': 1 if disk_count > 1 else 0,
+            'total_disks': disk_count if disk_count > 1 else None,
+            'disks': game.get('disks'),
+            'rom_files': game.get('rom_files')
+        }
+    
     def _group_multidisk_games(self, games): #vers 1
         """Group games that are split across multiple files"""
         disk_pattern = re.compile(
@@ -171,38 +321,41 @@ class GameScanner: #vers 3
         
         return ext in extensions
     
-    def _scan_7z(self, archive_path, platform_name, extensions): #vers 1
-        """Peek inside 7Z to get game information"""
-        if not SEVENZ_AVAILABLE:
-            return None
+    def _platform_id(self, platform_name): #vers 1
+        """Get the platforms row id, adding the platform if it is not stored yet"""
+        platform = self.db_manager.get_platform(platform_name)
+        if platform:
+            return platform['id']
         
-        try:
-            with py7zr.SevenZipFile(archive_path, 'r') as archive:
-                contents = archive.getnames()
-                
-                rom_files = [f for f in contents if self._is_valid_rom(f, extensions)]
-                
-                if not rom_files:
-                    return None
-                
-                disk_files = self._detect_multidisk(rom_files)
-                
-                game_name = archive_path.stem
-                
-                return {
-                    'name': game_name,
-                    'display_name': self._clean_name(game_name),
-                    'type': '7z',
-                    'path': str(archive_path),
-                    'platform': platform_name,
-                    'file_count': len(rom_files),
-                    'disk_count': len(disk_files) if disk_files else 0,
-                    'disks': disk_files if disk_files else [str(archive_path)],
-                    'rom_files': rom_files
-                }
-        except Exception as e:
-            print(f"Error scanning 7Z {archive_path}: {e}")
+        return self.db_manager.upsert_platforms_bulk([{
+            'name': platform_name,
+            'rom_directory': str(self._platform_path(platform_name))
+        }])[platform_name]
+    
+    def _platform_path(self, platform_name): #vers 1
+        """Get a platform's ROM folder - the scanned path, else rom_path/platform"""
+        platform_config = self.platforms.get(platform_name) or {}
+        if platform_config.get('path'):
+            return Path(platform_config['path'])
+        return self.rom_path / platform_name
+    
+    def _platform_stamp(self, platform_name): #vers 3
+        """Get the platform's directory stamp from the scan index
+        
+        Read from the database, not the filesystem - it changes when the
+        platform scan (startup or Refresh) records a changed directory
+        anywhere in the platform tree, folder games and disc subfolders
+        included. None (always rescan) if the platform is not indexed or a
+        directory was indexed with a racy stamp.
+        """
+        return self.db_manager.get_scan_stamp(platform_name)
+    
+    def _scan_7z(self, archive_path, platform_name, extensions): #vers 2
+        """Peek inside 7Z to get game information"""
+        members = read_archive_members(archive_path)
+        if members is None:
             return None
+        return self._archive_entry(archive_path, '7z', members, platform_name, extensions)
     
     def _scan_folder(self, folder_path, platform_name, extensions): #vers 1
         """Scan folder-based game"""
@@ -233,68 +386,19 @@ class GameScanner: #vers 3
             'rom_files': rom_files
         }
     
-    def _scan_rar(self, archive_path, platform_name, extensions): #vers 1
+    def _scan_rar(self, archive_path, platform_name, extensions): #vers 2
         """Peek inside RAR to get game information"""
-        if not RAR_AVAILABLE:
-            return None
-        
-        try:
-            with rarfile.RarFile(archive_path, 'r') as archive:
-                contents = archive.namelist()
-                
-                rom_files = [f for f in contents if self._is_valid_rom(f, extensions)]
-                
-                if not rom_files:
-                    return None
-                
-                disk_files = self._detect_multidisk(rom_files)
-                
-                game_name = archive_path.stem
-                
-                return {
-                    'name': game_name,
-                    'display_name': self._clean_name(game_name),
-                    'type': 'rar',
-                    'path': str(archive_path),
-                    'platform': platform_name,
-                    'file_count': len(rom_files),
-                    'disk_count': len(disk_files) if disk_files else 0,
-                    'disks': disk_files if disk_files else [str(archive_path)],
-                    'rom_files': rom_files
-                }
-        except Exception as e:
-            print(f"Error scanning RAR {archive_path}: {e}")
+        members = read_archive_members(archive_path)
+        if members is None:
             return None
+        return self._archive_entry(archive_path, 'rar', members, platform_name, extensions)
     
-    def _scan_zip(self, zip_path, platform_name, extensions): #vers 1
+    def _scan_zip(self, zip_path, platform_name, extensions): #vers 2
         """Peek inside ZIP to get game information"""
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                contents = zip_ref.namelist()
-                
-                rom_files = [f for f in contents if self._is_valid_rom(f, extensions)]
-                
-                if not rom_files:
-                    return None
-                
-                disk_files = self._detect_multidisk(rom_files)
-                
-                game_name = zip_path.stem
-                
-                return {
-                    'name': game_name,
-                    'display_name': self._clean_name(game_name),
-                    'type': 'zip',
-                    'path': str(zip_path),
-                    'platform': platform_name,
-                    'file_count': len(rom_files),
-                    'disk_count': len(disk_files) if disk_files else 0,
-                    'disks': disk_files if disk_files else [str(zip_path)],
-                    'rom_files': rom_files
-                }
-        except Exception as e:
-            print(f"Error scanning ZIP {zip_path}: {e}")
+        members = read_archive_members(zip_path)
+        if members is None:
             return None
+        return self._archive_entry(zip_path, 'zip', members, platform_name, extensions)
     
     def discover_platforms(self): #vers 1
         """Find all platform folders in the ROM directory"""
@@ -308,46 +412,246 @@ class GameScanner: #vers 3
         
         return sorted(platforms)
     
-    def scan_platform(self, platform_name): #vers 3
-        """Scan all games for a specific platform"""
-        platform_path = self.rom_path / platform_name
+    def get_launch_path(self, game): #vers 1
+        """Get the file to launch for a game entry
+        
+        Args:
+            game: Game entry dict
+            
+        Returns:
+            Path of the ROM/archive to hand to the launcher
+        """
+        game_type = game.get('type')
+        disks = game.get('disks') or []
+        
+        if game_type == 'folder' and disks:
+            return Path(game['path']) / disks[0]
+        if game_type == 'multidisk' and disks:
+            return Path(disks[0])
+        return Path(game['path'])
+    
+    def _scan_item(self, item, platform_name, extensions): #vers 1
+        """Build the game entry for one item in a platform folder (or None)"""
+        archive_scanner = self._archive_scanner(item)
+        if archive_scanner:
+            return archive_scanner(item, platform_name, extensions)
+        
+        if item.is_dir():
+            return self._scan_folder(item, platform_name, extensions)
+        
+        if self._is_valid_rom(item.name, extensions):
+            return self._create_game_entry(item, platform_name)
+        
+        return None
+    
+    def iter_platform_games(self, platform_name): #vers 3
+        """Yield game entries for a platform in folder order, before grouping
+        
+        Archives whose size and mtime match the archive manifest cache are
+        served from it without being opened. The rest are peeked on a
+        bounded worker pool (see archive_workers / archive_pool) and their
+        listings saved back to the cache once the scan completes. Results
+        come back in the same order as a serial scan.
+        
+        Args:
+            platform_name: Name of the platform to scan
+            
+        Yields:
+            Game entry dicts (ungrouped, multi-disk sets still split)
+        """
+        platform_path = self._platform_path(platform_name)
         
         if not platform_path.exists():
-            return []
+            return
         
         platform_config = self.platforms.get(platform_name)
         if not platform_config:
-            return []
+            return
         
-        games = []
         extensions = platform_config['extensions']
+        manifests = self.db_manager.get_archive_manifests(platform_name)
         
+        # Plan: (item, stat, members) - stat is None for cache hits and
+        # non-archives, members is None for archives that must be opened
+        plan = []
         for item in platform_path.iterdir():
             if item.name.startswith('.'):
                 continue
             
-            if item.suffix.lower() == '.zip':
-                game_info = self._scan_zip(item, platform_name, extensions)
-                if game_info:
-                    games.append(game_info)
+            if item.suffix.lower() in self.ARCHIVE_TYPES and not item.is_dir():
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                cached = manifests.pop(str(item), None)
+                if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+                    plan.append((item, None, cached['members']))
+                else:
+                    plan.append((item, stat, None))
+            else:
+                plan.append((item, None, None))
+        
+        # Whatever is left in manifests belongs to archives that are gone
+        self.db_manager.remove_archive_manifests(list(manifests))
+        
+        new_manifests = []
+        misses = sum(1 for _, stat, _ in plan if stat is not None)
+        
+        if self.archive_workers > 1 and misses > 1:
+            if self.archive_pool == 'process':
+                pool = ProcessPoolExecutor(max_workers=self.archive_workers)
+            else:
+                pool = ThreadPoolExecutor(max_workers=self.archive_workers)
+        else:
+            pool = None
+        
+        # Ordered window of pending results: futures for archives being
+        # opened in the pool, plain values for everything else
+        window = deque()
+        max_pending = max(self.archive_workers, 1) * 4
+        
+        def pop_result():
+            item, stat, members = window.popleft()
             
-            elif item.suffix.lower() == '.7z':
-                game_info = self._scan_7z(item, platform_name, extensions)
-                if game_info:
-                    games.append(game_info)
+            if stat is None and members is None:
+                return self._scan_item(item, platform_name, extensions)
             
-            elif item.suffix.lower() == '.rar':
-                game_info = self._scan_rar(item, platform_name, extensions)
-                if game_info:
-                    games.append(game_info)
+            archive_type = self.ARCHIVE_TYPES[item.suffix.lower()]
+            if stat is not None:
+                if pool:
+                    try:
+                        members = members.result()
+                    except Exception as e:
+                        print(f"Error peeking archive {item}: {e}")
+                        members = None
+                else:
+                    members = read_archive_members(item)
+                
+                if members is None:
+                    return None
+                
+                new_manifests.append({
+                    'path': str(item),
+                    'archive_type': archive_type,
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'members': members
+                })
+            
+            return self._archive_entry(item, archive_type, members, platform_name, extensions)
+        
+        try:
+            for item, stat, members in plan:
+                if stat is not None and pool:
+                    members = pool.submit(read_archive_members, item)
+                window.append((item, stat, members))
+                
+                while len(window) > max_pending:
+                    game_info = pop_result()
+                    if game_info:
+                        yield game_info
             
-            elif item.is_dir():
-                game_info = self._scan_folder(item, platform_name, extensions)
+            while window:
+                game_info = pop_result()
                 if game_info:
-                    games.append(game_info)
+                    yield game_info
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+        
+        self.db_manager.save_archive_manifests(platform_name, new_manifests)
+    
+    def iter_stored_games(self, platform_name, platform_id=None, batch_size=None): #vers 3
+        """Yield game entries like iter_platform_games, storing them as they go
+        
+        Rows are written with add_games_bulk every batch_size games, each
+        batch committed on its own so no transaction is held open while the
+        caller consumes entries. The folder stamp is cleared first; only once
+        the scan is exhausted are entries of games that are gone removed and
+        the stamp recorded, so an abandoned scan is redone by
+        load_platform_games instead of being served from the database.
+        
+        Args:
+            platform_name: Name of the platform to scan
+            platform_id: Platform row id (looked up or added if None)
+            batch_size: Games per bulk insert (default GAME_BATCH_SIZE)
             
-            elif self._is_valid_rom(item.name, extensions):
-                games.append(self._create_game_entry(item, platform_name))
+        Yields:
+            Game entry dicts (ungrouped, multi-disk sets still split)
+        """
+        batch_size = batch_size or self.GAME_BATCH_SIZE
+        # Taken before scanning, so changes made during the scan are seen next time
+        stamp = self._platform_stamp(platform_name)
+        
+        if platform_id is None:
+            platform_id = self._platform_id(platform_name)
+        self.db_manager.set_games_stamp(platform_id, None)
+        
+        batch = []
+        seen_paths = set()
+        for game in self.iter_platform_games(platform_name):
+            batch.append(self._game_row(game, platform_id))
+            seen_paths.add(game['path'])
+            if len(batch) >= batch_size:
+                self.db_manager.add_games_bulk(batch)
+                batch = []
+            yield game
+        
+        with self.db_manager.transaction():
+            self.db_manager.add_games_bulk(batch)
+            self.db_manager.remove_stale_game_entries(platform_id, seen_paths)
+            self.db_manager.set_games_stamp(platform_id, stamp)
+    
+    def load_platform_games(self, platform_name, rescan=False): #vers 3
+        """Get a platform's games, from the database while its folder is unchanged
+        
+        The folder is scanned (and the result stored) only when it has never
+        been stored, its scan index stamp changed (see _platform_stamp) or
+        rescan is requested. Serving stored games touches no files.
+        
+        Args:
+            platform_name: Name of the platform
+            rescan: Force a filesystem scan
+            
+        Returns:
+            Sorted, multi-disk grouped list of game entries (as scan_platform)
+        """
+        if not rescan:
+            platform = self.db_manager.get_platform(platform_name)
+            stamp = self._platform_stamp(platform_name)
+            if platform and stamp is not None and platform.get('games_stamp') == stamp:
+                games = self.db_manager.get_game_entries(platform['id'])
+                grouped_games = self._group_multidisk_games(games)
+                return sorted(grouped_games, key=lambda g: g['display_name'].lower())
+        
+        return self.scan_platform(platform_name, store=True)
+    
+    def store_platform_games(self, platform_name, platform_id=None): #vers 1
+        """Scan a platform and store its games without keeping them in memory
+        
+        Args:
+            platform_name: Name of the platform to scan
+            platform_id: Platform row id (looked up or added if None)
+            
+        Returns:
+            Number of games stored
+        """
+        count = 0
+        for _ in self.iter_stored_games(platform_name, platform_id):
+            count += 1
+        return count
+    
+    def scan_platform(self, platform_name, store=False): #vers 5
+        """Scan all games for a specific platform
+        
+        Args:
+            platform_name: Name of the platform to scan
+            store: Also write the games to the database while scanning
+        """
+        if store:
+            games = list(self.iter_stored_games(platform_name))
+        else:
+            games = list(self.iter_platform_games(platform_name))
         
         grouped_games = self._group_multidisk_games(games)
         
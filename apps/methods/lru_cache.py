@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/lru_cache.py - Version: 1
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Byte LRU Cache
+
+"""
+Byte LRU Cache
+Dict-like least-recently-used cache bounded by an estimated size in bytes
+rather than an entry count. Pixmaps/images are costed as
+width x height x depth, everything else at a small flat rate.
+Shared by ArtworkLoader (icons, titles) and RetroArchArtwork (paths).
+"""
+
+import threading
+from collections import OrderedDict
+
+##Methods list -
+# __contains__
+# __getitem__
+# __init__
+# __len__
+# __setitem__
+# clear
+# estimate_size
+# get
+# pop
+# set_budget
+# stats
+# _evict
+
+# Flat cost for non-image values (paths, None for known misses, ...)
+SMALL_ENTRY_BYTES = 256
+
+# Sentinel for get() so cached None values (known misses) are told apart
+MISSING = object()
+
+
+def estimate_size(value): #vers 1
+    """Estimate memory held by a cached value in bytes
+
+    Args:
+        value: QPixmap, QImage, QIcon or any other object
+
+    Returns:
+        Estimated size in bytes
+    """
+    if value is None:
+        return SMALL_ENTRY_BYTES
+
+    # QPixmap / QImage
+    if hasattr(value, 'depth') and hasattr(value, 'width') and hasattr(value, 'height'):
+        return max(value.width() * value.height() * max(value.depth(), 8) // 8, SMALL_ENTRY_BYTES)
+
+    # QIcon - cost each stored size at 32 bits per pixel
+    if hasattr(value, 'availableSizes'):
+        total = sum(size.width() * size.height() * 4 for size in value.availableSizes())
+        return max(total, SMALL_ENTRY_BYTES)
+
+    return SMALL_ENTRY_BYTES
+
+
+class ByteLRUCache: #vers 1
+    """LRU cache with an eviction budget in bytes and hit/miss/eviction counters"""
+
+    def __init__(self, budget_bytes=256 * 1024 * 1024): #vers 1
+        """Initialize cache
+
+        Args:
+            budget_bytes: Maximum estimated bytes held before evicting
+        """
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key): #vers 1
+        """Membership test - use get(key, MISSING) to look up and count"""
+        with self._lock:
+            return key in self._entries
+
+    def __getitem__(self, key): #vers 1
+        with self._lock:
+            value, _ = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def get(self, key, default=None): #vers 1
+        """Get a value, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __setitem__(self, key, value): #vers 1
+        size = estimate_size(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            self._evict()
+
+    def pop(self, key, default=None): #vers 1
+        """Remove a value and return it"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self.current_bytes -= entry[1]
+            return entry[0]
+
+    def __len__(self): #vers 1
+        return len(self._entries)
+
+    def clear(self): #vers 1
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def set_budget(self, budget_bytes): #vers 1
+        """Change the byte budget, evicting at once if over it"""
+        with self._lock:
+            self.budget_bytes = max(0, int(budget_bytes))
+            self._evict()
+
+    def _evict(self): #vers 1
+        """Evict least recently used entries until under budget (lock held)"""
+        # Always keep the newest entry, even if it alone is over budget
+        while self.current_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def stats(self): #vers 1
+        """Get cache counters
+
+        Returns:
+            Dict with entries, bytes, budget_bytes, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'budget_bytes': self.budget_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
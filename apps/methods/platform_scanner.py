@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/methods/platform_scanner.py - Version: 4
+#this belongs in apps/methods/platform_scanner.py - Version: 9
 # X-Seti - November28 2025 - Multi-Emulator Launcher - Platform Scanner
 
 """
@@ -10,6 +10,9 @@ Integrates with dynamic core detection and BIOS management
 """
 
 import os
+import re
+import json
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from .system_core_scanner import SystemCoreScanner
@@ -26,8 +29,12 @@ from ..database.database_manager import DatabaseManager
 # _detect_file_extensions
 # _guess_platform_type
 # _is_system_file
+# _load_platform_defaults
+# _platform_defaults
+# _scan_platforms
+# _walk_platform_directory
 
-class PlatformScanner: #vers 4
+class PlatformScanner: #vers 9
     """Dynamically discovers platforms from ROM directory structure with core detection"""
     
     # Files/folders to ignore
@@ -44,6 +51,37 @@ class PlatformScanner: #vers 4
         'HXCSDFE.CFG', 'IMAGE_A.CFG',  # HxC floppy emulator
         '.iso',  # Boot ISOs like SPECCY97.iso
     }
+
+    # Precompiled ignore matcher - exact lookup set + single prefix regex
+    # (replaces the per-name loop over IGNORE_PATTERNS)
+    _IGNORE_EXACT = frozenset(IGNORE_PATTERNS)
+    _IGNORE_PREFIX_RE = re.compile(
+        '|'.join(re.escape(p.lower()) for p in sorted(IGNORE_PATTERNS, key=len, reverse=True))
+    )
+
+    # Directory stamps younger than this are not trusted by the scan index
+    RACY_STAMP_NS = 2_000_000_000
+    
+    # Archive handling keys taken from config/platforms.json - a scanned
+    # platform only knows its folder, not how its core opens archives
+    PLATFORM_DEFAULT_KEYS = ('zip_support', 'cache_extracted')
+    
+    # ROM file extensions counted as games (archives included)
+    ROM_EXTENSIONS = frozenset({
+        '.adf', '.ipf', '.dms',  # Amiga
+        '.st', '.stx',  # Atari ST
+        '.a26', '.a52', '.a78',  # Atari consoles
+        '.xex', '.atr', '.cas',  # Atari 8-bit
+        '.tap', '.tzx', '.sna', '.z80',  # Spectrum
+        '.dsk', '.cdt',  # Amstrad
+        '.d64', '.t64', '.crt', '.prg',  # C64
+        '.d81',  # C128
+        '.rom', '.mx1', '.mx2',  # MSX
+        '.nes', '.sfc', '.smc', '.gba',  # Nintendo
+        '.gen', '.md', '.smd',  # Sega
+        '.cue', '.bin', '.iso',  # Disc formats
+        '.zip', '.7z', '.rar',  # Compressed archives
+    })
     
     # Extension patterns
     EXTENSION_HINTS = {
@@ -382,25 +420,53 @@ class PlatformScanner: #vers 4
         # If no exact match found, return the original name
         return platform_name
 
-    def __init__(self, roms_dir: Path, cores_dir: Path = None, db_manager: DatabaseManager = None): #vers 4
+    def __init__(self, roms_dir: Path, cores_dir: Path = None, db_manager: DatabaseManager = None,
+                 config_dir: Path = None): #vers 5
         """Initialize platform scanner with core detection
         
         Args:
             roms_dir: Directory containing ROMs
             cores_dir: Directory containing cores (optional, defaults to ./cores)
             db_manager: Database manager instance (optional, creates new one if not provided)
+            config_dir: Directory holding platforms.json (optional, defaults to ./config)
         """
         self.roms_dir = Path(roms_dir)
         self.platforms = {}
         self.core_scanner = SystemCoreScanner(cores_dir or Path("./cores"))
         self.bios_manager = BiosManager()
         self.db_manager = db_manager or DatabaseManager()
+        self.platform_defaults = self._load_platform_defaults(Path(config_dir or "./config") / "platforms.json")
         
         # Get available cores
         self.available_cores = self.core_scanner.get_installed_cores()
         print(f"Available cores: {list(self.available_cores.keys())}")
         
-    def _is_system_file(self, name: str) -> bool: #vers 1
+    def _load_platform_defaults(self, platforms_file: Path) -> Dict[str, Dict]: #vers 1
+        """Load the per-platform defaults of platforms.json
+        
+        Returns:
+            Dict of lowercase platform name -> config ({} if the file is
+            missing or unreadable)
+        """
+        try:
+            with open(platforms_file, 'r', encoding='utf-8') as f:
+                defaults = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read {platforms_file}: {e}")
+            return {}
+        
+        return {name.lower(): config for name, config in defaults.items() if isinstance(config, dict)}
+    
+    def _platform_defaults(self, platform_name: str) -> Dict: #vers 1
+        """Get the platforms.json entry of a platform, by folder name or normalized name"""
+        defaults = self.platform_defaults.get(platform_name.lower())
+        if defaults is None:
+            defaults = self.platform_defaults.get(self.normalize_platform_name(platform_name).lower(), {})
+        return defaults
+    
+    def _is_system_file(self, name: str) -> bool: #vers 2
         """Check if file/folder should be ignored
         
         Args:
@@ -409,19 +475,18 @@ class PlatformScanner: #vers 4
         Returns:
             True if should be ignored
         """
-        name_lower = name.lower()
-        
+        # Ignore files starting with dot
+        if name.startswith('.'):
+            return True
+            
         # Check exact matches
-        if name in self.IGNORE_PATTERNS:
+        if name in self._IGNORE_EXACT:
             return True
             
+        name_lower = name.lower()
+        
         # Check if name starts with ignore pattern
-        for pattern in self.IGNORE_PATTERNS:
-            if name_lower.startswith(pattern.lower()):
-                return True
-                
-        # Ignore files starting with dot
-        if name.startswith('.'):
+        if self._IGNORE_PREFIX_RE.match(name_lower):
             return True
             
         # Ignore .zip BIOS files
@@ -445,6 +510,12 @@ class PlatformScanner: #vers 4
         # Get the platform name for core mapping
         platform_name = updated_config.get("name", "")
         
+        # How the platform's archives are launched (extract/cache or native)
+        defaults = self._platform_defaults(platform_name)
+        for key in self.PLATFORM_DEFAULT_KEYS:
+            if key in defaults:
+                updated_config.setdefault(key, defaults[key])
+        
         # Normalize the platform name using fuzzy matching
         normalized_platform_name = self.normalize_platform_name(platform_name)
         
@@ -491,10 +562,24 @@ class PlatformScanner: #vers 4
         
         return updated_config
     
-    def scan_platforms(self) -> Dict[str, Dict]: #vers 4
+    def scan_platforms(self, full_rescan: bool = False) -> Dict[str, Dict]: #vers 8
         """Scan ROM directory and discover platforms - handles spaces
         Integrates with dynamic core detection and BIOS management
+        
+        Incremental: directories whose stamp in the scan index is unchanged are
+        not listed again, and platforms/games rows are upserted instead of the
+        database being wiped.
+        
+        All database writes of a scan share one transaction (one commit).
+        
+        Args:
+            full_rescan: Ignore the scan index and rebuild everything from disk
         """
+        with self.db_manager.transaction():
+            return self._scan_platforms(full_rescan)
+    
+    def _scan_platforms(self, full_rescan: bool) -> Dict[str, Dict]: #vers 8
+        """Body of scan_platforms, run inside its database transaction"""
         if not self.roms_dir.exists():
             print(f"ROM directory not found: {self.roms_dir}")
             return {}
@@ -502,9 +587,24 @@ class PlatformScanner: #vers 4
         print(f"Scanning for platforms in: {self.roms_dir}")
         print("=" * 60)
 
-        # Clear existing platforms in database before rescan
-        self.db_manager.clear_all_platforms()
+        if full_rescan:
+            # Clear existing platforms (and scan index) before rescan
+            self.db_manager.clear_all_platforms()
+        
+        # One BIOS directory listing per scan, shared by every platform below
+        self.bios_manager.get_bios_inventory(refresh=full_rescan)
+        
+        known_platforms = {p['name'] for p in self.db_manager.get_all_platforms()}
+        scan_index = self.db_manager.get_scan_index()
+        index_by_platform = {}
+        for path, entry in scan_index.items():
+            index_by_platform.setdefault(entry['platform_name'], {})[path] = entry
+        
         platforms = {}
+        platform_rows = []
+        platform_walks = {}
+        walked_platforms = []
+        rescanned_dirs = 0
 
         # Scan all subdirectories
         for item in self.roms_dir.iterdir():
@@ -518,16 +618,25 @@ class PlatformScanner: #vers 4
                 continue
 
             platform_name = item.name
+            walked_platforms.append(platform_name)
+            
+            # Without a platform row there are no games rows to keep in step -
+            # walk the whole tree so every file gets stored
+            platform_index = index_by_platform.get(platform_name, {}) if platform_name in known_platforms else {}
 
-            # Count ROMs
-            rom_count = self._count_roms_in_directory(item)
+            # Single pass over the platform tree: ROM count + extensions
+            walk = self._walk_platform_directory(item, platform_index)
+            rom_count = walk["rom_count"]
+            rescanned_dirs += len(walk["dir_entries"])
+            
+            self.db_manager.save_scan_index(platform_name, walk["dir_entries"])
+            self.db_manager.remove_scan_index(walk["removed_dirs"])
 
             if rom_count == 0:
                 print(f"Skipping {platform_name} (no ROM files found)")
                 continue
 
-            # Detect file extensions
-            extensions = self._detect_file_extensions(item)
+            extensions = walk["extensions"]
 
             # Guess platform type
             platform_type = self._guess_platform_type(platform_name, extensions)
@@ -553,41 +662,63 @@ class PlatformScanner: #vers 4
             # Add platform regardless of core availability (user can install cores later)
             platforms[platform_name] = platform_config
 
-            # Store in database
-            platform_id = self.db_manager.add_platform(
-                name=platform_name,
-                normalized_name=self.normalize_platform_name(platform_name).lower().replace(' ', '_'),
-                rom_directory=str(item),
-                total_games=rom_count,
-                has_bios=1 if platform_config.get('bios_complete', False) else 0
-            )
-
-            # Add BIOS files to database if they exist
-            if platform_config.get('bios_required', False):
-                missing_bios = platform_config.get('missing_bios', [])
-                for bios_file in missing_bios:
-                    self.db_manager.add_bios_file(
-                        platform_id=platform_id,
-                        filename=bios_file,
-                        file_path="",  # BIOS file path would be determined by bios_manager
-                        required=1
-                    )
+            # Stored in bulk once every platform is walked
+            platform_rows.append({
+                "name": platform_name,
+                "normalized_name": self.normalize_platform_name(platform_name).lower().replace(' ', '_'),
+                "rom_directory": str(item),
+                "total_games": rom_count,
+                "has_bios": 1 if platform_config.get('bios_complete', False) else 0
+            })
+            platform_walks[platform_name] = walk
 
             if platform_config["core_available"]:
                 print(f"✓ {platform_name}: {rom_count} ROMs, cores: {platform_config['cores']}, BIOS: {'✓' if platform_config['bios_complete'] else '✗' if platform_config['bios_required'] else 'N/A'}")
             else:
                 print(f"⚠ {platform_name}: {rom_count} ROMs, NO CORES (install cores to launch)")
-
+        
+        # Store platforms, then their games and BIOS rows
+        platform_ids = self.db_manager.upsert_platforms_bulk(platform_rows)
+        bios_rows = []
+        
+        for platform_name, walk in platform_walks.items():
+            platform_id = platform_ids[platform_name]
+            platform_config = platforms[platform_name]
+            
+            # Keep games rows in step with the directories that changed
+            self.db_manager.upsert_game_files(platform_id, walk["files"])
+            self.db_manager.remove_games_by_paths(walk["removed_files"])
+            
+            # Add BIOS files to database if they exist
+            self.db_manager.clear_platform_bios(platform_id)
+            if platform_config.get('bios_required', False):
+                for bios_file in platform_config.get('missing_bios', []):
+                    bios_rows.append({
+                        "platform_id": platform_id,
+                        "filename": bios_file,
+                        "file_path": "",  # BIOS file path would be determined by bios_manager
+                        "required": 1
+                    })
+        
+        self.db_manager.add_bios_files_bulk(bios_rows)
+        
+        # Drop platforms whose directory vanished or no longer holds ROMs
+        for platform_name in known_platforms - set(platforms):
+            self.db_manager.remove_platform(platform_name)
+        self.db_manager.prune_scan_index(walked_platforms)
+        
         print(f"\nLoaded {len(platforms)} platform(s): {', '.join(platforms.keys())}")
+        print(f"Rescanned {rescanned_dirs} changed director{'y' if rescanned_dirs == 1 else 'ies'}")
 
         # Store core information in database
-        for platform_name, config in platforms.items():
-            if 'cores' in config:
-                self.db_manager.add_core_info(
-                    platform_name=platform_name,
-                    available_cores=config['cores'],
-                    preferred_core=config['cores'][0] if config['cores'] else None
-                )
+        self.db_manager.add_core_info_bulk([
+            {
+                "platform_name": platform_name,
+                "available_cores": config['cores'],
+                "preferred_core": config['cores'][0] if config['cores'] else None
+            }
+            for platform_name, config in platforms.items() if 'cores' in config
+        ])
 
         self.platforms = platforms
         return platforms
@@ -600,55 +731,146 @@ class PlatformScanner: #vers 4
         """Get info for specific platform"""
         return self.platforms.get(platform_name)
     
-    def _count_roms_in_directory(self, directory: Path) -> int: #vers 3
-        """Count ROM files in directory - ignore system files, include archives"""
-        count = 0
-        rom_extensions = {
-            '.adf', '.ipf', '.dms',  # Amiga
-            '.st', '.stx',  # Atari ST
-            '.a26', '.a52', '.a78',  # Atari consoles
-            '.xex', '.atr', '.cas',  # Atari 8-bit
-            '.tap', '.tzx', '.sna', '.z80',  # Spectrum
-            '.dsk', '.cdt',  # Amstrad
-            '.d64', '.t64', '.crt', '.prg',  # C64
-            '.d81',  # C128
-            '.rom', '.mx1', '.mx2',  # MSX
-            '.nes', '.sfc', '.smc', '.gba',  # Nintendo
-            '.gen', '.md', '.smd',  # Sega
-            '.cue', '.bin', '.iso',  # Disc formats
-            '.zip', '.7z', '.rar',  # Compressed archives
-        }
+    def _walk_platform_directory(self, directory: Path, index: Optional[Dict[str, Dict]] = None) -> Dict: #vers 2
+        """Walk a platform directory once with os.scandir
         
-        for file_path in directory.rglob("*"):
-            if not file_path.is_file():
-                continue
-                
-            # Skip system files
-            if self._is_system_file(file_path.name):
-                continue
-                
-            if file_path.suffix.lower() in rom_extensions:
-                count += 1
-                    
-        return count
+        Replaces the separate rglob passes of _count_roms_in_directory and
+        _detect_file_extensions. System files are skipped and system folders
+        (.git, __pycache__, ...) are not descended into.
         
-    def _detect_file_extensions(self, directory: Path) -> Set[str]: #vers 2
-        """Detect all ROM file extensions - ignore system files"""
-        extensions = set()
+        With a scan index (path -> stored stamp, see DatabaseManager.get_scan_index)
+        only directories whose (mtime, inode) stamp changed are listed again;
+        unchanged directories reuse their stored counts and child directories,
+        costing one stat() each.
         
-        for file_path in directory.rglob("*"):
-            if not file_path.is_file():
+        Args:
+            directory: Platform directory to walk
+            index: Optional scan index rows for this platform
+            
+        Returns:
+            Dict with 'rom_count', 'extensions' (set), 'files' (dicts with path,
+            name, ext, size, mtime for each ROM file in a rescanned directory),
+            'dir_entries' (index rows to store), 'removed_files' and 'removed_dirs'
+        """
+        index = index or {}
+        rom_count = 0
+        extensions = set()
+        files = []
+        dir_entries = []
+        removed_files = []
+        visited = set()
+        rom_extensions = self.ROM_EXTENSIONS
+        
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            visited.add(current)
+            
+            try:
+                dir_stat = os.stat(current)
+            except OSError as e:
+                print(f"Cannot read directory {current}: {e}")
                 continue
-                
-            # Skip system files
-            if self._is_system_file(file_path.name):
+            
+            cached = index.get(current)
+            if cached and cached["mtime_ns"] == dir_stat.st_mtime_ns and cached["inode"] == dir_stat.st_ino:
+                # Unchanged directory - reuse stored summary, still check children
+                rom_count += cached["rom_count"]
+                extensions.update(cached["extensions"])
+                stack.extend(cached["subdirs"])
                 continue
-                
-            ext = file_path.suffix.lower()
-            if ext and ext != '.folder':
-                extensions.add(ext)
-                    
-        return extensions
+            
+            entry_count = 0
+            dir_rom_files = []
+            dir_extensions = set()
+            subdirs = []
+            
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        entry_count += 1
+                        name = entry.name
+                        if self._is_system_file(name):
+                            continue
+                        
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        
+                        ext = os.path.splitext(name)[1].lower()
+                        if ext and ext != '.folder':
+                            dir_extensions.add(ext)
+                        
+                        if ext in rom_extensions:
+                            dir_rom_files.append(name)
+                            try:
+                                st = entry.stat()
+                                size, mtime = st.st_size, st.st_mtime
+                            except OSError:
+                                size, mtime = 0, 0.0
+                            files.append({
+                                "path": entry.path,
+                                "name": name,
+                                "ext": ext,
+                                "size": size,
+                                "mtime": mtime,
+                            })
+            except OSError as e:
+                print(f"Cannot read directory {current}: {e}")
+                continue
+            
+            rom_count += len(dir_rom_files)
+            extensions.update(dir_extensions)
+            stack.extend(subdirs)
+            
+            # A directory modified during this second may change again without
+            # a visible mtime bump - store a zero stamp so it is rescanned
+            mtime_ns = dir_stat.st_mtime_ns
+            if time.time_ns() - mtime_ns < self.RACY_STAMP_NS:
+                mtime_ns = 0
+            
+            dir_entries.append({
+                "path": current,
+                "mtime_ns": mtime_ns,
+                "inode": dir_stat.st_ino,
+                "entry_count": entry_count,
+                "rom_count": len(dir_rom_files),
+                "extensions": dir_extensions,
+                "subdirs": subdirs,
+                "rom_files": dir_rom_files,
+            })
+            
+            if cached:
+                current_names = set(dir_rom_files)
+                removed_files.extend(os.path.join(current, name) for name in cached["rom_files"]
+                                     if name not in current_names)
+        
+        # Directories in the index that were not reached any more are gone
+        removed_dirs = [path for path in index if path not in visited]
+        for path in removed_dirs:
+            removed_files.extend(os.path.join(path, name) for name in index[path]["rom_files"])
+        
+        return {
+            "rom_count": rom_count,
+            "extensions": extensions,
+            "files": files,
+            "dir_entries": dir_entries,
+            "removed_files": removed_files,
+            "removed_dirs": removed_dirs,
+        }
+    
+    def _count_roms_in_directory(self, directory: Path) -> int: #vers 4
+        """Count ROM files in directory - ignore system files, include archives"""
+        return self._walk_platform_directory(directory)["rom_count"]
+        
+    def _detect_file_extensions(self, directory: Path) -> Set[str]: #vers 3
+        """Detect all ROM file extensions - ignore system files"""
+        return self._walk_platform_directory(directory)["extensions"]
         
     def _guess_platform_type(self, platform_name: str, extensions: Set[str]) -> str: #vers 1
         """Guess platform type from name and extensions"""
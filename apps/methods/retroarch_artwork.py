@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in apps/methods/retroarch_artwork.py - Version: 1
+#this belongs in apps/methods/retroarch_artwork.py - Version: 3
 # X-Seti - November27 2025 - Multi-Emulator Launcher - RetroArch Artwork Scanner
 
 """
@@ -12,6 +12,7 @@ import os
 from pathlib import Path
 from typing import Optional, List, Dict
 from PyQt6.QtGui import QPixmap
+from apps.methods.lru_cache import ByteLRUCache, MISSING
 
 ##Methods list -
 # __init__
@@ -21,10 +22,17 @@ from PyQt6.QtGui import QPixmap
 # scan_artwork_directories
 # _clean_game_name
 # _find_artwork_file
+# _get_dir_index
 
-class RetroArchArtwork: #vers 1
+class RetroArchArtwork: #vers 3
     """Scanner for RetroArch artwork directories"""
     
+    # Thumbnail image types, in order of preference
+    IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+    
+    # RetroArch writes these characters as '_' in thumbnail file names
+    THUMBNAIL_CHAR_MAP = str.maketrans({char: '_' for char in '&*/:`<>?\\|"'})
+    
     # Platform name mapping: MEL name -> RetroArch playlist name
     PLATFORM_MAPPING = {
         'PlayStation': 'Sony - PlayStation',
@@ -60,11 +68,18 @@ class RetroArchArtwork: #vers 1
         'Arcade': 'MAME'
     }
     
-    def __init__(self): #vers 1
-        """Initialize RetroArch artwork scanner"""
+    def __init__(self, cache=None): #vers 3
+        """Initialize RetroArch artwork scanner
+        
+        Args:
+            cache: ByteLRUCache to share (e.g. ArtworkLoader.cache), or None
+                   for a private one
+        """
         self.retroarch_dirs = []
         self.thumbnails_dir = None
-        self.artwork_cache = {}
+        self.artwork_cache = cache if cache is not None else ByteLRUCache()
+        # Artwork dir -> (mtime_ns, {lowercase stem: Path})
+        self._dir_index = {}
         
         # Find RetroArch directories
         self.retroarch_dirs = self.find_retroarch_dirs()
@@ -132,7 +147,7 @@ class RetroArchArtwork: #vers 1
         """
         return self.PLATFORM_MAPPING.get(platform_name)
     
-    def get_game_artwork(self, platform_name, game_name, artwork_type='Named_Boxarts'): #vers 1
+    def get_game_artwork(self, platform_name, game_name, artwork_type='Named_Boxarts'): #vers 5
         """Get artwork for a game
         
         Args:
@@ -155,8 +170,9 @@ class RetroArchArtwork: #vers 1
         
         # Check cache
         cache_key = f"{platform_name}:{game_name}:{artwork_type}"
-        if cache_key in self.artwork_cache:
-            return self.artwork_cache[cache_key]
+        cached = self.artwork_cache.get(cache_key, MISSING)
+        if cached is not MISSING:
+            return cached
         
         # Clean game name for filename matching
         clean_name = self._clean_game_name(game_name)
@@ -164,18 +180,19 @@ class RetroArchArtwork: #vers 1
         # Build path to artwork directory
         artwork_dir = self.thumbnails_dir / retroarch_platform / artwork_type
         
-        if not artwork_dir.exists():
+        index = self._get_dir_index(artwork_dir)
+        if index is None:
             from apps.utils.debug_logger import debug
             debug(f"Artwork directory not found: {artwork_dir}", "ARTWORK")
             return None
         
         # Try to find artwork file
-        artwork_file = self._find_artwork_file(artwork_dir, clean_name)
-        
-        # Cache result
-        self.artwork_cache[cache_key] = artwork_file
+        artwork_file = self._find_artwork_file(index, clean_name)
         
+        # Cache hits only - a miss is looked up again in the directory
+        # index (one stat), so artwork added while running shows up
         if artwork_file:
+            self.artwork_cache[cache_key] = artwork_file
             from apps.utils.debug_logger import debug
             debug(f"Found artwork: {artwork_file.name}", "ARTWORK")
         
@@ -202,36 +219,68 @@ class RetroArchArtwork: #vers 1
         
         return name
     
-    def _find_artwork_file(self, artwork_dir, game_name): #vers 1
-        """Find artwork file in directory
+    def _get_dir_index(self, artwork_dir): #vers 1
+        """Get the lowercase stem -> file listing of an artwork directory
+        
+        The directory is listed once and reused until its mtime changes
+        (adding or removing a file updates the directory mtime).
         
         Args:
-            artwork_dir: Directory to search
-            game_name: Cleaned game name
+            artwork_dir: Named_Boxarts / Named_Titles / Named_Snaps directory
             
         Returns:
-            Path to artwork file or None
+            Dict of lowercase file stem -> Path, or None if the directory is missing
         """
-        # Try common image extensions
-        for ext in ['.png', '.jpg', '.jpeg']:
-            # Try exact match
-            artwork_file = artwork_dir / f"{game_name}{ext}"
-            if artwork_file.exists():
-                return artwork_file
+        key = str(artwork_dir)
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except OSError:
+            self._dir_index.pop(key, None)
+            return None
+        
+        cached = self._dir_index.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
         
-        # Try case-insensitive search
+        index = {}
         try:
-            for file in artwork_dir.iterdir():
-                if file.suffix.lower() in ['.png', '.jpg', '.jpeg']:
-                    # Compare without extension and case-insensitive
-                    file_stem = file.stem.lower()
-                    game_stem = game_name.lower()
+            with os.scandir(key) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext not in self.IMAGE_EXTENSIONS:
+                        continue
                     
-                    if file_stem == game_stem:
-                        return file
-        except Exception as e:
+                    stem = stem.lower()
+                    existing = index.get(stem)
+                    if existing is None or (self.IMAGE_EXTENSIONS.index(ext) <
+                                            self.IMAGE_EXTENSIONS.index(existing.suffix.lower())):
+                        index[stem] = Path(entry.path)
+        except OSError as e:
             from apps.utils.debug_logger import error
             error(f"Error searching artwork directory: {e}", "ARTWORK")
+            return None
+        
+        self._dir_index[key] = (mtime_ns, index)
+        return index
+    
+    def _find_artwork_file(self, index, game_name): #vers 3
+        """Find artwork file in directory
+        
+        Looks the name up in the directory listing, as-is and with
+        RetroArch's character substitution, case-insensitively.
+        
+        Args:
+            index: Listing of the directory to search (from _get_dir_index)
+            game_name: Cleaned game name
+            
+        Returns:
+            Path to artwork file or None
+        """
+        for candidate in (game_name, game_name.translate(self.THUMBNAIL_CHAR_MAP)):
+            artwork_file = index.get(candidate.lower())
+            if artwork_file:
+                return artwork_file
         
         return None
     
@@ -1,13 +1,25 @@
 # X-Seti - November28 2025 - Multi-Emulator Launcher - ROM Loader
-# This belongs in methods/rom_loader.py - Version: 3
+# This belongs in methods/rom_loader.py - Version: 9
 """
 ROM Loader - Handles loading ROMs including ZIP/7Z/RAR extraction and caching.
 Enhanced to work with dynamic core detection and BIOS management.
+Extractions into the cache can run ahead of launch (prefetch) and be
+cancelled between chunks. Temporary extractions can go to RAM (/dev/shm)
+up to ram_extraction_mb, so small ROMs never touch the disk.
 """
 
 ##Methods list -
+# _archive_extract
+# _archive_names
+# _archive_size
+# _cache_lock
+# _cacheable_archive
+# _copy_member
 # _extract_7z
+# _extract_archive
+# _extract_into
 # _extract_rar
+# _extract_with_companions
 # _extract_zip
 # _find_folder_main_rom
 # _find_main_rom_file
@@ -15,17 +27,36 @@ Enhanced to work with dynamic core detection and BIOS management.
 # _get_cache_path
 # _get_cached_extraction
 # _get_bios_path
+# _init_ram_dir
+# _link_reference
+# _member_path
+# _open_archive
+# _release_ram
+# _select_archive_rom
+# _select_main_rom
+# _temp_extract_dir
 # cleanup
 # clear_cache
 # get_cache_size
+# get_cached_rom
 # load_rom
 # load_rom_with_bios
+# prefetch
+
+##class ExtractionCancelled -
+##class RomLoader -
 
 import os
+import errno
 import zipfile
 import shutil
+import threading
+import posixpath
 from pathlib import Path
 from .bios_manager import BiosManager
+from .disc_sheets import SHEET_EXTENSIONS, is_sheet, match_member, sheet_references
+from .extraction_cache import ExtractionCache, DEFAULT_BUDGET_MB
+from ..utils.launch_timing import span
 
 try:
     import py7zr
@@ -39,132 +70,292 @@ try:
 except ImportError:
     RAR_AVAILABLE = False
 
+# Read size when streaming ZIP/RAR members to disk
+EXTRACT_CHUNK = 1024 * 1024
+
+# tmpfs holding RAM-backed temporary extractions (one directory per process)
+RAM_TEMP_ROOT = Path('/dev/shm')
+
+
+class ExtractionCancelled(Exception): #vers 1
+    """Raised when a cancellable extraction is cancelled"""
+
 
-class RomLoader: #vers 3
-    def __init__(self, config, platforms): #vers 3
+class RomLoader: #vers 8
+    def __init__(self, config, platforms): #vers 7
         self.config = config
         self.platforms = platforms
         self.cache_dir = Path(config['cache_path']) / 'extracted'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # cache_extracted platforms - LRU within extraction_cache_mb
+        self.extraction_cache = ExtractionCache(
+            self.cache_dir,
+            Path(config['cache_path']) / 'extracted.db',
+            config.get('extraction_cache_mb', DEFAULT_BUDGET_MB) * 1024 * 1024,
+            content_hash=config.get('extraction_cache_dedupe', False)
+        )
         self.temp_extractions = []
         self.bios_manager = BiosManager()
+        # Temporary extractions that fit go to RAM (0 = always disk)
+        self.ram_limit = max(0, config.get('ram_extraction_mb', 0)) * 1024 * 1024
+        self.ram_used = 0
+        self._ram_extractions = {}  # extract_dir -> bytes reserved
+        self.ram_dir = self._init_ram_dir() if self.ram_limit else None
+        # Cache key -> lock, so a launch and a prefetch of one game never
+        # extract into the same directory at once
+        self._extract_locks = {}
+        self._extract_locks_guard = threading.Lock()
+    
+    def _archive_extract(self, archive, archive_type, extract_dir, members=None, cancelled=None): #vers 2
+        """Extract members of an open archive (None extracts everything)
+        
+        ZIP/RAR members are streamed in chunks, checking cancelled()
+        between them; 7Z can only be cancelled between extract calls.
+        """
+        if cancelled and cancelled():
+            raise ExtractionCancelled()
+        
+        if archive_type == '7z':
+            if members is None:
+                archive.extractall(path=extract_dir)
+            else:
+                for member in members:
+                    self._member_path(extract_dir, member).parent.mkdir(parents=True, exist_ok=True)
+                archive.extract(path=extract_dir, targets=list(members))
+            # py7zr reads the archive once per extract call
+            archive.reset()
+            return
+        
+        if members is None:
+            members = self._archive_names(archive, archive_type)
+        for member in members:
+            self._copy_member(archive, member, self._member_path(extract_dir, member), cancelled)
+    
+    def _archive_names(self, archive, archive_type): #vers 1
+        """Get the file members of an open archive (directories skipped)"""
+        if archive_type == '7z':
+            return [info.filename for info in archive.list() if not info.is_directory]
+        return [info.filename for info in archive.infolist() if not info.is_dir()]
+    
+    def _archive_size(self, archive_path, archive_type): #vers 1
+        """Get the total uncompressed size of an archive's files"""
+        with self._open_archive(archive_path, archive_type) as archive:
+            if archive_type == '7z':
+                return sum(info.uncompressed or 0 for info in archive.list() if not info.is_directory)
+            return sum(info.file_size for info in archive.infolist() if not info.is_dir())
+    
+    def _cache_lock(self, cache_key): #vers 1
+        """Get the lock serializing extractions into one cache entry"""
+        with self._extract_locks_guard:
+            return self._extract_locks.setdefault(cache_key, threading.Lock())
+    
+    def _copy_member(self, archive, member, target, cancelled=None): #vers 1
+        """Stream one ZIP/RAR member to a file"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with archive.open(member) as source, open(target, 'wb') as out:
+            while True:
+                if cancelled and cancelled():
+                    raise ExtractionCancelled()
+                chunk = source.read(EXTRACT_CHUNK)
+                if not chunk:
+                    break
+                out.write(chunk)
+    
+    def _cacheable_archive(self, game_entry, platform_config): #vers 1
+        """Get the archive entry a game extracts into the cache from
+        
+        Returns:
+            Archive game entry (type zip/7z/rar), or None if the game is no
+            archive, its archive type is unsupported or the platform does
+            not cache extractions
+        """
+        if not platform_config or not platform_config.get('cache_extracted'):
+            return None
+        
+        archive_entry = game_entry
+        if game_entry['type'] == 'multidisk':
+            first_disk = game_entry['disks'][0]
+            archive_entry = {
+                'type': Path(first_disk).suffix.lower().lstrip('.'),
+                'path': first_disk,
+                'platform': game_entry['platform'],
+                'rom_files': game_entry.get('rom_files', [])
+            }
+        
+        available = {'zip': True, '7z': SEVENZ_AVAILABLE, 'rar': RAR_AVAILABLE}
+        if not available.get(archive_entry['type']):
+            return None
+        return archive_entry
     
-    def _extract_7z(self, game_entry, platform_config): #vers 1
+    def _extract_7z(self, game_entry, platform_config): #vers 2
         """Extract 7Z file and return path to main ROM"""
         if not SEVENZ_AVAILABLE:
             raise Exception("py7zr not installed. Cannot extract .7z files.")
         
-        archive_path = Path(game_entry['path'])
+        return self._extract_archive(game_entry, platform_config, '7z')
+    
+    def _extract_archive(self, game_entry, platform_config, archive_type, cancelled=None, pin=True): #vers 6
+        """Extract the main ROM of an archive and the files it needs
         
-        if platform_config.get('cache_extracted'):
-            cached_path = self._get_cached_extraction(archive_path)
-            if cached_path:
-                return cached_path
+        Only the main ROM is extracted, plus whatever it refers to through
+        cue/gdi/m3u sheets (disc tracks, playlist discs). Archives with no
+        ROM matching the platform are extracted whole.
         
+        Args:
+            game_entry: Game entry dictionary
+            platform_config: Platform configuration
+            archive_type: 'zip', '7z' or 'rar'
+            cancelled: Callable returning True to stop (raises
+                       ExtractionCancelled, nothing is left behind)
+            pin: Keep the cache entry from eviction this session (it is
+                 being launched; prefetches pass False)
+            
+        Returns:
+            Path to the main ROM as a string
+        """
         if platform_config.get('cache_extracted'):
-            extract_dir = self._get_cache_path(archive_path)
-        else:
-            extract_dir = self.cache_dir / 'temp' / archive_path.stem
-            self.temp_extractions.append(extract_dir)
+            cache_key = self._get_cache_path(game_entry['path'], game_entry.get('platform', '')).name
+            with self._cache_lock(cache_key):
+                cached_path = self.extraction_cache.lookup(cache_key, pin=pin)
+                if cached_path:
+                    return cached_path
+                # Evict for the whole uncompressed size before writing anything
+                try:
+                    reserve = self._archive_size(game_entry['path'], archive_type)
+                except Exception:
+                    reserve = 0
+                extract_dir = self.extraction_cache.prepare(cache_key, reserve)
+                try:
+                    main_rom = self._extract_into(game_entry, platform_config, archive_type, extract_dir, cancelled)
+                except BaseException:
+                    self.extraction_cache.release(cache_key)
+                    raise
+                self.extraction_cache.add(cache_key, game_entry['path'], main_rom, pin=pin)
+                return main_rom
         
+        archive_path = Path(game_entry['path'])
+        extract_dir = self._temp_extract_dir(archive_path, archive_type)
+        self.temp_extractions.append(extract_dir)
         extract_dir.mkdir(parents=True, exist_ok=True)
-        
         try:
-            with py7zr.SevenZipFile(archive_path, 'r') as archive:
-                archive.extractall(path=extract_dir)
-            
-            rom_files = game_entry.get('rom_files', [])
-            if not rom_files:
-                rom_files = self._find_rom_files(extract_dir, platform_config['extensions'])
-            
-            if not rom_files:
-                raise Exception(f"No ROM files found in 7Z: {archive_path}")
-            
-            main_rom = self._find_main_rom_file(rom_files, extract_dir)
-            
-            return str(main_rom)
-        
+            return self._extract_into(game_entry, platform_config, archive_type, extract_dir, cancelled)
         except Exception as e:
-            if extract_dir.exists():
-                shutil.rmtree(extract_dir, ignore_errors=True)
-            raise Exception(f"Failed to extract 7Z {archive_path}: {e}")
+            in_ram = extract_dir in self._ram_extractions
+            self._release_ram(extract_dir)
+            full = isinstance(e.__context__, OSError) and e.__context__.errno == errno.ENOSPC
+            if not (in_ram and full):
+                raise
+        
+        # tmpfs filled up under us - extract to disk instead
+        extract_dir = self.cache_dir / 'temp' / archive_path.stem
+        self.temp_extractions.append(extract_dir)
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        return self._extract_into(game_entry, platform_config, archive_type, extract_dir, cancelled)
     
-    def _extract_rar(self, game_entry, platform_config): #vers 1
-        """Extract RAR file and return path to main ROM"""
-        if not RAR_AVAILABLE:
-            raise Exception("rarfile not installed. Cannot extract .rar files.")
-        
-        archive_path = Path(game_entry['path'])
-        
-        if platform_config.get('cache_extracted'):
-            cached_path = self._get_cached_extraction(archive_path)
-            if cached_path:
-                return cached_path
+    def _extract_into(self, game_entry, platform_config, archive_type, extract_dir, cancelled=None): #vers 1
+        """Extract an archive's main ROM and companions into extract_dir
         
-        if platform_config.get('cache_extracted'):
-            extract_dir = self._get_cache_path(archive_path)
-        else:
-            extract_dir = self.cache_dir / 'temp' / archive_path.stem
-            self.temp_extractions.append(extract_dir)
+        On failure or cancellation extract_dir is removed.
         
-        extract_dir.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Path to the main ROM as a string
+        """
+        label = archive_type.upper()
+        archive_path = Path(game_entry['path'])
         
         try:
-            with rarfile.RarFile(archive_path, 'r') as archive:
-                archive.extractall(path=extract_dir)
-            
-            rom_files = game_entry.get('rom_files', [])
-            if not rom_files:
-                rom_files = self._find_rom_files(extract_dir, platform_config['extensions'])
-            
-            if not rom_files:
-                raise Exception(f"No ROM files found in RAR: {archive_path}")
+            main_rom = None
+            with self._open_archive(archive_path, archive_type) as archive:
+                members = {name.lower(): name for name in self._archive_names(archive, archive_type)}
+                main_member = self._select_archive_rom(game_entry, platform_config, members)
+                
+                if not (main_member and self._extract_with_companions(archive, archive_type, main_member,
+                                                                       members, extract_dir, cancelled)):
+                    self._archive_extract(archive, archive_type, extract_dir, cancelled=cancelled)
+                
+                if main_member:
+                    main_rom = self._member_path(extract_dir, main_member)
             
-            main_rom = self._find_main_rom_file(rom_files, extract_dir)
+            if main_rom is None:
+                rom_files = game_entry.get('rom_files', [])
+                if not rom_files:
+                    rom_files = self._find_rom_files(extract_dir, platform_config['extensions'])
+                
+                if not rom_files:
+                    raise Exception(f"No ROM files found in {label}: {archive_path}")
+                
+                main_rom = self._find_main_rom_file(rom_files, extract_dir)
             
             return str(main_rom)
         
+        except ExtractionCancelled:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            raise
+        
         except Exception as e:
             if extract_dir.exists():
                 shutil.rmtree(extract_dir, ignore_errors=True)
-            raise Exception(f"Failed to extract RAR {archive_path}: {e}")
+            raise Exception(f"Failed to extract {label} {archive_path}: {e}")
     
-    def _extract_zip(self, game_entry, platform_config): #vers 1
-        """Extract ZIP file and return path to main ROM"""
-        zip_path = Path(game_entry['path'])
-        
-        if platform_config.get('cache_extracted'):
-            cached_path = self._get_cached_extraction(zip_path)
-            if cached_path:
-                return cached_path
+    def _extract_rar(self, game_entry, platform_config): #vers 2
+        """Extract RAR file and return path to main ROM"""
+        if not RAR_AVAILABLE:
+            raise Exception("rarfile not installed. Cannot extract .rar files.")
         
-        if platform_config.get('cache_extracted'):
-            extract_dir = self._get_cache_path(zip_path)
-        else:
-            extract_dir = self.cache_dir / 'temp' / zip_path.stem
-            self.temp_extractions.append(extract_dir)
+        return self._extract_archive(game_entry, platform_config, 'rar')
+    
+    def _extract_with_companions(self, archive, archive_type, main_member, members, extract_dir,
+                                 cancelled=None): #vers 3
+        """Extract a member and, level by level, the files its sheets refer to
         
-        extract_dir.mkdir(parents=True, exist_ok=True)
+        Sheets are matched to members case-insensitively; a companion the
+        sheet spells differently is also linked under the sheet's name (see
+        _link_reference), since emulators open it by that name.
         
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            rom_files = game_entry.get('rom_files', [])
-            if not rom_files:
-                rom_files = self._find_rom_files(extract_dir, platform_config['extensions'])
+        Args:
+            archive: Open archive
+            archive_type: 'zip', '7z' or 'rar'
+            main_member: Member to launch
+            members: Dict of lowercase member name -> member name
+            extract_dir: Directory to extract into
+            cancelled: Callable returning True to stop
             
-            if not rom_files:
-                raise Exception(f"No ROM files found in ZIP: {zip_path}")
+        Returns:
+            False if a sheet refers to a file the archive does not hold
+            (the caller then extracts everything), True otherwise
+        """
+        extracted = set()
+        pending = [main_member]
+        references = []
+        
+        while pending:
+            self._archive_extract(archive, archive_type, extract_dir, pending, cancelled)
+            extracted.update(pending)
             
-            main_rom = self._find_main_rom_file(rom_files, extract_dir)
+            companions = []
+            for member in pending:
+                if not is_sheet(member):
+                    continue
+                
+                data = self._member_path(extract_dir, member).read_bytes()
+                for reference in sheet_references(member, data):
+                    companion = match_member(reference, members)
+                    if not companion:
+                        return False
+                    references.append((reference, companion))
+                    if companion not in extracted and companion not in companions:
+                        companions.append(companion)
             
-            return str(main_rom)
+            pending = companions
         
-        except Exception as e:
-            if extract_dir.exists():
-                shutil.rmtree(extract_dir, ignore_errors=True)
-            raise Exception(f"Failed to extract ZIP {zip_path}: {e}")
+        for reference, companion in references:
+            self._link_reference(extract_dir, reference, companion)
+        
+        return True
+    
+    def _extract_zip(self, game_entry, platform_config): #vers 2
+        """Extract ZIP file and return path to main ROM"""
+        return self._extract_archive(game_entry, platform_config, 'zip')
     
     def _find_folder_main_rom(self, game_entry): #vers 1
         """Find the main ROM file in a folder structure"""
@@ -189,23 +380,9 @@ class RomLoader: #vers 3
         
         raise Exception(f"No ROM files found in folder: {folder_path}")
     
-    def _find_main_rom_file(self, rom_files, base_path): #vers 1
+    def _find_main_rom_file(self, rom_files, base_path): #vers 2
         """Find the main ROM file to load from a list"""
-        base_path = Path(base_path)
-        
-        priorities = [
-            lambda f: 'disk 1' in f.lower() or 'disk1' in f.lower(),
-            lambda f: 'disc 1' in f.lower() or 'disc1' in f.lower(),
-            lambda f: 'side a' in f.lower() or 'sidea' in f.lower(),
-            lambda f: 'disk' not in f.lower() and 'disc' not in f.lower(),
-        ]
-        
-        for priority_func in priorities:
-            matches = [f for f in rom_files if priority_func(f)]
-            if matches:
-                return base_path / matches[0]
-        
-        return base_path / rom_files[0]
+        return Path(base_path) / self._select_main_rom(rom_files)
     
     def _find_rom_files(self, directory, extensions): #vers 1
         """Find all ROM files in a directory"""
@@ -219,24 +396,22 @@ class RomLoader: #vers 3
         
         return rom_files
     
-    def _get_cache_path(self, archive_path): #vers 1
-        """Get cache directory path for an archive file"""
-        archive_path = Path(archive_path)
-        mtime = int(archive_path.stat().st_mtime)
-        cache_key = f"{archive_path.stem}_{mtime}"
+    def _get_cache_path(self, archive_path, platform_name=""): #vers 2
+        """Get cache directory path for an archive file
         
-        return self.cache_dir / cache_key
+        The directory name hashes the full path, size and mtime (or the
+        contents, with extraction_cache_dedupe) and the platform, so
+        same-named archives never share a directory.
+        """
+        return self.extraction_cache.entry_path(self.extraction_cache.key_for(archive_path, platform_name))
     
-    def _get_cached_extraction(self, archive_path): #vers 1
-        """Check if archive has been extracted to cache"""
-        cache_path = self._get_cache_path(archive_path)
-        
-        if cache_path.exists():
-            for item in cache_path.rglob('*'):
-                if item.is_file() and not item.name.startswith('.'):
-                    return str(item)
+    def _get_cached_extraction(self, archive_path, platform_name=""): #vers 4
+        """Check if archive has been extracted to cache
         
-        return None
+        Returns:
+            Main ROM recorded for the extraction, or None if not cached
+        """
+        return self.extraction_cache.lookup(self._get_cache_path(archive_path, platform_name).name)
     
     def _get_bios_path(self, platform_name): #vers 1
         """Get the path to BIOS files for a platform
@@ -249,8 +424,162 @@ class RomLoader: #vers 3
         """
         return self.bios_manager.get_bios_paths(platform_name)
     
-    def cleanup(self): #vers 1
-        """Clean up temporary extractions"""
+    def _init_ram_dir(self): #vers 1
+        """Create this process's RAM extraction directory
+        
+        Directories left by launchers that exited without cleanup are
+        removed.
+        
+        Returns:
+            Directory on tmpfs, or None if there is no usable /dev/shm
+        """
+        if not hasattr(os, 'getuid') or not RAM_TEMP_ROOT.is_dir() or not os.access(RAM_TEMP_ROOT, os.W_OK):
+            return None
+        
+        prefix = f"mel-{os.getuid()}-"
+        for item in RAM_TEMP_ROOT.glob(prefix + '*'):
+            pid = item.name[len(prefix):]
+            if not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                shutil.rmtree(item, ignore_errors=True)
+            except OSError:
+                pass
+        
+        ram_dir = RAM_TEMP_ROOT / f"{prefix}{os.getpid()}"
+        try:
+            ram_dir.mkdir(mode=0o700, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: RAM extraction disabled, cannot create {ram_dir}: {e}")
+            return None
+        return ram_dir
+    
+    def _link_reference(self, extract_dir, reference, member): #vers 1
+        """Make an extracted member reachable under the name a sheet uses
+        
+        A cue saying FILE "track2.bin" for a member stored as Track2.BIN
+        cannot be opened on a case-sensitive file system. A relative
+        symlink is created (a copy where links are not supported); nothing
+        is done if the name already resolves.
+        """
+        target = self._member_path(extract_dir, member)
+        link = self._member_path(extract_dir, reference)
+        if link.exists() or not target.exists():
+            return
+        
+        link.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.symlink(os.path.relpath(target, link.parent), link)
+        except OSError:
+            shutil.copy2(target, link)
+    
+    def _member_path(self, extract_dir, member): #vers 1
+        """Get where an archive member is extracted to
+        
+        Raises:
+            Exception: for absolute or parent-relative member names
+        """
+        relative = posixpath.normpath(member.replace('\\', '/'))
+        if relative.startswith(('/', '../')) or relative == '..' or ':' in relative.split('/')[0]:
+            raise Exception(f"Unsafe path in archive: {member}")
+        return Path(extract_dir) / relative
+    
+    def _open_archive(self, archive_path, archive_type): #vers 1
+        """Open a ZIP/7Z/RAR archive for reading"""
+        if archive_type == '7z':
+            return py7zr.SevenZipFile(archive_path, 'r')
+        if archive_type == 'rar':
+            return rarfile.RarFile(archive_path, 'r')
+        return zipfile.ZipFile(archive_path, 'r')
+    
+    def _release_ram(self, extract_dir): #vers 1
+        """Return the RAM reserved for a temporary extraction"""
+        self.ram_used -= self._ram_extractions.pop(extract_dir, 0)
+    
+    def _select_archive_rom(self, game_entry, platform_config, members): #vers 1
+        """Pick the archive member to launch
+        
+        Args:
+            game_entry: Game entry (its rom_files are archive member names)
+            platform_config: Platform configuration
+            members: Dict of lowercase member name -> member name
+            
+        Returns:
+            Member name, or None if no member is a ROM for the platform
+        """
+        rom_files = [match_member(name.replace('\\', '/'), members)
+                     for name in game_entry.get('rom_files', [])]
+        rom_files = [name for name in rom_files if name]
+        
+        if not rom_files:
+            extensions = platform_config.get('extensions', [])
+            rom_files = [name for name in members.values()
+                         if Path(name).suffix.lower() in extensions and not Path(name).name.startswith('.')]
+        
+        if not rom_files:
+            return None
+        
+        return self._select_main_rom(rom_files)
+    
+    def _select_main_rom(self, rom_files): #vers 1
+        """Pick the ROM to launch from a list of file names
+        
+        A playlist (.m3u) is preferred so every disc is reachable, then a
+        cue/gdi sheet over the track files it describes.
+        """
+        candidates = list(rom_files)
+        for ext in SHEET_EXTENSIONS:
+            sheets = [f for f in candidates if f.lower().endswith(ext)]
+            if sheets:
+                candidates = sheets
+                break
+        
+        priorities = [
+            lambda f: 'disk 1' in f.lower() or 'disk1' in f.lower(),
+            lambda f: 'disc 1' in f.lower() or 'disc1' in f.lower(),
+            lambda f: 'side a' in f.lower() or 'sidea' in f.lower(),
+            lambda f: 'disk' not in f.lower() and 'disc' not in f.lower(),
+        ]
+        
+        for priority_func in priorities:
+            matches = [f for f in candidates if priority_func(f)]
+            if matches:
+                return matches[0]
+        
+        return candidates[0]
+    
+    def _temp_extract_dir(self, archive_path, archive_type): #vers 1
+        """Pick the directory for a temporary extraction
+        
+        RAM is used when the archive's whole uncompressed size fits in
+        what is left of ram_extraction_mb and free on the tmpfs (an upper
+        bound - selective extraction usually writes less); anything
+        bigger goes to cache/extracted/temp on disk.
+        """
+        disk_dir = self.cache_dir / 'temp' / archive_path.stem
+        if not self.ram_dir:
+            return disk_dir
+        
+        try:
+            needed = self._archive_size(archive_path, archive_type)
+            self.ram_dir.mkdir(mode=0o700, exist_ok=True)
+            free = shutil.disk_usage(self.ram_dir).free
+        except Exception:
+            return disk_dir
+        
+        extract_dir = self.ram_dir / archive_path.stem
+        self._release_ram(extract_dir)
+        if self.ram_used + needed > self.ram_limit or needed >= free:
+            return disk_dir
+        
+        self._ram_extractions[extract_dir] = needed
+        self.ram_used += needed
+        return extract_dir
+    
+    def cleanup(self): #vers 2
+        """Clean up temporary extractions (on disk and in RAM)"""
         for temp_dir in self.temp_extractions:
             if temp_dir.exists():
                 try:
@@ -259,24 +588,50 @@ class RomLoader: #vers 3
                     print(f"Warning: Could not remove temp directory {temp_dir}: {e}")
         
         self.temp_extractions.clear()
+        self._ram_extractions.clear()
+        self.ram_used = 0
+        
+        if self.ram_dir:
+            try:
+                self.ram_dir.rmdir()
+            except OSError:
+                pass
     
-    def clear_cache(self): #vers 1
+    def clear_cache(self): #vers 2
         """Clear the entire extraction cache"""
-        if self.cache_dir.exists():
-            shutil.rmtree(self.cache_dir)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.extraction_cache.clear()
+        shutil.rmtree(self.cache_dir / 'temp', ignore_errors=True)
     
-    def get_cache_size(self): #vers 1
-        """Get total size of cache in bytes"""
-        total_size = 0
+    def get_cache_size(self): #vers 2
+        """Get total size of the extraction cache in bytes (temporary
+        extractions not included)"""
+        return self.extraction_cache.total_size
+    
+    def get_cached_rom(self, game_entry): #vers 2
+        """Get the extracted main ROM of a game if it is already cached
         
-        for item in self.cache_dir.rglob('*'):
-            if item.is_file():
-                total_size += item.stat().st_size
+        Meant for launching - a cached entry is pinned against eviction
+        for the rest of the session.
         
-        return total_size
+        Returns:
+            Path to the main ROM, or None (not cached, or not an archive
+            of a cache_extracted platform)
+        """
+        platform_config = self.platforms.get(game_entry['platform'])
+        archive_entry = self._cacheable_archive(game_entry, platform_config)
+        if not archive_entry:
+            return None
+        
+        try:
+            # Never hash an archive here - this runs on the GUI thread
+            cache_key = self.extraction_cache.key_for(archive_entry['path'], archive_entry['platform'],
+                                                      hash_missing=False)
+        except OSError:
+            return None
+        return self.extraction_cache.lookup(cache_key, pin=True) if cache_key else None
     
-    def load_rom(self, game_entry): #vers 2
+    @span("rom_load")
+    def load_rom(self, game_entry): #vers 3
         """Load a ROM file, extracting from archive if necessary"""
         game_type = game_entry['type']
         platform = game_entry['platform']
@@ -355,3 +710,28 @@ class RomLoader: #vers 3
             'platform': platform,
             'game_entry': game_entry
         }
+    
+    def prefetch(self, game_entry, cancelled=None): #vers 2
+        """Extract a game into the extraction cache ahead of launch
+        
+        Only archives of cache_extracted platforms are prefetched - other
+        platforms extract to temporary directories that launch would not
+        reuse. Safe to call from a worker thread.
+        
+        Args:
+            game_entry: Game entry dictionary
+            cancelled: Callable returning True to stop
+            
+        Returns:
+            Path to the cached main ROM, or None if the game is not
+            extracted ahead
+            
+        Raises:
+            ExtractionCancelled: if cancelled() became True
+        """
+        platform_config = self.platforms.get(game_entry['platform'])
+        archive_entry = self._cacheable_archive(game_entry, platform_config)
+        if not archive_entry:
+            return None
+        
+        return self._extract_archive(archive_entry, platform_config, archive_entry['type'], cancelled, pin=False)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/rom_prefetcher.py - Version: 1
+# X-Seti - December02 2025 - Multi-Emulator Launcher - ROM Prefetcher
+
+"""
+ROM Prefetcher - Extracts the highlighted game before Launch is pressed
+Archives of cache_extracted platforms are extracted into the extraction
+cache by RomLoader.prefetch on a single low-priority worker thread. Each
+new selection cancels work queued for games no longer wanted; an
+extraction already running stops at its next chunk.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal, Qt
+from apps.methods.rom_loader import ExtractionCancelled
+
+##Methods list -
+# __init__
+# cancel_all
+# prefetch
+# shutdown
+# _on_finished
+# _retire
+
+##class _PrefetchSignals -
+##class _PrefetchTask -
+##class RomPrefetcher -
+
+class _PrefetchSignals(QObject): #vers 1
+    """Signals for a prefetch task (QRunnable cannot emit by itself)"""
+
+    # key, platform, game_name, main ROM path ('' if nothing was extracted)
+    finished = pyqtSignal(str, str, str, str)
+
+
+class _PrefetchTask(QRunnable): #vers 1
+    """Extract one game into the cache off the GUI thread"""
+
+    def __init__(self, rom_loader, key, game_name, game_entry): #vers 1
+        super().__init__()
+        self.setAutoDelete(False)
+        self.rom_loader = rom_loader
+        self.key = key
+        self.game_name = game_name
+        self.game_entry = game_entry
+        self.cancelled = False
+        self.done = False
+        self.signals = _PrefetchSignals()
+
+    def run(self): #vers 1
+        """Extract the game and emit the result"""
+        if self.cancelled:
+            self.done = True
+            return
+
+        # Leave CPU time to the GUI and a running emulator
+        QThread.currentThread().setPriority(QThread.Priority.LowestPriority)
+
+        rom_path = None
+        try:
+            rom_path = self.rom_loader.prefetch(self.game_entry, cancelled=lambda: self.cancelled)
+        except ExtractionCancelled:
+            pass
+        except Exception as e:
+            from apps.utils.debug_logger import warning
+            warning(f"Prefetch failed for {self.game_name}: {e}", "PREFETCH")
+
+        self.done = True
+        if not self.cancelled:
+            self.signals.finished.emit(self.key, self.game_entry['platform'], self.game_name, rom_path or "")
+
+
+class RomPrefetcher(QObject): #vers 1
+    """Keeps the selected game (and optionally its neighbours) extracted"""
+
+    prefetched = pyqtSignal(str, str, str)   # platform, game_name, main ROM path
+
+    def __init__(self, rom_loader, parent=None): #vers 1
+        """Initialize ROM prefetcher
+
+        Args:
+            rom_loader: RomLoader whose extraction cache is filled
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.rom_loader = rom_loader
+        self.pool = QThreadPool(self)
+        # One extraction at a time - they compete for the same disk
+        self.pool.setMaxThreadCount(1)
+        self._pending = {}
+        # Cancelled tasks already running - referenced until they finish
+        self._retired = []
+
+    def prefetch(self, games): #vers 1
+        """Prefetch games in order, cancelling everything else
+
+        Args:
+            games: List of (game_name, game_entry), the selected game
+                   first; an empty list just cancels
+        """
+        wanted = {}
+        for game_name, game_entry in games:
+            wanted[f"{game_entry['platform']}\0{game_name}"] = (game_name, game_entry)
+
+        for key in list(self._pending):
+            if key not in wanted:
+                self._retire(self._pending.pop(key))
+
+        # Earlier games get higher queue priority
+        for priority, (key, (game_name, game_entry)) in enumerate(reversed(list(wanted.items()))):
+            if key in self._pending:
+                continue
+            task = _PrefetchTask(self.rom_loader, key, game_name, game_entry)
+            task.signals.finished.connect(self._on_finished, Qt.ConnectionType.QueuedConnection)
+            self._pending[key] = task
+            self.pool.start(task, priority)
+
+    def cancel_all(self): #vers 1
+        """Cancel every queued and running prefetch"""
+        for task in self._pending.values():
+            self._retire(task)
+        self._pending.clear()
+
+    def shutdown(self, timeout_ms=3000): #vers 1
+        """Cancel everything and wait for the running extraction to stop"""
+        self.cancel_all()
+        self.pool.waitForDone(timeout_ms)
+
+    def _retire(self, task): #vers 1
+        """Cancel a task - drop it from the queue or keep it until it stops"""
+        task.cancelled = True
+        if not self.pool.tryTake(task):
+            self._retired.append(task)
+        self._retired = [t for t in self._retired if not t.done]
+
+    def _on_finished(self, key, platform, game_name, rom_path): #vers 1
+        """Announce a finished prefetch (GUI thread)"""
+        task = self._pending.pop(key, None)
+        if task is None or task.cancelled or not rom_path:
+            return
+        self.prefetched.emit(platform, game_name, rom_path)
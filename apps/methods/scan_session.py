@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/scan_session.py - Version: 2
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Scan Session
+
+"""
+Scan Session
+Holds the result of one platform scan so it is computed once at startup
+and shared by GameScanner, RomLoader and CoreLauncher
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+from .platform_scanner import PlatformScanner
+
+##Methods list -
+# __init__
+# ensure_scanned
+# get_platform_info
+# is_scanned
+# refresh
+
+##class ScanSession -
+
+class ScanSession: #vers 2
+    """Single shared platform scan result
+
+    The platforms dict is created once and updated in place on refresh, so
+    every consumer holding a reference to it (GameScanner.platforms,
+    RomLoader.platforms, CoreLauncher.core_database) sees the new scan
+    without being rebuilt.
+    """
+
+    def __init__(self, platform_scanner: PlatformScanner): #vers 1
+        """Initialize scan session
+
+        Args:
+            platform_scanner: PlatformScanner used for the actual scans
+        """
+        self.platform_scanner = platform_scanner
+        self.platforms = {}
+        self._scanned = False
+
+    def is_scanned(self) -> bool: #vers 1
+        """Check if a scan has been run in this session"""
+        return self._scanned
+
+    def ensure_scanned(self) -> Dict[str, Dict]: #vers 2
+        """Return the platform scan, scanning only if nothing was scanned yet
+
+        Returns:
+            Shared platforms dict (platform name -> platform config)
+        """
+        if not self._scanned:
+            self.refresh(rescan_games=False)
+        return self.platforms
+
+    def refresh(self, roms_dir: Optional[Path] = None, full_rescan: bool = False,
+                rescan_games: bool = True) -> Dict[str, Dict]: #vers 2
+        """Rescan platforms - only for explicit user actions (Refresh / Scan ROMs)
+
+        Args:
+            roms_dir: New ROM directory (optional, keeps current one if None)
+            full_rescan: Ignore the scan index and rebuild from disk
+            rescan_games: Also rescan each platform's game entries the next
+                          time it is opened, instead of serving them from
+                          the database
+
+        Returns:
+            Shared platforms dict (platform name -> platform config)
+        """
+        if roms_dir is not None:
+            self.platform_scanner.roms_dir = Path(roms_dir)
+
+        discovered = self.platform_scanner.scan_platforms(full_rescan=full_rescan)
+        if rescan_games:
+            self.platform_scanner.db_manager.clear_games_stamps()
+
+        self.platforms.clear()
+        self.platforms.update(discovered)
+        # Keep the scanner pointing at the shared dict as well
+        self.platform_scanner.platforms = self.platforms
+        self._scanned = True
+
+        return self.platforms
+
+    def get_platform_info(self, platform_name: str) -> Optional[Dict]: #vers 1
+        """Get info for specific platform from the shared scan"""
+        return self.platforms.get(platform_name)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#this belongs in apps/methods/thumbnail_cache.py - Version: 1
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Thumbnail Cache
+
+"""
+Thumbnail Cache
+Persistent store of pre-scaled artwork icons under the cache directory, so
+list icons are read as small PNGs instead of re-decoding full box art.
+Layout: <cache>/thumbnails/<size>/<sha1 of source path + mtime + file size>.png
+A changed source file gets a new key, old files are simply never read again.
+"""
+
+import os
+import hashlib
+import shutil
+from pathlib import Path
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage
+
+##Methods list -
+# __init__
+# clear
+# get_image
+# thumbnail_path
+
+class ThumbnailCache: #vers 1
+    """One PNG per (source image, icon size)"""
+
+    def __init__(self, cache_dir=None): #vers 1
+        """Initialize thumbnail cache
+
+        Args:
+            cache_dir: Directory for thumbnails (defaults to ./cache/thumbnails)
+        """
+        if cache_dir is None:
+            cache_dir = Path.cwd() / "cache" / "thumbnails"
+
+        self.cache_dir = Path(cache_dir)
+
+    def thumbnail_path(self, source_path, size): #vers 1
+        """Get the cache file for a source image at an icon size
+
+        Args:
+            source_path: Full-size artwork file
+            size: Icon size in pixels
+
+        Returns:
+            Path of the thumbnail file, or None if the source cannot be stat'ed
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        key = f"{os.path.abspath(source_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / str(size) / f"{digest}.png"
+
+    def get_image(self, source_path, size): #vers 1
+        """Load a scaled icon image, creating its thumbnail on a miss
+
+        Safe to call from worker threads (QImage only, no QPixmap).
+
+        Args:
+            source_path: Full-size artwork file
+            size: Icon size in pixels
+
+        Returns:
+            QImage scaled to fit size x size (null QImage if unreadable)
+        """
+        thumb_path = self.thumbnail_path(source_path, size)
+
+        if thumb_path and thumb_path.exists():
+            image = QImage(str(thumb_path))
+            if not image.isNull():
+                return image
+
+        image = QImage(str(source_path))
+        if image.isNull():
+            return image
+
+        image = image.scaled(
+            size, size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
+        if thumb_path:
+            try:
+                thumb_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write next to the target and rename, so a reader never
+                # sees a half-written PNG
+                temp_path = thumb_path.with_name(f"{thumb_path.stem}.{os.getpid()}.{id(image)}.tmp")
+                if image.save(str(temp_path), "PNG"):
+                    os.replace(temp_path, thumb_path)
+                elif temp_path.exists():
+                    temp_path.unlink()
+            except OSError as e:
+                from apps.utils.debug_logger import error
+                error(f"Could not write thumbnail {thumb_path}: {e}", "ARTWORK")
+
+        return image
+
+    def clear(self): #vers 1
+        """Delete all cached thumbnails"""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
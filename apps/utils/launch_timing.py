@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+#this belongs in apps/utils/launch_timing.py - Version: 1
+# X-Seti - December02 2025 - Multi-Emulator Launcher - Launch Timing
+
+"""
+Launch Timing
+Span timings for the phases of a game launch (ROM load, core resolution,
+BIOS check, process spawn, window embed). While a launch is recording,
+code deep in the launch path only needs span("phase"); outside one a
+span costs one thread-local lookup. Finished launches go to
+the launch_stats table (rolling history) through the database manager.
+"""
+
+import math
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+##Methods list -
+# __init__
+# add
+# current_launch
+# finish
+# percentile
+# recording
+# span
+# summarize
+# _span
+
+##class LaunchTimer -
+
+# Thread -> LaunchTimer being recorded
+_active = threading.local()
+
+
+class LaunchTimer: #vers 1
+    """Phase durations of one launch"""
+
+    def __init__(self, platform: str = "", rom_name: str = "", db_manager=None): #vers 1
+        """Initialize launch timer
+
+        Args:
+            platform: Platform name
+            rom_name: ROM file name
+            db_manager: apps.database DatabaseManager for launch_stats
+                        (None keeps the record in memory only)
+        """
+        self.platform = platform
+        self.rom_name = rom_name
+        self.db_manager = db_manager
+        self.phases = {}
+        self.started = time.perf_counter()
+        self.record = None
+
+    @contextmanager
+    def recording(self): #vers 1
+        """Collect span() calls made on this thread during the block
+
+        Phases that end later (window embedding) are added with add().
+        """
+        previous = getattr(_active, 'timer', None)
+        _active.timer = self
+        try:
+            yield self
+        finally:
+            _active.timer = previous
+
+    @contextmanager
+    def _span(self, phase: str): #vers 1
+        """Time a block as phase (repeated phases add up)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def add(self, phase: str, seconds: float): #vers 1
+        """Add a measured duration to a phase"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds * 1000.0
+
+    def finish(self, success: bool = True) -> Dict: #vers 1
+        """End the launch and store its record (only the first call counts)
+
+        Returns:
+            Dict with platform, rom_name, success, total_ms and phases
+            (phase -> milliseconds)
+        """
+        if self.record is not None:
+            return self.record
+
+        self.record = {
+            'platform': self.platform,
+            'rom_name': self.rom_name,
+            'success': bool(success),
+            'total_ms': (time.perf_counter() - self.started) * 1000.0,
+            'phases': dict(self.phases)
+        }
+
+        if self.db_manager:
+            try:
+                self.db_manager.add_launch_stats(**self.record)
+            except Exception as e:
+                from apps.utils.debug_logger import error
+                error(f"Could not store launch timings: {e}", "LAUNCH")
+
+        return self.record
+
+
+def current_launch() -> Optional[LaunchTimer]: #vers 1
+    """Get the launch recording on this thread (None if none)"""
+    return getattr(_active, 'timer', None)
+
+
+@contextmanager
+def span(phase: str): #vers 1
+    """Time a block as a phase of the launch recording on this thread
+
+    Usable as a context manager or decorator; a no-op when no launch is
+    recording.
+    """
+    timer = getattr(_active, 'timer', None)
+    if timer is None:
+        yield
+        return
+
+    with timer._span(phase):
+        yield
+
+
+def percentile(values: List[float], fraction: float) -> float: #vers 1
+    """Nearest-rank percentile of a list (fraction 0.5 = median)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(records: List[Dict]) -> Dict[str, Dict[str, float]]: #vers 1
+    """Per-phase statistics of launch records
+
+    Args:
+        records: Records from LaunchTimer.finish or get_launch_stats
+
+    Returns:
+        Dict of phase -> {count, p50, p95, max} in milliseconds, with the
+        whole launch under 'total'
+    """
+    samples = {}
+    for record in records:
+        for phase, ms in record['phases'].items():
+            samples.setdefault(phase, []).append(ms)
+        samples.setdefault('total', []).append(record['total_ms'])
+
+    return {
+        phase: {
+            'count': len(values),
+            'p50': percentile(values, 0.50),
+            'p95': percentile(values, 0.95),
+            'max': max(values)
+        }
+        for phase, values in samples.items()
+    }
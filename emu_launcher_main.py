@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in root /emu_launcher_main.py - Version: 3
+#this belongs in root /emu_launcher_main.py - Version: 5
 # X-Seti - November28 2025 - Multi-Emulator Launcher - Main Entry Point
 
 """
@@ -25,8 +25,10 @@ from apps.methods.core_downloader import CoreDownloader
 from apps.methods.system_core_scanner import SystemCoreScanner
 from apps.methods.bios_manager import BiosManager
 from apps.methods.platform_scanner import PlatformScanner
+from apps.methods.scan_session import ScanSession
 from apps.methods.game_scanner import GameScanner
 from apps.methods.rom_loader import RomLoader
+from apps.gui.mel_settings_manager import MELSettingsManager
 from apps.core.core_launcher import CoreLauncher
 from apps.core.gamepad_config import GamepadConfig
 
@@ -47,10 +49,10 @@ except ImportError:
 # __init__
 # run
 
-class EmulatorLauncher: #vers 3
+class EmulatorLauncher: #vers 4
     """Main launcher class with dynamic core detection"""
     
-    def __init__(self): #vers 3
+    def __init__(self): #vers 4
         """Initialize launcher with dynamic detection systems"""
         self.base_dir = Path.cwd()
         self.app_settings = None
@@ -58,12 +60,13 @@ class EmulatorLauncher: #vers 3
         self.core_launcher = None
         self.gamepad_config = None
         self.platform_scanner = None
+        self.scan_session = None
         self.game_scanner = None
         self.rom_loader = None
         self.bios_manager = None
         self.system_core_scanner = None
         
-    def run(self): #vers 3
+    def run(self): #vers 5
         """Run the launcher with dynamic core detection"""
         print("=" * 60)
         print("Multi-Emulator Launcher v2.0 - Dynamic Detection System")
@@ -97,11 +100,14 @@ class EmulatorLauncher: #vers 3
         # Initialize scanners with dynamic detection
         self.platform_scanner = PlatformScanner(
             self.base_dir / "roms", 
-            self.base_dir / "cores"
+            self.base_dir / "cores",
+            config_dir=self.base_dir / "config"
         )
         
-        # Get dynamically detected platforms
-        dynamic_platforms = self.platform_scanner.scan_platforms()
+        # Get dynamically detected platforms - scanned once, shared by
+        # GameScanner, RomLoader, CoreLauncher and the GUI
+        self.scan_session = ScanSession(self.platform_scanner)
+        dynamic_platforms = self.scan_session.ensure_scanned()
         
         # Initialize game scanner and ROM loader with dynamic platforms
         config = {
@@ -109,8 +115,15 @@ class EmulatorLauncher: #vers 3
             'cache_path': str(self.base_dir / "cache")
         }
         
-        self.game_scanner = GameScanner(config, dynamic_platforms)
-        self.rom_loader = RomLoader(config, dynamic_platforms)
+        self.game_scanner = GameScanner(config, dynamic_platforms, self.platform_scanner.db_manager)
+        
+        # Extraction settings come from the MEL settings, as in the GUI
+        mel_settings = MELSettingsManager()
+        rom_loader_config = dict(config,
+                                 extraction_cache_mb=mel_settings.get_extraction_cache_mb(),
+                                 extraction_cache_dedupe=mel_settings.get_extraction_cache_dedupe(),
+                                 ram_extraction_mb=mel_settings.get_ram_extraction_mb())
+        self.rom_loader = RomLoader(rom_loader_config, dynamic_platforms)
         
         # Initialize CoreLauncher with dynamic database
         self.core_launcher = CoreLauncher(
@@ -147,6 +160,7 @@ class EmulatorLauncher: #vers 3
             gamepad_config=self.gamepad_config,
             game_config=self.game_config,
             platform_scanner=self.platform_scanner,
+            scan_session=self.scan_session,
             game_scanner=self.game_scanner,
             rom_loader=self.rom_loader,
             bios_manager=self.bios_manager,
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# Benchmark game launch latency headlessly against a fake emulator
+
+"""
+Launch Benchmark
+Replays N launches through RomLoader.load_rom and CoreLauncher.launch_game
+against a stub emulator executable, then reports p50/p95 per launch phase
+from the launch_stats table. No GUI, cores or emulators are needed - the
+ROM, core, emulator and database all live in a temporary directory.
+
+Usage:
+  python support/benchmark_launch.py [-n 50] [--warmup 3] [--archive]
+                                     [--rom-size 1024] [--mode core|standalone]
+                                     [--ram-mb 0]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.core.core_launcher import CoreLauncher
+from apps.database.database_manager import DatabaseManager
+from apps.methods.rom_loader import RomLoader
+from apps.utils.launch_timing import LaunchTimer, summarize
+
+PLATFORM = "NES"
+PHASE_ORDER = ["rom_load", "resolve", "bios_check", "spawn", "total"]
+
+
+def make_fixture(work_dir, rom_size_kb, archive, mode, ram_mb=0):
+    """Create the ROM, core, stub emulator and launcher objects"""
+    bin_dir = work_dir / "bin"
+    bin_dir.mkdir()
+    # Stub emulator - both RetroArch and the standalone NES emulator
+    for name in ("retroarch", "fceux"):
+        stub = bin_dir / name
+        stub.write_text("#!/bin/sh\nexit 0\n")
+        stub.chmod(0o755)
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+
+    base_dir = work_dir / "base"
+    (base_dir / "cores").mkdir(parents=True)
+    if mode == "core":
+        (base_dir / "cores" / "fceumm_libretro.so").write_bytes(b"")
+
+    roms_dir = base_dir / "roms" / PLATFORM
+    roms_dir.mkdir(parents=True)
+    rom_file = roms_dir / "Benchmark Game (USA).nes"
+    rom_file.write_bytes(os.urandom(rom_size_kb * 1024))
+
+    if archive:
+        archive_path = rom_file.with_suffix(".zip")
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.write(rom_file, rom_file.name)
+        rom_file.unlink()
+        game_entry = {"type": "zip", "path": str(archive_path), "platform": PLATFORM}
+    else:
+        game_entry = {"type": "file", "path": str(rom_file), "platform": PLATFORM}
+
+    platforms = {
+        PLATFORM: {
+            "cores": ["fceumm"],
+            "extensions": [".nes"],
+            "bios_required": False,
+            "cache_extracted": False
+        }
+    }
+
+    db_manager = DatabaseManager(str(work_dir / "benchmark.db"))
+    rom_loader = RomLoader({"rom_path": str(base_dir / "roms"),
+                            "cache_path": str(work_dir / "cache"),
+                            "ram_extraction_mb": ram_mb}, platforms)
+    launcher = CoreLauncher(base_dir, platforms, None, db_manager)
+
+    return db_manager, rom_loader, launcher, game_entry
+
+
+def run_launch(rom_loader, launcher, game_entry, db_manager):
+    """Run one timed launch and wait for the stub emulator to exit"""
+    timer = LaunchTimer(PLATFORM, Path(game_entry["path"]).name, db_manager)
+    with timer.recording():
+        rom_path = Path(rom_loader.load_rom(game_entry))
+        success = launcher.launch_game(PLATFORM, rom_path)
+    timer.finish(success)
+
+    if launcher.current_process:
+        launcher.current_process.wait()
+    rom_loader.cleanup()
+    return success
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless launch latency benchmark")
+    parser.add_argument("-n", "--launches", type=int, default=50, help="Timed launches (default 50)")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed launches first (default 3)")
+    parser.add_argument("--archive", action="store_true", help="Launch from a ZIP (times extraction)")
+    parser.add_argument("--rom-size", type=int, default=1024, help="ROM size in KB (default 1024)")
+    parser.add_argument("--mode", choices=["core", "standalone"], default="core",
+                        help="Local core + RetroArch, or standalone emulator (default core)")
+    parser.add_argument("--ram-mb", type=int, default=0,
+                        help="RAM budget for --archive extraction in MB (default 0 = disk)")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary directory")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="mel_bench_"))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db_manager, rom_loader, launcher, game_entry = make_fixture(
+                work_dir, args.rom_size, args.archive, args.mode, args.ram_mb)
+
+            for _ in range(args.warmup):
+                run_launch(rom_loader, launcher, game_entry, None)
+
+            failures = 0
+            for _ in range(args.launches):
+                if not run_launch(rom_loader, launcher, game_entry, db_manager):
+                    failures += 1
+
+        records = db_manager.get_launch_stats(limit=args.launches)
+        summary = summarize(records)
+
+        print("Launch benchmark")
+        print("=" * 60)
+        print(f"Launches: {args.launches} (+{args.warmup} warmup), failures: {failures}")
+        target = f", extracted to {'RAM' if args.ram_mb else 'disk'}" if args.archive else ""
+        print(f"Mode: {args.mode}, ROM: {args.rom_size} KB{' in ZIP' if args.archive else ''}{target}")
+        print()
+        print(f"{'Phase':<14}{'count':>8}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}")
+        phases = [p for p in PHASE_ORDER if p in summary] + sorted(set(summary) - set(PHASE_ORDER))
+        for phase in phases:
+            stats = summary[phase]
+            print(f"{phase:<14}{stats['count']:>8}{stats['p50']:>12.2f}{stats['p95']:>12.2f}{stats['max']:>12.2f}")
+
+        db_manager.close()
+        return 0 if failures == 0 else 1
+    finally:
+        if args.keep:
+            print(f"\nKept {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
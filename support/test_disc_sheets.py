@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# Test the cue/gdi/m3u sheet parsers used for partial archive extraction
+
+"""
+Disc Sheet Test
+Checks the file names read from cue, gdi and m3u sheets, how they are
+resolved against the sheet's directory and matched to archive members,
+and that RomLoader extracts a companion under the name its sheet uses.
+
+Usage:
+  python support/test_disc_sheets.py
+"""
+
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.methods.disc_sheets import (is_sheet, match_member, parse_cue, parse_gdi,
+                                      parse_m3u, sheet_references)
+from apps.methods.rom_loader import RomLoader
+
+
+def test_parse_cue():
+    """Quoted and bare FILE names, other commands skipped"""
+    text = ('REM GENRE Action\r\n'
+            'FILE "Game (Track 1).bin" BINARY\r\n'
+            '  TRACK 01 MODE2/2352\r\n'
+            '    INDEX 01 00:00:00\r\n'
+            'file track2.bin BINARY\r\n'
+            'FILE "Game (Track 3).wav" WAVE\r\n')
+    assert parse_cue(text) == ['Game (Track 1).bin', 'track2.bin', 'Game (Track 3).wav']
+
+
+def test_parse_gdi():
+    """Track file is the fifth field, quoted when it holds spaces"""
+    text = ('3\n'
+            '1 0 4 2352 track01.bin 0\n'
+            '2 756 0 2352 "track 02.raw" 0\n'
+            '3 45000 4 2352 track03.bin 0\n')
+    assert parse_gdi(text) == ['track01.bin', 'track 02.raw', 'track03.bin']
+
+
+def test_parse_m3u():
+    """Comments and blank lines are not entries"""
+    text = '#EXTM3U\n\nDisc 1/Game.cue\n  Disc 2/Game.cue  \n# Disc 3/Game.cue\n'
+    assert parse_m3u(text) == ['Disc 1/Game.cue', 'Disc 2/Game.cue']
+
+
+def test_sheet_references():
+    """References resolve against the sheet directory, once each"""
+    data = b'\xef\xbb\xbfFILE "track.bin" BINARY\nFILE "..\\shared\\audio.bin" BINARY\nFILE "track.bin" BINARY\n'
+    assert sheet_references('Disc 1/Game.cue', data) == ['Disc 1/track.bin', 'shared/audio.bin']
+    assert sheet_references('Game.m3u', b'Disc 2\\Game.cue\n') == ['Disc 2/Game.cue']
+    assert sheet_references('Game.bin', b'FILE "x.bin" BINARY') == []
+    assert is_sheet('GAME.CUE') and is_sheet('disc.gdi') and not is_sheet('track.bin')
+
+
+def test_match_member():
+    """Case-insensitive match, then a unique bare file name match"""
+    members = {name.lower(): name for name in
+               ['Game.cue', 'Track2.BIN', 'tracks/audio.bin', 'a/dup.bin', 'b/dup.bin']}
+    assert match_member('track2.bin', members) == 'Track2.BIN'
+    assert match_member('audio.bin', members) == 'tracks/audio.bin'
+    assert match_member('dup.bin', members) is None
+    assert match_member('missing.bin', members) is None
+
+
+def test_companion_sheet_name():
+    """A companion stored as Track2.BIN opens as the cue's track2.bin"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        archive = work_dir / "Game.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("Game.cue", 'FILE "track2.bin" BINARY\n')
+            zf.writestr("Track2.BIN", b"\0" * 2352)
+            zf.writestr("readme.txt", b"not a rom")
+
+        platforms = {'PS1': {'extensions': ['.cue', '.bin'], 'cache_extracted': True}}
+        rom_loader = RomLoader({'cache_path': str(work_dir / "cache")}, platforms)
+        rom_path = rom_loader.load_rom({'type': 'zip', 'path': str(archive), 'platform': 'PS1',
+                                        'rom_files': ['Game.cue', 'Track2.BIN']})
+
+        extract_dir = Path(rom_path).parent
+        assert Path(rom_path).name == "Game.cue", rom_path
+        assert (extract_dir / "track2.bin").read_bytes() == b"\0" * 2352
+        assert not (extract_dir / "readme.txt").exists()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_parse_cue()
+    test_parse_gdi()
+    test_parse_m3u()
+    test_sheet_references()
+    test_match_member()
+    test_companion_sheet_name()
+    print("Disc sheet tests passed")
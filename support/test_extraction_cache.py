@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# Test least-recently-used eviction of the extraction cache
+
+"""
+Extraction Cache Test
+Fills an ExtractionCache with small fake extractions and checks which
+entries its size budget evicts: least recently launched first, never a
+pinned entry, and room is made for a reservation before extracting.
+
+Usage:
+  python support/test_extraction_cache.py
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.methods.extraction_cache import ExtractionCache
+
+ENTRY_SIZE = 1000
+
+
+def add_entry(cache, work_dir, name, pin=False):
+    """Extract a fake archive into the cache
+
+    Returns:
+        Cache key of the entry
+    """
+    archive = work_dir / f"{name}.zip"
+    archive.write_bytes(name.encode())
+    cache_key = cache.key_for(archive, "Amiga")
+    entry_dir = cache.prepare(cache_key, ENTRY_SIZE)
+    (entry_dir / f"{name}.adf").write_bytes(b"\0" * ENTRY_SIZE)
+    cache.add(cache_key, archive, entry_dir / f"{name}.adf", pin=pin)
+    return cache_key
+
+
+def open_cache(work_dir, budget_bytes):
+    """Open the cache of a test directory with a size budget"""
+    return ExtractionCache(work_dir / "extracted", work_dir / "extracted.db", budget_bytes)
+
+
+def test_lru_eviction():
+    """The least recently launched entry goes first"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        cache = open_cache(work_dir, 3 * ENTRY_SIZE)
+        first = add_entry(cache, work_dir, "first")
+        second = add_entry(cache, work_dir, "second")
+        third = add_entry(cache, work_dir, "third")
+        assert cache.total_size == 3 * ENTRY_SIZE
+
+        # Launching first makes second the oldest
+        assert cache.lookup(first)
+        fourth = add_entry(cache, work_dir, "fourth")
+
+        assert cache.lookup(second) is None
+        assert not cache.entry_path(second).exists()
+        for cache_key in (first, third, fourth):
+            assert cache.lookup(cache_key), cache_key
+        assert cache.total_size == 3 * ENTRY_SIZE
+        cache.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_pinned_not_evicted():
+    """Entries launched this session stay, even over budget"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        cache = open_cache(work_dir, 2 * ENTRY_SIZE)
+        first = add_entry(cache, work_dir, "first", pin=True)
+        second = add_entry(cache, work_dir, "second", pin=True)
+        third = add_entry(cache, work_dir, "third")
+
+        assert cache.lookup(first) and cache.lookup(second) and cache.lookup(third)
+        assert cache.total_size == 3 * ENTRY_SIZE
+        cache.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_reservation_evicts_first():
+    """prepare makes room for the uncompressed size before extracting"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        cache = open_cache(work_dir, 2 * ENTRY_SIZE)
+        first = add_entry(cache, work_dir, "first")
+        second = add_entry(cache, work_dir, "second")
+
+        archive = work_dir / "big.zip"
+        archive.write_bytes(b"big")
+        cache_key = cache.key_for(archive, "Amiga")
+        cache.prepare(cache_key, ENTRY_SIZE)
+        assert cache.lookup(first) is None
+        assert cache.lookup(second)
+
+        # A failed extraction gives its reservation back
+        cache.release(cache_key)
+        assert cache.evict() == 0
+        cache.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_reopen_keeps_order():
+    """Sizes and access order survive a restart"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        cache = open_cache(work_dir, 2 * ENTRY_SIZE)
+        first = add_entry(cache, work_dir, "first")
+        second = add_entry(cache, work_dir, "second")
+        assert cache.lookup(first)
+        cache.close()
+
+        cache = open_cache(work_dir, 2 * ENTRY_SIZE)
+        assert cache.total_size == 2 * ENTRY_SIZE
+        add_entry(cache, work_dir, "third")
+        assert cache.lookup(second) is None
+        assert cache.lookup(first)
+        cache.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_pinned_not_evicted()
+    test_reservation_evicts_first()
+    test_reopen_keeps_order()
+    print("Extraction cache tests passed")
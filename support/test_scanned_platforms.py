@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Test that platforms found by a ROM folder scan reach the extraction cache
+
+"""
+Scanned Platform Test
+Builds a ROM folder in a temporary directory, scans it with PlatformScanner
+and hands the resulting platform dicts to RomLoader, the way the launcher
+does. Archive handling (zip_support / cache_extracted) must come through
+from config/platforms.json, otherwise prefetching and the extraction cache
+never run.
+
+Usage:
+  python support/test_scanned_platforms.py
+"""
+
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.database.database_manager import DatabaseManager
+from apps.methods.platform_scanner import PlatformScanner
+from apps.methods.rom_loader import RomLoader
+
+
+def scan_fixture(work_dir):
+    """Scan a ROM folder holding one zipped Amiga disk
+
+    Returns:
+        (platforms dict from scan_platforms, game entry for the archive)
+    """
+    roms_dir = work_dir / "roms"
+    (roms_dir / "Amiga").mkdir(parents=True)
+    archive = roms_dir / "Amiga" / "Test Game.zip"
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr("Test Game.adf", b"\0" * 4096)
+        zf.writestr("readme.txt", b"not a rom")
+
+    db_manager = DatabaseManager(str(work_dir / "mel_database.db"))
+    scanner = PlatformScanner(roms_dir, work_dir / "cores", db_manager, project_root / "config")
+    with contextlib.redirect_stdout(io.StringIO()):
+        platforms = scanner.scan_platforms()
+
+    game_entry = {
+        'type': 'zip',
+        'path': str(archive),
+        'platform': 'Amiga',
+        'rom_files': ['Test Game.adf']
+    }
+    return platforms, game_entry
+
+
+def test_scanned_platform_keys():
+    """Scanned platforms carry the archive keys of platforms.json"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        platforms, _ = scan_fixture(work_dir)
+        amiga = platforms["Amiga"]
+        assert amiga.get("zip_support") == "extract", amiga
+        assert amiga.get("cache_extracted") is True, amiga
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_scanned_platform_prefetch():
+    """Prefetch extracts into the cache and launch finds it there"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        platforms, game_entry = scan_fixture(work_dir)
+        rom_loader = RomLoader({'rom_path': str(work_dir / "roms"),
+                                'cache_path': str(work_dir / "cache")}, platforms)
+
+        assert rom_loader.get_cached_rom(game_entry) is None
+        rom_path = rom_loader.prefetch(game_entry)
+        assert rom_path and Path(rom_path).name == "Test Game.adf", rom_path
+        assert rom_loader.get_cached_rom(game_entry) == rom_path
+        assert rom_loader.get_cache_size() == 4096
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_scanned_platform_keys()
+    test_scanned_platform_prefetch()
+    print("Scanned platform tests passed")
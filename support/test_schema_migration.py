@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Test that an old library database migrates to the current schema
+
+"""
+Schema Migration Test
+Builds a version 0 mel_database.db the way launchers before versioned
+schemas left it - baseline tables, no user_version, and duplicate games
+and BIOS rows that the unique keys of library_unique_keys forbid - then
+opens it with DatabaseManager and checks the migrated result.
+
+Usage:
+  python support/test_schema_migration.py
+"""
+
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.database.database_manager import DatabaseManager
+from apps.database.schema import LIBRARY_MIGRATIONS, get_schema_version, library_baseline
+
+
+def make_v0_database(db_path):
+    """Create a version 0 library database holding duplicate rows"""
+    conn = sqlite3.connect(str(db_path))
+    library_baseline(conn.cursor())
+    conn.execute("INSERT INTO platforms (id, name) VALUES (1, 'Amiga')")
+    conn.executemany("INSERT INTO games (id, platform_id, name, file_path) VALUES (?, 1, ?, ?)", [
+        (1, 'Old Name', '/roms/Amiga/Game.adf'),
+        (2, 'Other Game', '/roms/Amiga/Other.adf'),
+        (3, 'New Name', '/roms/Amiga/Game.adf'),
+    ])
+    conn.executemany("INSERT INTO bios_files (id, platform_id, filename, file_path) VALUES (?, ?, ?, ?)", [
+        (1, 1, 'kick13.rom', '/bios/old/kick13.rom'),
+        (2, 1, 'kick13.rom', '/bios/kick13.rom'),
+        # Digest cache rows (no platform) are outside the unique key
+        (3, None, 'kick13.rom', '/bios/a/kick13.rom'),
+        (4, None, 'kick13.rom', '/bios/b/kick13.rom'),
+    ])
+    conn.commit()
+    assert get_schema_version(conn) == 0
+    conn.close()
+
+
+def test_v0_migration():
+    """Duplicates are dropped (newest kept) and the schema is current"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        db_path = work_dir / "mel_database.db"
+        make_v0_database(db_path)
+
+        db_manager = DatabaseManager(str(db_path))
+        db_manager.close()
+
+        conn = sqlite3.connect(str(db_path))
+        assert get_schema_version(conn) == len(LIBRARY_MIGRATIONS)
+
+        games = conn.execute("SELECT id, name FROM games ORDER BY id").fetchall()
+        assert games == [(2, 'Other Game'), (3, 'New Name')], games
+
+        bios = conn.execute("SELECT id FROM bios_files ORDER BY id").fetchall()
+        assert bios == [(2,), (3,), (4,)], bios
+
+        try:
+            conn.execute("INSERT INTO games (platform_id, name, file_path) "
+                         "VALUES (1, 'Again', '/roms/Amiga/Game.adf')")
+        except sqlite3.IntegrityError:
+            pass
+        else:
+            raise AssertionError("games.file_path is not unique after migrating")
+
+        # Games already in the old database are searchable
+        found = conn.execute("SELECT rowid FROM games_search WHERE games_search MATCH 'other'").fetchall()
+        assert found == [(2,)], found
+        conn.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_migration_reopen():
+    """Opening a migrated database again changes nothing"""
+    work_dir = Path(tempfile.mkdtemp(prefix="mel-test-"))
+    try:
+        db_path = work_dir / "mel_database.db"
+        make_v0_database(db_path)
+        DatabaseManager(str(db_path)).close()
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("INSERT INTO games (platform_id, name, file_path) VALUES (1, 'Third', '/roms/Amiga/Third.adf')")
+        conn.commit()
+        conn.close()
+
+        DatabaseManager(str(db_path)).close()
+
+        conn = sqlite3.connect(str(db_path))
+        assert get_schema_version(conn) == len(LIBRARY_MIGRATIONS)
+        assert conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 3
+        conn.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_v0_migration()
+    test_migration_reopen()
+    print("Schema migration tests passed")